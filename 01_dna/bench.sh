@@ -0,0 +1,12 @@
+#!/usr/bin/env bash
+
+# Benchmark the solutions against count_stream.py on random DNA of
+# 1 MB, 100 MB and 10 GB. The solutions read the whole file into memory,
+# so the 10 GB run needs that much free RAM (and patience).
+
+PRGS=$(find . -name solution\* | sort | xargs echo | sed "s/ /,/g")
+for SIZE in 1000000 100000000 10000000000; do
+    FILE="dna_${SIZE}.txt"
+    [[ -f "$FILE" ]] || tr -dc ACGT < /dev/urandom | head -c "$SIZE" > "$FILE"
+    hyperfine -i --runs 3 -L prg "$PRGS,./count_stream.py" "{prg} $FILE"
+done
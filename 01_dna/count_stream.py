@@ -0,0 +1,203 @@
+#!/usr/bin/env python3
+"""
+Author : bcheng <bcheng@localhost>
+Date   : 2026-10-18
+Purpose: Count bases in large files
+"""
+
+import argparse
+import io
+import os
+import tempfile
+from functools import partial
+from multiprocessing import Pool
+from typing import Iterable, Iterator, List, NamedTuple, Optional, Tuple
+import numpy as np
+import fastx
+
+BASES = 'ACGTN'
+HEADER = ['file', 'A', 'C', 'G', 'T', 'N', 'other']
+
+# Column of each byte value: its base in either case, then whitespace,
+# then anything else, so a histogram needs only seven bins
+COLUMNS = bytes(
+    BASES.index(chr(byte).upper()) if chr(byte).upper() in BASES else
+    len(BASES) if byte in fastx.WHITESPACE else len(BASES) + 1
+    for byte in range(256))
+
+
+class Args(NamedTuple):
+    """ Command-line arguments """
+    files: List[str]
+    records: bool
+    workers: int
+
+
+class Counts(NamedTuple):
+    """ Base counts """
+    A: int
+    C: int
+    G: int
+    T: int
+    N: int
+    other: int
+
+
+# --------------------------------------------------
+def get_args() -> Args:
+    """ Get command-line arguments """
+
+    parser = argparse.ArgumentParser(
+        description='Count bases in large files',
+        formatter_class=argparse.ArgumentDefaultsHelpFormatter)
+
+    parser.add_argument('file',
+                        metavar='FILE',
+                        help='Input DNA or FASTA file(s)',
+                        type=str,
+                        nargs='+')
+
+    parser.add_argument('-r',
+                        '--records',
+                        help='Count each FASTA record separately',
+                        action='store_true')
+
+    parser.add_argument('-w',
+                        '--workers',
+                        help='Number of worker processes',
+                        metavar='int',
+                        type=int,
+                        default=1)
+
+    args = parser.parse_args()
+
+    # Files are opened by the workers, not all at once here
+    if bad_files := [file for file in args.file if not os.path.isfile(file)]:
+        parser.error(f'Invalid file: {", ".join(bad_files)}')
+
+    if args.workers < 1:
+        parser.error(f'--workers "{args.workers}" must be > 0')
+
+    return Args(args.file, args.records, args.workers)
+
+
+# --------------------------------------------------
+def main() -> None:
+    """ Print a table of base counts """
+
+    args = get_args()
+
+    print('\t'.join(HEADER[:1] + ['id'] * args.records + HEADER[1:]))
+    for file, rows in count_all(args.files, args.records, args.workers):
+        for rec_id, counts in rows:
+            cols = [file, rec_id, *counts] if args.records else [file, *counts]
+            print('\t'.join(map(str, cols)))
+
+
+# --------------------------------------------------
+def count_all(files: List[str], records: bool,
+              workers: int) -> Iterator[Tuple[str, List[Tuple[str, Counts]]]]:
+    """ Count files in input order, fanning out to worker processes """
+
+    count = partial(count_path, records=records)
+    if workers == 1:
+        yield from zip(files, map(count, files))
+        return
+
+    with Pool(workers) as pool:
+        yield from zip(files, pool.imap(count, files))
+
+
+# --------------------------------------------------
+def count_path(filename: str, records: bool) -> List[Tuple[str, Counts]]:
+    """ Count a file as a whole or, for FASTA, optionally by record """
+
+    with open(filename, 'rb') as fh:
+        if records and fh.peek(1)[:1] == b'>':
+            return list(count_records(fh))
+        return [('', count_file(fh))]
+
+
+# --------------------------------------------------
+def count_file(fh: io.BufferedReader) -> Counts:
+    """ Count bases in a raw sequence or FASTA file """
+
+    # Headers are split from the sequence in the blocks, never per record
+    if fh.peek(1)[:1] == b'>':
+        return tally(
+            histogram(data
+                      for is_header, data in fastx.scan_fasta(fastx.blocks(fh))
+                      if not is_header))
+
+    return tally(histogram(fastx.blocks(fh)))
+
+
+# --------------------------------------------------
+def count_records(fh: io.BufferedReader) -> Iterator[Tuple[str, Counts]]:
+    """ Count bases in each FASTA record, starting over at each header """
+
+    header: Optional[bytes] = None
+    hist = histogram([])
+
+    # Any text before the first header is dropped
+    for is_header, data in fastx.scan_fasta(fastx.blocks(fh)):
+        if is_header:
+            if header is not None:
+                yield fastx.first_word(header.decode()), tally(hist)
+            header, hist = data, histogram([])
+        elif header is not None:
+            hist += histogram([data])
+
+    if header is not None:
+        yield fastx.first_word(header.decode()), tally(hist)
+
+
+# --------------------------------------------------
+def histogram(chunks: Iterable[bytes]) -> np.ndarray:
+    """ Count the bytes in each column over chunks of bytes """
+
+    hist = np.zeros(len(BASES) + 2, dtype=np.int64)
+    for chunk in chunks:
+        # Sub-blocks keep bincount's temporary index array small
+        for i in range(0, len(chunk), fastx.BLOCK_SIZE):
+            codes = chunk[i:i + fastx.BLOCK_SIZE].translate(COLUMNS)
+            hist += np.bincount(np.frombuffer(codes, dtype=np.uint8),
+                                minlength=len(hist))
+
+    return hist
+
+
+# --------------------------------------------------
+def tally(hist: np.ndarray) -> Counts:
+    """ Base counts from a column histogram, leaving out whitespace """
+
+    a, c, g, t, n, _, other = hist.tolist()
+    return Counts(a, c, g, t, n, other)
+
+
+# --------------------------------------------------
+def test_tally() -> None:
+    """ Test tally """
+
+    assert tally(histogram([])) == Counts(0, 0, 0, 0, 0, 0)
+    assert tally(histogram([b'ACCGGGTTTT'])) == Counts(1, 2, 3, 4, 0, 0)
+    assert tally(histogram([b'aaccggttAAAcgt\n'])) == Counts(5, 3, 3, 3, 0, 0)
+    assert tally(histogram([b'AC\r\n', b'nN-X'])) == Counts(1, 1, 0, 0, 2, 2)
+
+
+# --------------------------------------------------
+def test_count_file() -> None:
+    """ Test count_file """
+
+    for data, expected in [(b'ACGT\nNNX\n', Counts(1, 1, 1, 1, 2, 1)),
+                           (b'>A x\nAC\n>B\nGTn\n', Counts(1, 1, 1, 1, 1, 0))]:
+        with tempfile.NamedTemporaryFile() as tmp:
+            tmp.write(data)
+            tmp.flush()
+            with open(tmp.name, 'rb') as fh:
+                assert count_file(fh) == expected
+
+
+# --------------------------------------------------
+if __name__ == '__main__':
+    main()
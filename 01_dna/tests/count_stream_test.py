@@ -0,0 +1,108 @@
+""" Tests for count_stream.py """
+
+import os
+import platform
+from subprocess import getstatusoutput
+
+PRG = './count_stream.py'
+RUN = f'python {PRG}' if platform.system() == 'Windows' else PRG
+INPUTS = [f'./tests/inputs/input{i}.txt' for i in range(1, 5)]
+FASTA = './tests/inputs/input5.fa'
+HEADER = 'file\tA\tC\tG\tT\tN\tother'
+
+
+# --------------------------------------------------
+def test_exists() -> None:
+    """ Program exists """
+
+    assert os.path.isfile(PRG)
+
+
+# --------------------------------------------------
+def test_usage() -> None:
+    """ Prints usage """
+
+    for arg in ['-h', '--help']:
+        rv, out = getstatusoutput(f'{RUN} {arg}')
+        assert rv == 0
+        assert out.lower().startswith('usage:')
+
+
+# --------------------------------------------------
+def test_dies_no_args() -> None:
+    """ Dies with no arguments """
+
+    rv, out = getstatusoutput(RUN)
+    assert rv != 0
+    assert out.lower().startswith('usage:')
+
+
+# --------------------------------------------------
+def test_files() -> None:
+    """ Counts several files """
+
+    rv, out = getstatusoutput(f'{RUN} {" ".join(INPUTS)}')
+    assert rv == 0
+    assert out.splitlines() == [
+        HEADER,
+        f'{INPUTS[0]}\t1\t2\t3\t4\t0\t0',
+        f'{INPUTS[1]}\t20\t12\t17\t21\t0\t0',
+        f'{INPUTS[2]}\t196\t231\t237\t246\t0\t0',
+        f'{INPUTS[3]}\t5\t3\t3\t3\t0\t0',
+    ]
+
+
+# --------------------------------------------------
+def test_fasta() -> None:
+    """ Skips FASTA headers """
+
+    rv, out = getstatusoutput(f'{RUN} {FASTA}')
+    assert rv == 0
+    assert out.splitlines() == [HEADER, f'{FASTA}\t4\t3\t3\t4\t2\t1']
+
+
+# --------------------------------------------------
+def test_records() -> None:
+    """ Counts each FASTA record """
+
+    rv, out = getstatusoutput(f'{RUN} --records {FASTA}')
+    assert rv == 0
+    assert out.splitlines() == [
+        'file\tid\tA\tC\tG\tT\tN\tother',
+        f'{FASTA}\tSeq1\t1\t2\t3\t4\t0\t0',
+        f'{FASTA}\tSeq2\t3\t1\t0\t0\t2\t1',
+        f'{FASTA}\tSeq3\t0\t0\t0\t0\t0\t0',
+    ]
+
+
+# --------------------------------------------------
+def test_bad_file() -> None:
+    """ Dies on a missing file """
+
+    bad = 'tests/inputs/nonexistent.fa'
+    rv, out = getstatusoutput(f'{RUN} {INPUTS[0]} {bad}')
+    assert rv != 0
+    assert out.lower().startswith('usage:')
+    assert f'Invalid file: {bad}' in out
+
+
+# --------------------------------------------------
+def test_bad_workers() -> None:
+    """ Dies on bad --workers """
+
+    rv, out = getstatusoutput(f'{RUN} -w 0 {INPUTS[0]}')
+    assert rv != 0
+    assert out.lower().startswith('usage:')
+    assert '--workers "0" must be > 0' in out
+
+
+# --------------------------------------------------
+def test_workers() -> None:
+    """ Workers keep the input order """
+
+    files = ' '.join(INPUTS + [FASTA] * 3)
+    for flag in ['', '-r']:
+        _, expected = getstatusoutput(f'{RUN} {flag} {files}')
+        rv, out = getstatusoutput(f'{RUN} {flag} --workers 3 {files}')
+        assert rv == 0
+        assert out == expected
@@ -0,0 +1 @@
+../05_gc/genseq.py
\ No newline at end of file
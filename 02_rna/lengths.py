@@ -6,15 +6,22 @@ Purpose: Report DNA length statistics
 """
 
 import argparse
-from typing import NamedTuple, TextIO
+import io
+import math
+from collections import Counter
+from multiprocessing import Pool
+from typing import BinaryIO, Iterator, NamedTuple, TextIO, Tuple
 import os
 from pathlib import Path
 
+BLOCK_SIZE = 1 << 20
+
 
 class Args(NamedTuple):
     """ Command-line arguments """
     file: list[TextIO]
     out_dir: str
+    workers: int
 
 
 # --------------------------------------------------
@@ -26,7 +33,7 @@ def get_args() -> Args:
         formatter_class=argparse.ArgumentDefaultsHelpFormatter)
 
     parser.add_argument('file',
-                        help='Input DNA file(s)',
+                        help='Input DNA or FASTA file(s)',
                         metavar='FILE',
                         nargs='+',
                         type=argparse.FileType('rt'))
@@ -38,9 +45,19 @@ def get_args() -> Args:
                         type=str,
                         default='out')
 
+    parser.add_argument('-w',
+                        '--workers',
+                        help='Number of worker processes',
+                        metavar='int',
+                        type=int,
+                        default=1)
+
     args = parser.parse_args()
 
-    return Args(file=args.file, out_dir=args.out_dir)
+    if args.workers < 1:
+        parser.error(f'--workers "{args.workers}" must be > 0')
+
+    return Args(file=args.file, out_dir=args.out_dir, workers=args.workers)
 
 
 # --------------------------------------------------
@@ -52,64 +69,188 @@ def main() -> None:
     if not os.path.isdir(args.out_dir):
         os.makedirs(args.out_dir)
 
-    #? Assumption that each file line only has one sequence
-    num_seqs, num_files = 0, 0
-    combined_max, combined_min, combined_avg = None, None, 0
-
+    # Each worker reopens its file in binary
+    filenames = [file.name for file in args.file]
     for file in args.file:
-        num_files += 1
+        file.close()
+
+    # Per-file histograms are merged in input order
+    if args.workers > 1:
+        with Pool(args.workers) as pool:
+            hists = pool.map(length_hist, filenames)
+    else:
+        hists = list(map(length_hist, filenames))
+
+    combined: Counter[int] = Counter()
+    for filename, hist in zip(filenames, hists):
+        combined.update(hist)
+        with open(Path(args.out_dir) / Path(filename).name,
+                  'w',
+                  encoding='utf-8') as out_file:
+            # Empty files get an empty report
+            if hist:
+                out_file.write(report(hist))
+
+    with open(Path(args.out_dir) / 'combined_data.txt', 'w',
+              encoding='utf-8') as f:
+        f.write(report(combined))
+
+    # Formatting output message
+    num_seqs, num_files = sum(combined.values()), len(filenames)
+    print(f'Calculated length statistics for {num_seqs} '
+          f'sequence{"" if num_seqs == 1 else "s"} in {num_files} '
+          f'file{"" if num_files == 1 else "s"} to directory '
+          f'"{args.out_dir}".')
 
-        # Initialize file statistics variables
-        num_local_seqs, len_max, len_min, len_avg = 0, None, None, 0
 
-        lines = file.readlines()
+# --------------------------------------------------
+def length_hist(filename: str) -> Counter[int]:
+    """ Count how many sequences have each length """
+
+    with open(filename, 'rb') as fh:
+        return Counter(seq_lengths(fh))
+
+
+# --------------------------------------------------
+def seq_lengths(fh: BinaryIO) -> Iterator[int]:
+    """ Lengths of each line, or of each record if the file is FASTA """
+
+    lines = line_lengths(fh)
+    first = next(lines, None)
+    if first is None:
+        return
 
-        with open(Path(args.out_dir) / Path(file.name).name, 'w', encoding='utf-8') as out_file:
-            # Check if file is empty
-            if len(lines) == 0:
-                continue
+    if not first[0]:
+        yield first[1]
+        yield from (length for _, length in lines)
+        return
 
-            for line in lines:
-                line = line.strip()
-                num_seqs += 1
-                num_local_seqs += 1
+    # FASTA records span the lines up to the next header
+    length = 0
+    for is_header, line_len in lines:
+        if is_header:
+            yield length
+            length = 0
+        else:
+            length += line_len
+    yield length
 
-                # Update sequence length info
-                if len_max is None or len(line) > len_max:
-                    len_max = len(line)
-                if len_min is None or len(line) < len_min:
-                    len_min = len(line)
-                len_avg += len(line)
 
-            # combined_avg will be divided by num_seq after all files are read
-            combined_avg += len_avg
-            len_avg /= num_local_seqs
+# --------------------------------------------------
+def line_lengths(fh: BinaryIO,
+                 block_size: int = BLOCK_SIZE) -> Iterator[Tuple[bool, int]]:
+    """
+    Stream (is_header, length) for each line without holding whole lines;
+    length ignores whitespace
+    """
+
+    is_header, length, at_start = False, 0, True
+    while block := fh.read(block_size):
+        *lines, tail = block.split(b'\n')
+        for line in lines:
+            if at_start:
+                is_header = line[:1] == b'>'
+            yield is_header, length + len(line.translate(None, b' \t\r'))
+            length, at_start = 0, True
+
+        # Carry only the length of a line that continues in the next block
+        if tail:
+            if at_start:
+                is_header = tail[:1] == b'>'
+            length += len(tail.translate(None, b' \t\r'))
+            at_start = False
 
-            out_file.write(f'Maximum Length: {len_max}\n'
-                           f'Minimum Length: {len_min}\n'
-                           f'Average Length: {len_avg}')
+    if not at_start:
+        yield is_header, length
 
-        # Compare file statistics to combined ones
-        if combined_max is None or len_max > combined_max: # type: ignore
-            combined_max = len_max
-        if combined_min is None or len_min < combined_min: # type: ignore
-            combined_min = len_min
 
-    # Final combined length data calculations and creation of combined_data.txt
+# --------------------------------------------------
+def report(hist: Counter[int]) -> str:
+    """ Format length statistics from a length histogram """
+
+    num_seqs = sum(hist.values())
     if num_seqs == 0:
-        combined_avg = 'N/A'
-    else:
-        combined_avg /= num_seqs
+        return ('Maximum Length: None\n'
+                'Minimum Length: None\n'
+                'Average Length: N/A')
 
-    with open(Path(args.out_dir) / 'combined_data.txt', 'w', encoding='utf-8') as f:
-        f.write(f'Maximum Length: {combined_max}\n'
-                f'Minimum Length: {combined_min}\n'
-                f'Average Length: {combined_avg}')
+    n50, l50 = nx(hist, .5)
+    return (f'Maximum Length: {max(hist)}\n'
+            f'Minimum Length: {min(hist)}\n'
+            f'Average Length: {sum(k * v for k, v in hist.items()) / num_seqs}'
+            f'\nN50 Length: {n50}\n'
+            f'L50 Count: {l50}\n'
+            f'Q1 Length: {quantile(hist, .25)}\n'
+            f'Median Length: {quantile(hist, .5)}\n'
+            f'Q3 Length: {quantile(hist, .75)}')
 
-    # Formatting output message
-    print(f'Calculated length statistics for {num_seqs} '
-          f'sequence{"" if num_seqs == 1 else "s"} in {num_files} '
-          f'file{"" if num_files == 1 else "s"} to directory "{args.out_dir}".')
+
+# --------------------------------------------------
+def nx(hist: Counter[int], frac: float) -> Tuple[int, int]:
+    """
+    Nx and Lx: the shortest length among, and the number of, the longest
+    sequences that together hold at least frac of the total length
+    """
+
+    target = frac * sum(k * v for k, v in hist.items())
+    covered, count = 0, 0
+    for length in sorted(hist, reverse=True):
+        if covered + length * hist[length] >= target:
+            needed = math.ceil((target - covered) / length) if length else 1
+            return length, count + max(1, needed)
+        covered += length * hist[length]
+        count += hist[length]
+
+    return 0, count
+
+
+# --------------------------------------------------
+def quantile(hist: Counter[int], frac: float) -> int:
+    """ Nearest-rank quantile of the lengths """
+
+    rank = max(1, math.ceil(frac * sum(hist.values())))
+    seen = 0
+    for length in sorted(hist):
+        seen += hist[length]
+        if seen >= rank:
+            return length
+
+    return 0
+
+
+# --------------------------------------------------
+def test_seq_lengths() -> None:
+    """ Test seq_lengths """
+
+    def lengths(data: bytes) -> list[int]:
+        return list(seq_lengths(io.BytesIO(data)))
+
+    assert not lengths(b'')
+    assert lengths(b'ACGT') == [4]
+    assert lengths(b'ACGT\r\nAC \n\nA\n') == [4, 2, 0, 1]
+    assert lengths(b'>A\nACG\nTT\n>B x\n>C\nA') == [5, 0, 1]
+
+    # Lines split across blocks
+    data = b'>AB\nACGT\r\n\nTT'
+    expected = [(True, 3), (False, 4), (False, 0), (False, 2)]
+    for size in range(1, len(data) + 1):
+        assert list(line_lengths(io.BytesIO(data), size)) == expected
+
+
+# --------------------------------------------------
+def test_report() -> None:
+    """ Test nx and quantile """
+
+    hist = Counter([2, 2, 3, 4, 5, 8, 8, 10])
+    assert nx(hist, .5) == (8, 3)
+    assert nx(Counter([100]), .5) == (100, 1)
+    assert nx(Counter([10, 10, 10, 10]), .5) == (10, 2)
+    assert nx(Counter([0, 0]), .5) == (0, 1)
+
+    assert quantile(hist, .25) == 2
+    assert quantile(hist, .5) == 4
+    assert quantile(hist, .75) == 8
+    assert quantile(hist, 1.) == 10
 
 
 # --------------------------------------------------
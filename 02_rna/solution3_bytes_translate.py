@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+""" Transcribe DNA into RNA """
+
+import argparse
+import os
+import tempfile
+from functools import partial
+from multiprocessing import Pool
+from typing import NamedTuple, List, TextIO
+
+BLOCK_SIZE = 1 << 20
+TRANS = bytes.maketrans(b'T', b'U')
+
+
+class Args(NamedTuple):
+    """ Command-line arguments """
+    files: List[TextIO]
+    out_dir: str
+    workers: int
+
+
+# --------------------------------------------------
+def get_args() -> Args:
+    """ Get command-line arguments """
+
+    parser = argparse.ArgumentParser(
+        description='Transcribe DNA into RNA',
+        formatter_class=argparse.ArgumentDefaultsHelpFormatter)
+
+    parser.add_argument('file',
+                        help='Input DNA file(s)',
+                        metavar='FILE',
+                        type=argparse.FileType('rt'),
+                        nargs='+')
+
+    parser.add_argument('-o',
+                        '--out_dir',
+                        help='Output directory',
+                        metavar='DIR',
+                        type=str,
+                        default='out')
+
+    parser.add_argument('-w',
+                        '--workers',
+                        help='Number of files to transcribe at once',
+                        metavar='int',
+                        type=int,
+                        default=1)
+
+    args = parser.parse_args()
+
+    if args.workers < 1:
+        parser.error(f'--workers "{args.workers}" must be > 0')
+
+    return Args(args.file, args.out_dir, args.workers)
+
+
+# --------------------------------------------------
+def main() -> None:
+    """ Make a jazz noise here """
+
+    args = get_args()
+
+    if not os.path.isdir(args.out_dir):
+        os.makedirs(args.out_dir)
+
+    # Each file is reopened in binary by whichever process transcribes it
+    filenames = [fh.name for fh in args.files]
+    for fh in args.files:
+        fh.close()
+
+    transcribe_to = partial(transcribe, out_dir=args.out_dir)
+    if args.workers > 1:
+        with Pool(args.workers) as pool:
+            counts = pool.map(transcribe_to, filenames)
+    else:
+        counts = list(map(transcribe_to, filenames))
+
+    num_files, num_seqs = len(counts), sum(counts)
+    print(f'Done, wrote {num_seqs} sequence{"" if num_seqs == 1 else "s"} '
+          f'in {num_files} file{"" if num_files == 1 else "s"} '
+          f'to directory "{args.out_dir}".')
+
+
+# --------------------------------------------------
+def transcribe(filename: str, out_dir: str) -> int:
+    """ Transcribe a file block by block, returning the number of lines """
+
+    out_file = os.path.join(out_dir, os.path.basename(filename))
+    num_seqs, last = 0, b'\n'
+
+    # Memory stays at one block however long the lines are
+    with open(filename, 'rb') as in_fh, open(out_file, 'wb') as out_fh:
+        while block := in_fh.read(BLOCK_SIZE):
+            out_fh.write(block.translate(TRANS))
+            num_seqs += block.count(b'\n')
+            last = block[-1:]
+
+    # Count a last line with no newline
+    return num_seqs + (last != b'\n')
+
+
+# --------------------------------------------------
+def test_transcribe() -> None:
+    """ Test transcribe """
+
+    with tempfile.TemporaryDirectory() as tmp:
+        in_file = os.path.join(tmp, 'in.txt')
+        out_dir = os.path.join(tmp, 'out')
+        out_file = os.path.join(out_dir, 'in.txt')
+        os.makedirs(out_dir)
+
+        for dna, rna, num in [(b'', b'', 0), (b'ACGT', b'ACGU', 1),
+                              (b'TT\nGATC\n', b'UU\nGAUC\n', 2)]:
+            with open(in_file, 'wb') as fh:
+                fh.write(dna)
+            assert transcribe(in_file, out_dir) == num
+            with open(out_file, 'rb') as fh:
+                assert fh.read() == rna
+
+
+# --------------------------------------------------
+if __name__ == '__main__':
+    main()
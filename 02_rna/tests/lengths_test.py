@@ -13,6 +13,7 @@ RUN = f'python {PRG}' if platform.system() == 'Windows' else PRG
 INPUT1 = './tests/inputs/input1.txt'
 INPUT2 = './tests/inputs/input2.txt'
 INPUT3 = './tests/inputs/input3.txt'
+INPUT4 = './tests/inputs/input4.fa'
 
 
 # --------------------------------------------------
@@ -90,11 +91,15 @@ def test_good_input1() -> None:
         out_file1 = os.path.join(out_dir, 'input1.txt')
         assert os.path.isfile(out_file1)
         assert open(out_file1).read().rstrip() == '\n'.join(
-            ['Maximum Length: 23', 'Minimum Length: 23', 'Average Length: 23.0'])
+            ['Maximum Length: 23', 'Minimum Length: 23', 'Average Length: 23.0',
+             'N50 Length: 23', 'L50 Count: 1', 'Q1 Length: 23',
+             'Median Length: 23', 'Q3 Length: 23'])
         out_file2 = os.path.join(out_dir, 'combined_data.txt')
         assert os.path.isfile(out_file2)
         assert open(out_file2).read().rstrip() == '\n'.join(
-            ['Maximum Length: 23', 'Minimum Length: 23', 'Average Length: 23.0'])
+            ['Maximum Length: 23', 'Minimum Length: 23', 'Average Length: 23.0',
+             'N50 Length: 23', 'L50 Count: 1', 'Q1 Length: 23',
+             'Median Length: 23', 'Q3 Length: 23'])
 
     finally:
         if os.path.isdir(out_dir):
@@ -120,9 +125,13 @@ def test_good_input2() -> None:
         assert os.path.isfile(out_file1)
         assert os.path.isfile(out_file2)
         assert open(out_file1).read().rstrip() == '\n'.join(
-            ['Maximum Length: 20', 'Minimum Length: 18', 'Average Length: 19.0'])
+            ['Maximum Length: 20', 'Minimum Length: 18', 'Average Length: 19.0',
+             'N50 Length: 20', 'L50 Count: 1', 'Q1 Length: 18',
+             'Median Length: 18', 'Q3 Length: 20'])
         assert open(out_file2).read().rstrip() == '\n'.join(
-            ['Maximum Length: 20', 'Minimum Length: 18', 'Average Length: 19.0'])
+            ['Maximum Length: 20', 'Minimum Length: 18', 'Average Length: 19.0',
+             'N50 Length: 20', 'L50 Count: 1', 'Q1 Length: 18',
+             'Median Length: 18', 'Q3 Length: 20'])
 
     finally:
         if os.path.isdir(out_dir):
@@ -153,19 +162,70 @@ def test_good_multiple_inputs():
         assert os.path.isfile(out_file3)
         assert os.path.isfile(out_file4)
         assert open(out_file1).read().rstrip() == '\n'.join(
-            ['Maximum Length: 23', 'Minimum Length: 23', 'Average Length: 23.0'])
+            ['Maximum Length: 23', 'Minimum Length: 23', 'Average Length: 23.0',
+             'N50 Length: 23', 'L50 Count: 1', 'Q1 Length: 23',
+             'Median Length: 23', 'Q3 Length: 23'])
         assert open(out_file2).read().rstrip() == '\n'.join(
-            ['Maximum Length: 20', 'Minimum Length: 18', 'Average Length: 19.0'])
+            ['Maximum Length: 20', 'Minimum Length: 18', 'Average Length: 19.0',
+             'N50 Length: 20', 'L50 Count: 1', 'Q1 Length: 18',
+             'Median Length: 18', 'Q3 Length: 20'])
         assert open(out_file3).read().rstrip() == '\n'.join(
-            ['Maximum Length: 967', 'Minimum Length: 919', 'Average Length: 943.0'])
+            ['Maximum Length: 967', 'Minimum Length: 919', 'Average Length: 943.0',
+             'N50 Length: 967', 'L50 Count: 1', 'Q1 Length: 919',
+             'Median Length: 919', 'Q3 Length: 967'])
         assert open(out_file4).read().rstrip() == '\n'.join(
-            ['Maximum Length: 967', 'Minimum Length: 18', 'Average Length: 389.4'])
+            ['Maximum Length: 967', 'Minimum Length: 18', 'Average Length: 389.4',
+             'N50 Length: 919', 'L50 Count: 2', 'Q1 Length: 20',
+             'Median Length: 23', 'Q3 Length: 919'])
 
     finally:
         if os.path.isdir(out_dir):
             shutil.rmtree(out_dir)
 
 
+# --------------------------------------------------
+def test_fasta() -> None:
+    """ Counts FASTA records rather than lines """
+
+    out_dir = random_filename()
+    try:
+        retval, out = getstatusoutput(f'{RUN} -o {out_dir} {INPUT4}')
+        assert retval == 0
+        assert out == ('Calculated length statistics for 3 sequences in 1 '
+                       f'file to directory "{out_dir}".')
+        out_file = os.path.join(out_dir, 'input4.fa')
+        assert open(out_file).read().rstrip() == '\n'.join(
+            ['Maximum Length: 14', 'Minimum Length: 0',
+             'Average Length: 6.333333333333333', 'N50 Length: 14',
+             'L50 Count: 1', 'Q1 Length: 0', 'Median Length: 5',
+             'Q3 Length: 14'])
+
+    finally:
+        if os.path.isdir(out_dir):
+            shutil.rmtree(out_dir)
+
+
+# --------------------------------------------------
+def test_workers() -> None:
+    """ Workers produce the same reports """
+
+    inputs = f'{INPUT1} {INPUT2} {INPUT3} {INPUT4}'
+    out_dir1, out_dir2 = random_filename(), random_filename()
+    try:
+        retval1, out1 = getstatusoutput(f'{RUN} -o {out_dir1} {inputs}')
+        retval2, out2 = getstatusoutput(f'{RUN} -w 3 -o {out_dir2} {inputs}')
+        assert retval1 == retval2 == 0
+        assert out1.replace(out_dir1, out_dir2) == out2
+        for name in os.listdir(out_dir1):
+            assert open(os.path.join(out_dir1, name)).read() == open(
+                os.path.join(out_dir2, name)).read()
+
+    finally:
+        for out_dir in [out_dir1, out_dir2]:
+            if os.path.isdir(out_dir):
+                shutil.rmtree(out_dir)
+
+
 # --------------------------------------------------
 def random_filename() -> str:
     """ Generate a random filename """
@@ -0,0 +1,99 @@
+"""
+Author : bcheng <bcheng@localhost>
+Date   : 2026-10-18
+Purpose: Batch reverse complement with NumPy lookup tables
+"""
+
+import random
+from typing import List, Sequence, Tuple
+import numpy as np
+from Bio.Seq import reverse_complement, reverse_complement_rna
+from solution4_str_translate import IUPAC
+
+# The same complements as str.translate, with A paired to U for RNA
+DNA_TABLE = np.frombuffer(IUPAC, dtype=np.uint8)
+RNA_TABLE = DNA_TABLE.copy()
+RNA_TABLE[np.frombuffer(b'Aa', dtype=np.uint8)] = np.frombuffer(
+    b'Uu', dtype=np.uint8)
+
+
+# --------------------------------------------------
+def pack(seqs: Sequence[str]) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Pack sequences into one uint8 array plus offsets, where sequence i
+    is packed[offsets[i]:offsets[i + 1]]
+    """
+
+    data = ''.join(seqs).encode('ascii')
+    offsets = np.zeros(len(seqs) + 1, dtype=np.int64)
+    np.cumsum([len(seq) for seq in seqs], out=offsets[1:])
+    return np.frombuffer(data, dtype=np.uint8), offsets
+
+
+# --------------------------------------------------
+def unpack(packed: np.ndarray, offsets: np.ndarray) -> List[str]:
+    """ Split a packed array back into sequences """
+
+    data = packed.tobytes().decode('ascii')
+    bounds = offsets.tolist()
+    return [data[start:end] for start, end in zip(bounds, bounds[1:])]
+
+
+# --------------------------------------------------
+def revcomp_packed(packed: np.ndarray,
+                   offsets: np.ndarray,
+                   rna: bool = False) -> np.ndarray:
+    """
+    Reverse-complement every packed sequence in one pass; the result
+    uses the same offsets
+    """
+
+    lengths = np.diff(offsets)
+
+    # Position j of sequence i comes from offsets[i] + offsets[i + 1] - 1 - j
+    index = np.repeat(offsets[:-1] + offsets[1:] - 1, lengths)
+    index -= np.arange(len(index), dtype=index.dtype)
+
+    lookup = RNA_TABLE if rna else DNA_TABLE
+    return lookup[packed[index]]
+
+
+# --------------------------------------------------
+def revcomp_batch(seqs: Sequence[str], rna: bool = False) -> List[str]:
+    """ Reverse-complement a batch of sequences """
+
+    packed, offsets = pack(seqs)
+    return unpack(revcomp_packed(packed, offsets, rna), offsets)
+
+
+# --------------------------------------------------
+def test_revcomp_packed() -> None:
+    """ Test revcomp_packed """
+
+    packed, offsets = pack(['AAC', '', 'gT', 'N'])
+    assert offsets.tolist() == [0, 3, 3, 5, 6]
+    assert revcomp_packed(packed, offsets).tobytes() == b'GTTAcN'
+
+    packed, offsets = pack([])
+    assert not revcomp_packed(packed, offsets).size
+
+
+# --------------------------------------------------
+def test_revcomp_batch() -> None:
+    """ Test revcomp_batch """
+
+    assert not revcomp_batch([])
+    assert revcomp_batch(['']) == ['']
+    assert revcomp_batch(['AAAACCCGGT', 'aaaaCCCGGT', 'RYKMBVDHSWU']) == [
+        'ACCGGGTTTT', 'ACCGGGtttt', 'AWSDHBVKMRY'
+    ]
+    assert revcomp_batch(['AUGC', 'uuag'], rna=True) == ['GCAU', 'cuaa']
+
+    # Same as Biopython on mixed-case IUPAC
+    seqs = [
+        ''.join(random.choices('ACGTUMRWSYKVHDBNacgtumrwsykvhdbn', k=k))
+        for k in range(50)
+    ]
+    assert revcomp_batch(seqs) == list(map(reverse_complement, seqs))
+    assert revcomp_batch(seqs, rna=True) == list(
+        map(reverse_complement_rna, seqs))
@@ -2,13 +2,24 @@
 """ Reverse complement """
 
 import argparse
+import io
+import mmap
 import os
-from typing import NamedTuple
+import sys
+import tempfile
+from typing import BinaryIO, Iterable, Iterator, NamedTuple, TextIO, Tuple
+
+BLOCK_SIZE = 1 << 20
+WHITESPACE = b' \t\r\n'
+IUPAC = bytes.maketrans(b'ACGTUMRWSYKVHDBNacgtumrwsykvhdbn',
+                        b'TGCAAKYWSRMBDHVNtgcaakywsrmbdhvn')
 
 
 class Args(NamedTuple):
     """ Command-line arguments """
     dna: str
+    fasta: bool
+    outfile: TextIO
 
 
 # --------------------------------------------------
@@ -21,12 +32,28 @@ def get_args() -> Args:
 
     parser.add_argument('dna', metavar='DNA', help='Input sequence or file')
 
+    parser.add_argument('-f',
+                        '--fasta',
+                        help='Stream each record of a FASTA file',
+                        action='store_true')
+
+    parser.add_argument('-o',
+                        '--outfile',
+                        help='Output file',
+                        metavar='FILE',
+                        type=argparse.FileType('wt'),
+                        default=sys.stdout)
+
     args = parser.parse_args()
 
-    if os.path.isfile(args.dna):
+    if args.fasta:
+        # The file is streamed later, never read whole
+        if not os.path.isfile(args.dna):
+            parser.error(f'--fasta needs a file, "{args.dna}" is not one')
+    elif os.path.isfile(args.dna):
         args.dna = open(args.dna).read().rstrip()
 
-    return Args(args.dna)
+    return Args(args.dna, args.fasta, args.outfile)
 
 
 # --------------------------------------------------
@@ -34,16 +61,143 @@ def main() -> None:
     """ Make a jazz noise here """
 
     args = get_args()
+    if args.fasta:
+        args.outfile.flush()
+        revcomp_fasta(args.dna, args.outfile.buffer)
+        return
+
     trans = str.maketrans({
         'A': 'T', 'C': 'G', 'G': 'C', 'T': 'A',
         'a': 't', 'c': 'g', 'g': 'c', 't': 'a'
     })
-    print(''.join(reversed(args.dna.translate(trans))))
+    print(''.join(reversed(args.dna.translate(trans))), file=args.outfile)
 
     # trans = str.maketrans('ACGTacgt', 'TGCAtgca')
     # print(''.join(reversed(args.dna.translate(trans))))
 
 
+# --------------------------------------------------
+def revcomp_fasta(filename: str,
+                  out_fh: BinaryIO,
+                  block_size: int = BLOCK_SIZE) -> int:
+    """
+    Reverse-complement each record of a FASTA file, keeping its line width;
+    memory is bounded by the block size, not the record size
+    """
+
+    num_recs = 0
+    with open(filename, 'rb') as fh:
+        if os.fstat(fh.fileno()).st_size == 0:
+            return num_recs
+
+        with mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            for header, start, end in records(mm):
+                out_fh.write(header + b'\n')
+                for chunk in wrap(reverse_blocks(mm, start, end, block_size),
+                                  line_width(mm, start, end)):
+                    out_fh.write(chunk)
+                num_recs += 1
+
+    return num_recs
+
+
+# --------------------------------------------------
+def records(mm: mmap.mmap) -> Iterator[Tuple[bytes, int, int]]:
+    """ Find each record's header and the span of its sequence lines """
+
+    pos = 0 if mm[:1] == b'>' else mm.find(b'\n>') + 1
+    while pos > 0 or mm[:1] == b'>':
+        eol = mm.find(b'\n', pos)
+        if eol < 0:
+            eol = len(mm)
+        nxt = mm.find(b'\n>', eol)
+        end = len(mm) if nxt < 0 else nxt + 1
+
+        yield mm[pos:eol].rstrip(), min(eol + 1, end), end
+        release(mm, pos, end)
+        if nxt < 0:
+            break
+        pos = nxt + 1
+
+
+# --------------------------------------------------
+def line_width(mm: mmap.mmap, start: int, end: int) -> int:
+    """ Width of the first sequence line, or 0 if the sequence is one line """
+
+    eol = mm.find(b'\n', start, end)
+    if eol < 0 or mm[eol + 1:eol + 2] in (b'', b'\n', b'\r', b'>'):
+        return 0
+
+    return eol - start - (mm[eol - 1:eol] == b'\r')
+
+
+# --------------------------------------------------
+def reverse_blocks(mm: mmap.mmap, start: int, end: int,
+                   block_size: int) -> Iterator[bytes]:
+    """ Reverse-complemented bases, read in blocks from the end backwards """
+
+    pos = end
+    while pos > start:
+        low = max(start, pos - block_size)
+        yield mm[low:pos].translate(IUPAC, WHITESPACE)[::-1]
+        release(mm, low, pos)
+        pos = low
+
+
+# --------------------------------------------------
+def wrap(chunks: Iterable[bytes], width: int) -> Iterator[bytes]:
+    """ Rewrap bases into lines of width, or into one line if width is 0 """
+
+    tail, seen = b'', False
+    for chunk in chunks:
+        if not width:
+            seen = seen or bool(chunk)
+            yield chunk
+            continue
+
+        data = tail + chunk
+        full = len(data) - len(data) % width
+        yield b''.join(
+            [data[i:i + width] + b'\n' for i in range(0, full, width)])
+        tail = data[full:]
+
+    if tail or seen:
+        yield tail + b'\n'
+
+
+# --------------------------------------------------
+def release(mm: mmap.mmap, start: int, end: int) -> None:
+    """ Let the kernel drop the pages already read """
+
+    if hasattr(mm, 'madvise') and hasattr(mmap, 'MADV_DONTNEED'):
+        start -= start % mmap.PAGESIZE
+        mm.madvise(mmap.MADV_DONTNEED, start, end - start)
+
+
+# --------------------------------------------------
+def test_revcomp_fasta() -> None:
+    """ Test revcomp_fasta """
+
+    def revcomp(data: bytes, block_size: int) -> bytes:
+        with tempfile.NamedTemporaryFile() as tmp:
+            tmp.write(data)
+            tmp.flush()
+            out = io.BytesIO()
+            revcomp_fasta(tmp.name, out, block_size)
+            return out.getvalue()
+
+    for data, expected in [
+        (b'', b''),
+        (b'>empty\n', b'>empty\n'),
+        (b'>one line\nAACGTN\n', b'>one line\nNACGTT\n'),
+        (b'>iupac\nRYKMBVDHSWU', b'>iupac\nAWSDHBVKMRY\n'),
+        (b'junk\n>A x\nAAAC\ncgtt\nGG\r\n>B\n>C\nTTTT\nTTTT\n',
+         b'>A x\nCCaa\ncgGT\nTT\n>B\n>C\nAAAA\nAAAA\n'),
+    ]:
+        for block_size in range(1, len(data) + 2):
+            assert revcomp(data, block_size) == expected
+
+
 # --------------------------------------------------
 if __name__ == '__main__':
     main()
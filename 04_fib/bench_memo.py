@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+Author : bcheng <bcheng@localhost>
+Date   : 2026-10-18
+Purpose: Benchmark memoization of the rabbit recurrence
+"""
+
+import argparse
+import sys
+import time
+from functools import lru_cache
+from typing import Callable, Dict, List, NamedTuple
+from memo import memoize
+from solution3_recursion_memoize import memoize as dict_memoize
+
+Fib = Callable[[int], int]
+
+
+class Args(NamedTuple):
+    """ Command-line arguments """
+    generations: List[int]
+    litter: int
+    repeat: int
+
+
+# --------------------------------------------------
+def get_args() -> Args:
+    """ Get command-line arguments """
+
+    parser = argparse.ArgumentParser(
+        description='Benchmark memoization of the rabbit recurrence',
+        formatter_class=argparse.ArgumentDefaultsHelpFormatter)
+
+    parser.add_argument('-g',
+                        '--generations',
+                        help='Generations to compute',
+                        metavar='int',
+                        type=int,
+                        nargs='+',
+                        default=[40, 500, 100000])
+
+    parser.add_argument('-k',
+                        '--litter',
+                        help='Size of litter per generation',
+                        metavar='int',
+                        type=int,
+                        default=3)
+
+    parser.add_argument('-r',
+                        '--repeat',
+                        help='Best of this many cold runs',
+                        metavar='int',
+                        type=int,
+                        default=5)
+
+    args = parser.parse_args()
+
+    return Args(args.generations, args.litter, args.repeat)
+
+
+# --------------------------------------------------
+def main() -> None:
+    """ Print the best time of each implementation for each size """
+
+    args = get_args()
+    sys.set_int_max_str_digits(0)
+    makers = candidates(args.litter)
+
+    print('\t'.join(['name'] + [str(gen) for gen in args.generations]))
+    for name, make in makers.items():
+        times = [best_time(make, gen, args.repeat) for gen in args.generations]
+        print('\t'.join([name] + times))
+
+
+# --------------------------------------------------
+def candidates(litter: int) -> Dict[str, Callable[[], Fib]]:
+    """ Functions that each build a fresh, cold memoized fib """
+
+    def recurse(cache: Callable[[Fib], Fib]) -> Fib:
+        fib: Fib
+
+        def plain(n: int) -> int:
+            return 1 if n in (1, 2) else fib(n - 2) * litter + fib(n - 1)
+
+        fib = cache(plain)
+        return fib
+
+    def warmed(maxsize: int) -> Fib:
+
+        @memoize(maxsize=maxsize)
+        def fib(n: int) -> int:
+            return 1 if n in (1, 2) else fib(n - 2) * litter + fib(n - 1)
+
+        def bottom_up(n: int) -> int:
+            fib.warm((i, ) for i in range(1, n))
+            return fib(n)
+
+        return bottom_up
+
+    return {
+        'dict_memoize': lambda: recurse(dict_memoize),
+        'lru_cache': lambda: recurse(lru_cache(maxsize=None)),
+        'lru_cache_128': lambda: recurse(lru_cache(maxsize=128)),
+        'memoize': lambda: recurse(memoize),
+        'memoize_128': lambda: recurse(memoize(maxsize=128)),
+        'memoize_warm_3': lambda: warmed(3),
+    }
+
+
+# --------------------------------------------------
+def best_time(make: Callable[[], Fib], gen: int, repeat: int) -> str:
+    """ Best of repeat cold runs, or the error that stopped it """
+
+    best = float('inf')
+    for _ in range(repeat):
+        fib = make()
+        start = time.perf_counter()
+        try:
+            fib(gen)
+        except RecursionError:
+            return 'RecursionError'
+        best = min(best, time.perf_counter() - start)
+
+    return f'{best:.6f}'
+
+
+# --------------------------------------------------
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,254 @@
+#!/usr/bin/env python3
+"""
+Author : bcheng <bcheng@localhost>
+Date   : 2026-10-18
+Purpose: Mortal and age-structured rabbit populations
+"""
+
+import argparse
+import sys
+from typing import List, NamedTuple, Optional, TextIO, Tuple
+import numpy as np
+
+
+class Args(NamedTuple):
+    """ Command-line arguments """
+    generations: int
+    fecundity: List[int]
+    survival: List[int]
+    mod: Optional[int]
+
+
+# --------------------------------------------------
+def get_args() -> Args:
+    """ Get command-line arguments """
+
+    parser = argparse.ArgumentParser(
+        description='Mortal and age-structured rabbit populations',
+        formatter_class=argparse.ArgumentDefaultsHelpFormatter)
+
+    parser.add_argument('gen',
+                        metavar='generations',
+                        type=int,
+                        help='Number of generations')
+
+    parser.add_argument('-k',
+                        '--litter',
+                        help='Size of litter per generation',
+                        metavar='int',
+                        type=int,
+                        default=1)
+
+    parser.add_argument('-l',
+                        '--lifespan',
+                        help='Generations each pair lives',
+                        metavar='int',
+                        type=int,
+                        default=3)
+
+    parser.add_argument('-L',
+                        '--leslie',
+                        help='File of fecundity by age on line 1 and '
+                        'survival by age on line 2 (overrides -k/-l)',
+                        metavar='FILE',
+                        type=argparse.FileType('rt'),
+                        default=None)
+
+    parser.add_argument('-m',
+                        '--mod',
+                        help='Report results modulo this number',
+                        metavar='int',
+                        type=int,
+                        default=None)
+
+    args = parser.parse_args()
+
+    if args.gen < 1:
+        parser.error(f'generations "{args.gen}" must be > 0')
+
+    if args.litter < 0:
+        parser.error(f'litter "{args.litter}" must be >= 0')
+
+    if args.lifespan < 1:
+        parser.error(f'lifespan "{args.lifespan}" must be > 0')
+
+    if args.mod is not None and args.mod < 1:
+        parser.error(f'--mod "{args.mod}" must be > 0')
+
+    if args.leslie:
+        try:
+            fecundity, survival = read_leslie(args.leslie)
+        except ValueError as err:
+            parser.error(f'--leslie "{args.leslie.name}": {err}')
+    else:
+        fecundity, survival = mortal(args.litter, args.lifespan)
+
+    return Args(args.gen, fecundity, survival, args.mod)
+
+
+# --------------------------------------------------
+def main() -> None:
+    """ Make a jazz noise here """
+
+    args = get_args()
+    sys.set_int_max_str_digits(0)
+    print(population(args.generations, args.fecundity, args.survival,
+                     args.mod))
+
+
+# --------------------------------------------------
+def mortal(litter: int, lifespan: int) -> Tuple[List[int], List[int]]:
+    """ Leslie rates for pairs that breed from age 1 and die at lifespan """
+
+    return [0] + [litter] * (lifespan - 1), [1] * (lifespan - 1)
+
+
+# --------------------------------------------------
+def read_leslie(fh: TextIO) -> Tuple[List[int], List[int]]:
+    """ Read fecundity and survival rates """
+
+    lines = [list(map(int, line.split())) for line in fh if line.strip()]
+    if not 1 <= len(lines) <= 2:
+        raise ValueError('need a fecundity line and a survival line')
+
+    fecundity, survival = lines[0], lines[1] if len(lines) == 2 else []
+    if len(survival) != len(fecundity) - 1:
+        raise ValueError(f'{len(fecundity)} ages need '
+                         f'{len(fecundity) - 1} survival rates')
+
+    if min(fecundity + survival) < 0:
+        raise ValueError('rates must be >= 0')
+
+    return fecundity, survival
+
+
+# --------------------------------------------------
+def population(generations: int,
+               fecundity: List[int],
+               survival: List[int],
+               mod: Optional[int] = None) -> int:
+    """
+    Pairs alive after some generations, starting from one newborn pair;
+    short runs step the age vector, long runs take a Leslie matrix power
+    """
+
+    steps, ages = generations - 1, len(fecundity)
+    if steps <= ages * ages * steps.bit_length():
+        counts = step_ages(steps, fecundity, survival, mod)
+    else:
+        mat = leslie(fecundity, survival, mod)
+        counts = leslie_pow(mat, steps, mod)[:, 0]
+
+    total = sum(counts.tolist())
+    return total if mod is None else total % mod
+
+
+# --------------------------------------------------
+def dtype(size: int, mod: Optional[int]) -> np.dtype:
+    """ int64 when products mod m cannot overflow, else Python ints """
+
+    if mod is not None and size * (mod - 1)**2 < 2**63:
+        return np.dtype(np.int64)
+    return np.dtype(object)
+
+
+# --------------------------------------------------
+def step_ages(steps: int,
+              fecundity: List[int],
+              survival: List[int],
+              mod: Optional[int] = None) -> np.ndarray:
+    """ Advance the age-bucket vector one generation at a time """
+
+    if mod is not None:
+        fecundity = [rate % mod for rate in fecundity]
+        survival = [rate % mod for rate in survival]
+
+    kind = dtype(len(fecundity), mod)
+    fec = np.array(fecundity, dtype=kind)
+    surv = np.array(survival, dtype=kind)
+    ages = np.zeros(len(fecundity), dtype=kind)
+    ages[0] = 1
+
+    for _ in range(steps):
+        newborn = fec.dot(ages)
+        ages[1:] = surv * ages[:-1]
+        ages[0] = newborn
+        if mod is not None:
+            ages %= mod
+
+    return ages
+
+
+# --------------------------------------------------
+def leslie(fecundity: List[int],
+           survival: List[int],
+           mod: Optional[int] = None) -> np.ndarray:
+    """ Leslie matrix with fecundity on top and survival below the diagonal """
+
+    if mod is not None:
+        fecundity = [rate % mod for rate in fecundity]
+        survival = [rate % mod for rate in survival]
+
+    size = len(fecundity)
+    mat = np.zeros((size, size), dtype=dtype(size, mod))
+    mat[0] = fecundity
+    mat[np.arange(1, size), np.arange(size - 1)] = survival
+    return mat
+
+
+# --------------------------------------------------
+def leslie_pow(mat: np.ndarray, power: int,
+               mod: Optional[int] = None) -> np.ndarray:
+    """ Raise a matrix to a power by repeated squaring """
+
+    result = np.identity(len(mat), dtype=mat.dtype)
+    while power:
+        if power & 1:
+            result = result @ mat
+            if mod is not None:
+                result %= mod
+        mat = mat @ mat
+        if mod is not None:
+            mat %= mod
+        power >>= 1
+
+    return result
+
+
+# --------------------------------------------------
+def test_population() -> None:
+    """ Test population """
+
+    def slow(n: int, k: int, m: int) -> int:
+        ages = [1] + [0] * (m - 1)
+        for _ in range(n - 1):
+            ages = [k * sum(ages[1:])] + ages[:-1]
+        return sum(ages)
+
+    assert population(6, *mortal(1, 3)) == 4
+    assert population(1, *mortal(1, 1)) == 1
+    assert population(2, *mortal(1, 1)) == 0
+
+    # Both methods, exact and modular, against the recurrence
+    for n in [1, 2, 5, 20, 100, 300]:
+        for k in [0, 1, 3]:
+            for m in [1, 2, 3, 7]:
+                expected = slow(n, k, m)
+                assert population(n, *mortal(k, m)) == expected
+                assert population(n, *mortal(k, m), 97) == expected % 97
+                steps = step_ages(n - 1, *mortal(k, m), 2**62)
+                power = leslie_pow(leslie(*mortal(k, m), 2**62), n - 1,
+                                   2**62)[:, 0]
+                assert steps.tolist() == power.tolist()
+
+    # Rates above the modulus
+    assert population(200, [0, 10**30, 3], [10**20 + 1, 1], 1000) == \
+        population(200, [0, 0, 3], [1, 1]) % 1000
+
+    # Long-lived pairs match the immortal Fibonacci numbers for a while
+    assert population(50, *mortal(1, 60)) == 12586269025
+
+
+# --------------------------------------------------
+if __name__ == '__main__':
+    main()
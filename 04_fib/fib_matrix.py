@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+"""
+Author : bcheng <bcheng@localhost>
+Date   : 2026-10-18
+Purpose: Fibonacci rabbits by matrix power
+"""
+
+import argparse
+import sys
+from typing import Iterator, List, NamedTuple, Optional, TextIO, Tuple
+
+Matrix = Tuple[int, int, int, int]
+
+
+class Args(NamedTuple):
+    """ Command-line arguments """
+    generations: Optional[int]
+    litter: Optional[int]
+    file: Optional[TextIO]
+    mod: Optional[int]
+
+
+# --------------------------------------------------
+def get_args() -> Args:
+    """ Get command-line arguments """
+
+    parser = argparse.ArgumentParser(
+        description='Fibonacci rabbits by matrix power',
+        formatter_class=argparse.ArgumentDefaultsHelpFormatter)
+
+    parser.add_argument('gen',
+                        metavar='generations',
+                        type=int,
+                        nargs='?',
+                        help='Number of generations')
+
+    parser.add_argument('litter',
+                        metavar='litter',
+                        type=int,
+                        nargs='?',
+                        help='Size of litter per generation')
+
+    parser.add_argument('-f',
+                        '--file',
+                        help='File of "generations litter" queries, one per '
+                        'line',
+                        metavar='FILE',
+                        type=argparse.FileType('rt'),
+                        default=None)
+
+    parser.add_argument('-m',
+                        '--mod',
+                        help='Report results modulo this number',
+                        metavar='int',
+                        type=int,
+                        default=None)
+
+    args = parser.parse_args()
+
+    if (args.file is None) == (args.litter is None) or (args.gen is None) != (
+            args.litter is None):
+        parser.error('give either generations and litter or --file')
+
+    if args.gen is not None:
+        if args.gen < 1:
+            parser.error(f'generations "{args.gen}" must be > 0')
+
+        if args.litter < 0:
+            parser.error(f'litter "{args.litter}" must be >= 0')
+
+    if args.mod is not None and args.mod < 1:
+        parser.error(f'--mod "{args.mod}" must be > 0')
+
+    return Args(generations=args.gen,
+                litter=args.litter,
+                file=args.file,
+                mod=args.mod)
+
+
+# --------------------------------------------------
+def main() -> None:
+    """ Make a jazz noise here """
+
+    args = get_args()
+
+    # Exact answers for large generations have hundreds of thousands of digits
+    sys.set_int_max_str_digits(0)
+
+    if args.file:
+        for num, (gen, litter) in enumerate(read_queries(args.file), start=1):
+            if gen < 1 or litter < 0:
+                sys.exit(f'{args.file.name} query {num}: generations must be '
+                         '> 0 and litter >= 0')
+            print(fib(gen, litter, args.mod))
+
+    elif args.generations is not None and args.litter is not None:
+        print(fib(args.generations, args.litter, args.mod))
+
+
+# --------------------------------------------------
+def read_queries(fh: TextIO) -> Iterator[Tuple[int, int]]:
+    """ Stream (generations, litter) queries, skipping blank lines """
+
+    for line in fh:
+        if fields := line.split():
+            try:
+                gen, litter = map(int, fields)
+            except ValueError:
+                sys.exit(f'Bad query "{line.rstrip()}" in {fh.name}')
+            yield gen, litter
+
+
+# --------------------------------------------------
+def fib(n: int, k: int, mod: Optional[int] = None) -> int:
+    """
+    Pairs of rabbits after n generations with litter k, from
+    [[1, k], [1, 0]] to the power n - 1, in O(log n) multiplications
+    """
+
+    pairs = mat_pow((1, k, 1, 0), n - 1, mod)[0]
+    return pairs if mod is None else pairs % mod
+
+
+# --------------------------------------------------
+def mat_pow(mat: Matrix, power: int, mod: Optional[int] = None) -> Matrix:
+    """ Raise a 2x2 matrix to a power by repeated squaring """
+
+    result = (1, 0, 0, 1)
+    while power:
+        if power & 1:
+            result = mat_mul(result, mat, mod)
+        mat = mat_mul(mat, mat, mod)
+        power >>= 1
+
+    return result
+
+
+# --------------------------------------------------
+def mat_mul(x: Matrix, y: Matrix, mod: Optional[int] = None) -> Matrix:
+    """ Multiply 2x2 matrices stored as (a, b, c, d) rows """
+
+    a, b, c, d = x
+    e, f, g, h = y
+    prod: List[int] = [
+        a * e + b * g, a * f + b * h, c * e + d * g, c * f + d * h
+    ]
+    if mod is not None:
+        prod = [val % mod for val in prod]
+
+    return prod[0], prod[1], prod[2], prod[3]
+
+
+# --------------------------------------------------
+def test_fib() -> None:
+    """ Test fib """
+
+    def slow(n: int, k: int) -> int:
+        x, y = 0, 1
+        for _ in range(n - 1):
+            x, y = y, y + k * x
+        return y
+
+    assert fib(5, 3) == 19
+    assert fib(30, 4) == 436390025825
+    assert fib(29, 2) == 178956971
+
+    for n in range(1, 50):
+        for k in range(0, 6):
+            assert fib(n, k) == slow(n, k)
+            assert fib(n, k, 1000) == slow(n, k) % 1000
+
+    assert fib(10**18, 1, 10**9 + 7) == 209783453
+    assert fib(5, 3, 1) == fib(1, 3, 1) == 0
+
+
+# --------------------------------------------------
+if __name__ == '__main__':
+    main()
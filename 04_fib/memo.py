@@ -0,0 +1,198 @@
+"""
+Author : bcheng <bcheng@localhost>
+Date   : 2026-10-18
+Purpose: Bounded, instrumented memoization
+"""
+
+import atexit
+import os
+import pickle
+import sys
+import tempfile
+from collections import OrderedDict
+from functools import partial, update_wrapper
+from typing import (Any, Callable, Generic, Hashable, Iterable, NamedTuple,
+                    Optional, Tuple, TypeVar, Union, cast, overload)
+
+T = TypeVar('T')
+MISSING = object()
+
+
+class CacheInfo(NamedTuple):
+    """ Cache statistics, as from functools.lru_cache """
+    hits: int
+    misses: int
+    maxsize: Optional[int]
+    currsize: int
+
+
+class Memoized(Generic[T]):
+    """
+    A function with a least-recently-used cache of its results that
+    counts hits and misses and can be saved between runs
+    """
+
+    def __init__(self,
+                 func: Callable[..., T],
+                 maxsize: Optional[int] = None,
+                 cache_file: Optional[str] = None) -> None:
+        self.func = func
+        self.maxsize = maxsize
+        self.cache_file = cache_file
+        self.cache: OrderedDict[Tuple[Hashable, ...], T] = OrderedDict()
+        self.hits = self.misses = 0
+        update_wrapper(self, func)
+
+        if cache_file:
+            if os.path.isfile(cache_file):
+                with open(cache_file, 'rb') as fh:
+                    self.cache.update(pickle.load(fh))
+                self._trim()
+            atexit.register(self.save)
+
+    def __call__(self, *args: Hashable) -> T:
+        value = self.cache.get(args, MISSING)
+        if value is not MISSING:
+            self.hits += 1
+            if self.maxsize is not None:
+                self.cache.move_to_end(args)
+            return cast(T, value)
+
+        self.misses += 1
+        value = self.func(*args)
+        self.cache[args] = value
+        if self.maxsize is not None and len(self.cache) > self.maxsize:
+            self._trim()
+        return value
+
+    def warm(self, calls: Iterable[Tuple[Hashable, ...]]) -> None:
+        """
+        Make the calls in order so a recursive function is filled bottom-up,
+        each call recursing only a level or two however deep the answer
+        """
+
+        for args in calls:
+            self(*args)
+
+    def cache_info(self) -> CacheInfo:
+        """ Hits, misses and sizes """
+
+        return CacheInfo(self.hits, self.misses, self.maxsize, len(self.cache))
+
+    def cache_clear(self) -> None:
+        """ Empty the cache and reset the counters """
+
+        self.cache.clear()
+        self.hits = self.misses = 0
+
+    def save(self) -> None:
+        """ Write the cache to cache_file, replacing it atomically """
+
+        if not self.cache_file:
+            return
+
+        dirname = os.path.dirname(os.path.abspath(self.cache_file))
+        with tempfile.NamedTemporaryFile('wb', dir=dirname,
+                                         delete=False) as fh:
+            pickle.dump(dict(self.cache), fh)
+        os.replace(fh.name, self.cache_file)
+
+    def _trim(self) -> None:
+        """ Evict the least recently used entries over maxsize """
+
+        if self.maxsize is not None:
+            while len(self.cache) > self.maxsize:
+                self.cache.popitem(last=False)
+
+
+# --------------------------------------------------
+@overload
+def memoize(func: Callable[..., T],
+            *,
+            maxsize: Optional[int] = None,
+            cache_file: Optional[str] = None) -> Memoized[T]:
+    ...
+
+
+@overload
+def memoize(func: None = None,
+            *,
+            maxsize: Optional[int] = None,
+            cache_file: Optional[str] = None) -> Callable[[Callable[..., T]],
+                                                          Memoized[T]]:
+    ...
+
+
+def memoize(
+    func: Optional[Callable[..., T]] = None,
+    *,
+    maxsize: Optional[int] = None,
+    cache_file: Optional[str] = None
+) -> Union[Memoized[T], Callable[[Callable[..., T]], Memoized[T]]]:
+    """
+    Memoize a function of hashable positional arguments, either bare
+    (@memoize) or with options (@memoize(maxsize=128))
+    """
+
+    if func is None:
+        return partial(memoize, maxsize=maxsize, cache_file=cache_file)
+
+    return Memoized(func, maxsize, cache_file)
+
+
+# --------------------------------------------------
+def test_memoize() -> None:
+    """ Test memoize """
+
+    calls = []
+
+    @memoize(maxsize=2)
+    def double(x: int) -> int:
+        calls.append(x)
+        return 2 * x
+
+    assert [double(1), double(2), double(1), double(3)] == [2, 4, 2, 6]
+    assert double.cache_info() == CacheInfo(1, 3, 2, 2)
+
+    # 2 was least recently used, so it was evicted and 1 was kept
+    assert double(1) == 2 and double(2) == 4
+    assert calls == [1, 2, 3, 2]
+    assert getattr(double, '__name__') == 'double'
+
+    double.cache_clear()
+    assert double.cache_info() == CacheInfo(0, 0, 2, 0)
+
+
+# --------------------------------------------------
+def test_warm() -> None:
+    """ Bottom-up filling goes past the recursion limit """
+
+    @memoize
+    def fib(n: int, k: int) -> int:
+        return 1 if n in (1, 2) else fib(n - 2, k) * k + fib(n - 1, k)
+
+    depth = sys.getrecursionlimit() * 4
+    fib.warm((n, 1) for n in range(1, depth))
+    assert fib(depth, 1) == fib(depth - 1, 1) + fib(depth - 2, 1)
+    assert fib(30, 4) == 436390025825
+    assert fib.cache_info().misses == depth + 30
+
+
+# --------------------------------------------------
+def test_cache_file() -> None:
+    """ Cache persists between runs """
+
+    def square(x: int) -> int:
+        return x * x
+
+    with tempfile.TemporaryDirectory() as tmp:
+        cache_file = os.path.join(tmp, 'cache.pkl')
+        first: Memoized[Any] = memoize(square, cache_file=cache_file)
+        assert first(3) == 9
+        first.save()
+
+        second: Memoized[Any] = memoize(square, cache_file=cache_file)
+        assert second(3) == 9
+        assert second.cache_info() == CacheInfo(1, 0, None, 1)
+        atexit.unregister(first.save)
+        atexit.unregister(second.save)
@@ -6,8 +6,9 @@ Purpose: Fibonacci Exercise
 """
 
 import argparse
-from typing import NamedTuple, Callable
+from typing import NamedTuple
 from pathlib import Path
+from memo import memoize
 
 
 class Args(NamedTuple):
@@ -54,20 +55,6 @@ def get_args() -> Args:
     return Args(args.generations, args.litter, args.out_dir)
 
 
-# --------------------------------------------------
-def memoize(f: Callable) -> Callable:
-    """ Memoize a function """
-
-    cache = {}
-
-    def memo(x):
-        if x not in cache:
-            cache[x] = f(x)
-        return cache[x]
-
-    return memo
-
-
 # --------------------------------------------------
 def main() -> None:
     """ Produce number of pairs of rabbits after
@@ -81,15 +68,9 @@ def main() -> None:
     if not Path(out).is_dir():
         Path.mkdir(Path(out))
 
-    # Define fibonacci function internally
-    # Decorate fib with memoize (aka fib = memoize(fib))
-    @memoize
-    def fib(gen):
-        if gen == 1 or gen == 2:
-            return 1
-        return fib(gen-1) + fib(gen-2)*litter
-
-    solution = fib(gen)
+    # Fill the cache from the bottom up so recursion stays shallow
+    fib.warm((g, litter) for g in range(1, gen))
+    solution = fib(gen, litter)
 
     print(solution)
 
@@ -97,6 +78,16 @@ def main() -> None:
         f.write(str(solution))
 
 
+# --------------------------------------------------
+@memoize(maxsize=3)
+def fib(gen: int, litter: int) -> int:
+    """ Pairs of rabbits after gen generations """
+
+    if gen in (1, 2):
+        return 1
+    return fib(gen - 1, litter) + fib(gen - 2, litter) * litter
+
+
 # --------------------------------------------------
 if __name__ == '__main__':
     main()
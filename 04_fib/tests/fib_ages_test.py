@@ -0,0 +1,81 @@
+""" Tests for fib_ages.py """
+
+import os
+import platform
+import random
+import re
+from subprocess import getstatusoutput
+
+PRG = './fib_ages.py'
+RUN = f'python {PRG}' if platform.system() == 'Windows' else PRG
+LESLIE = './tests/inputs/leslie.txt'
+
+
+# --------------------------------------------------
+def test_exists() -> None:
+    """ Program exists """
+
+    assert os.path.isfile(PRG)
+
+
+# --------------------------------------------------
+def test_usage() -> None:
+    """ Usage """
+
+    for arg in ['-h', '--help']:
+        rv, out = getstatusoutput(f'{RUN} {arg}')
+        assert rv == 0
+        assert out.lower().startswith('usage:')
+
+
+# --------------------------------------------------
+def test_bad_lifespan() -> None:
+    """ Dies when lifespan is bad """
+
+    m = random.randint(-10, 0)
+    rv, out = getstatusoutput(f'{RUN} -l {m} 6')
+    assert rv != 0
+    assert out.lower().startswith('usage:')
+    assert re.search(f'lifespan "{m}" must be > 0', out)
+
+
+# --------------------------------------------------
+def test_bad_leslie() -> None:
+    """ Dies when the Leslie rates do not fit together """
+
+    rv, out = getstatusoutput(f'{RUN} -L {PRG} 6')
+    assert rv != 0
+    assert out.lower().startswith('usage:')
+    assert re.search('--leslie', out)
+
+
+# --------------------------------------------------
+def test_mortal() -> None:
+    """ Mortal rabbits """
+
+    for args, expected in [('6 -l 3', '4'), ('6', '4'), ('1 -l 1', '1'),
+                           ('2 -l 1', '0'), ('96 -l 17',
+                                             '51159459138167757395'),
+                           ('5 -k 3 -l 100', '19')]:
+        rv, out = getstatusoutput(f'{RUN} {args}')
+        assert rv == 0
+        assert out == expected
+
+
+# --------------------------------------------------
+def test_mod() -> None:
+    """ Huge generations modulo a number """
+
+    rv, out = getstatusoutput(f'{RUN} -m 1000000007 -k 2 -l 20 '
+                              '1000000000000000000')
+    assert rv == 0
+    assert out == '992814453'
+
+
+# --------------------------------------------------
+def test_leslie() -> None:
+    """ General Leslie rates """
+
+    rv, out = getstatusoutput(f'{RUN} -L {LESLIE} 10')
+    assert rv == 0
+    assert out == '35'
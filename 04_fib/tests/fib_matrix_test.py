@@ -0,0 +1,123 @@
+""" Tests for fib_matrix.py """
+
+import os
+import platform
+import random
+import re
+from subprocess import getstatusoutput
+
+PRG = './fib_matrix.py'
+RUN = f'python {PRG}' if platform.system() == 'Windows' else PRG
+QUERIES = './tests/inputs/queries.txt'
+
+
+# --------------------------------------------------
+def test_exists() -> None:
+    """ Program exists """
+
+    assert os.path.isfile(PRG)
+
+
+# --------------------------------------------------
+def test_usage() -> None:
+    """ Usage """
+
+    for arg in ['-h', '--help']:
+        rv, out = getstatusoutput(f'{RUN} {arg}')
+        assert rv == 0
+        assert out.lower().startswith('usage:')
+
+
+# --------------------------------------------------
+def test_no_args() -> None:
+    """ Dies without a query """
+
+    for args in ['', '5', f'5 3 -f {QUERIES}']:
+        rv, out = getstatusoutput(f'{RUN} {args}')
+        assert rv != 0
+        assert out.lower().startswith('usage:')
+        assert re.search('give either generations and litter or --file', out)
+
+
+# --------------------------------------------------
+def test_bad_generations() -> None:
+    """ Dies when generations is bad """
+
+    n = random.randint(-10, 0)
+    rv, out = getstatusoutput(f'{RUN} -- {n} 3')
+    assert rv != 0
+    assert out.lower().startswith('usage:')
+    assert re.search(f'generations "{n}" must be > 0', out)
+
+
+# --------------------------------------------------
+def test_bad_mod() -> None:
+    """ Dies when modulus is bad """
+
+    m = random.randint(-10, 0)
+    rv, out = getstatusoutput(f'{RUN} -m {m} 5 3')
+    assert rv != 0
+    assert out.lower().startswith('usage:')
+    assert re.search(f'--mod "{m}" must be > 0', out)
+
+
+# --------------------------------------------------
+def test_good_input() -> None:
+    """ Matches fib.py and goes past 40 generations """
+
+    for args, expected in [('5 3', '19'), ('30 4', '436390025825'),
+                           ('29 2', '178956971'), ('1 5', '1'),
+                           ('100 1', '354224848179261915075')]:
+        rv, out = getstatusoutput(f'{RUN} {args}')
+        assert rv == 0
+        assert out == expected
+
+
+# --------------------------------------------------
+def test_mod() -> None:
+    """ Huge generations modulo a number """
+
+    rv, out = getstatusoutput(f'{RUN} -m 1000000007 1000000000000000000 1')
+    assert rv == 0
+    assert out == '209783453'
+
+
+# --------------------------------------------------
+def test_long_output() -> None:
+    """ Prints exact answers with many digits """
+
+    rv, out = getstatusoutput(f'{RUN} 100000 1')
+    assert rv == 0
+    assert len(out) == 20899
+    assert out.startswith('2597406934') and out.endswith('3428746875')
+
+
+# --------------------------------------------------
+def test_file() -> None:
+    """ Answers each query in a file """
+
+    rv, out = getstatusoutput(f'{RUN} --file {QUERIES}')
+    assert rv == 0
+    assert out.splitlines() == ['19', '436390025825', '178956971', '1']
+
+    rv, out = getstatusoutput(f'{RUN} -f {QUERIES} -m 1000')
+    assert rv == 0
+    assert out.splitlines() == ['19', '825', '971', '1']
+
+
+# --------------------------------------------------
+def test_bad_query() -> None:
+    """ Dies on a query that is not two integers """
+
+    bad_file = 'bad_queries.txt'
+    try:
+        for query in ['5 3 1', '5 three', '5.5 3']:
+            with open(bad_file, 'wt', encoding='utf-8') as fh:
+                fh.write(f'5 3\n{query}\n')
+
+            rv, out = getstatusoutput(f'{RUN} -f {bad_file}')
+            assert rv != 0
+            assert out.endswith(f'Bad query "{query}" in {bad_file}')
+    finally:
+        if os.path.isfile(bad_file):
+            os.remove(bad_file)
@@ -4,3 +4,6 @@
 
 PRGS=$(find . -name solution\* | sort | xargs echo | sed "s/ /,/g")
 hyperfine -i --warmup 1 -L prg $PRGS '{prg} seqs.fa'
+
+# Throughput of cgc.py by worker count
+hyperfine -i --warmup 1 -P workers 1 "$(nproc)" './cgc.py -w {workers} seqs.fa'
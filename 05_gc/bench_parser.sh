@@ -0,0 +1,12 @@
+#!/usr/bin/env bash
+
+# Benchmark the FASTA parsers on a large input, e.g.:
+# ./genseq.py -n 200000 -l 10000 -o big.fa && ./bench_parser.sh big.fa
+
+FILE=${1:-big.fa}
+hyperfine -i --warmup 1 \
+    -n SeqIO "./cgc.py $FILE" \
+    -n fastx "./cgc.py --fast-parser $FILE" \
+    -n solution3_SeqIO "./solution3_max_var.py $FILE" \
+    -n solution3_fastx "./solution3_max_var.py --fast-parser $FILE" \
+    -n fasta_parser "./fasta_parser/fasta_parser.py $FILE > /dev/null"
@@ -6,13 +6,32 @@ Purpose: Compute GC content
 """
 
 import argparse
-from typing import NamedTuple, TextIO
+import os
+import stat
+from itertools import chain
+from multiprocessing import Pool
+from typing import (Iterable, Iterator, List, NamedTuple, Optional, TextIO,
+                    Tuple)
 from Bio import SeqIO
+import fastx
+
+GC_BASES = (b'C', b'G', b'c', b'g')
 
 
 class Args(NamedTuple):
     """ Command-line arguments """
     file: TextIO
+    fast_parser: bool
+    mmap: bool
+    workers: int
+    table: bool
+
+
+class Chunk(NamedTuple):
+    """ Byte range of a FASTA file """
+    filename: str
+    start: int
+    end: int
 
 
 # --------------------------------------------------
@@ -29,9 +48,35 @@ def get_args() -> Args:
                         type=argparse.FileType('rt'),
                         nargs='+')
 
+    parser.add_argument('-f',
+                        '--fast-parser',
+                        help='Use the block-scanning FASTA reader',
+                        action='store_true')
+
+    parser.add_argument('-m',
+                        '--mmap',
+                        help='Scan memory-mapped input in constant memory',
+                        action='store_true')
+
+    parser.add_argument('-w',
+                        '--workers',
+                        help='Number of worker processes',
+                        metavar='int',
+                        type=int,
+                        default=1)
+
+    parser.add_argument('-t',
+                        '--table',
+                        help='Print the GC content of every record',
+                        action='store_true')
+
     args = parser.parse_args()
 
-    return Args(args.file)
+    if args.workers < 1:
+        parser.error(f'--workers "{args.workers}" must be > 0')
+
+    return Args(args.file, args.fast_parser, args.mmap, args.workers,
+                args.table)
 
 
 # --------------------------------------------------
@@ -44,21 +89,134 @@ def main() -> None:
     highest_gc_id: str = ""
     highest_gc: float = 0.0
 
-    for file in file_arg:
-        for record in SeqIO.parse(file, 'fasta'):
-            # Protect against dividing by 0 length sequences
-            if len(record.seq) == 0:
+    results: Iterable[Tuple[str, float]]
+    if args.workers > 1:
+        results = parallel_gc(file_arg, args.workers)
+    else:
+        find_gc = mmap_gc if args.mmap else \
+            fastx_gc if args.fast_parser else seqio_gc
+        results = chain.from_iterable(map(find_gc, file_arg))
+
+    for record_id, record_gc in results:
+        if args.table:
+            print(f'{record_id} {record_gc:0.6f}')
+        if record_gc > highest_gc:
+            highest_gc = record_gc
+            highest_gc_id = record_id
+
+    if not args.table:
+        print(f'{highest_gc_id} {highest_gc:0.6f}')  # format to 6 decimals
+
+
+# --------------------------------------------------
+def seqio_gc(file: TextIO) -> Iterator[Tuple[str, float]]:
+    """ GC content of each record using Biopython """
+
+    for record in SeqIO.parse(file, 'fasta'):
+        # Protect against dividing by 0 length sequences
+        if len(record.seq) == 0:
+            continue
+
+        # Protect against lowercase sequences ## necessary?
+        record.seq = record.seq.upper()
+        yield record.id, (100 * (record.count("C") + record.count("G"))
+                          / len(record.seq))
+
+
+# --------------------------------------------------
+def fastx_gc(file: TextIO) -> Iterator[Tuple[str, float]]:
+    """ GC content of each record using the block-scanning reader """
+
+    for record in fastx.read_fasta(file):
+        if record.seq:
+            yield record.id, 100 * count_gc(record.seq) / len(record.seq)
+
+
+# --------------------------------------------------
+def mmap_gc(file: TextIO) -> Iterator[Tuple[str, float]]:
+    """ GC content of each record, counted block by block from a mmap """
+
+    # STDIN and pipes can't be reopened, but reading blocks is just as lean
+    if not has_path(file):
+        return stream_gc(fastx.blocks(fastx.binary(file)))
+
+    return stream_gc(fastx.map_blocks(file.name))
+
+
+# --------------------------------------------------
+def parallel_gc(files: List[TextIO],
+                workers: int) -> Iterator[Tuple[str, float]]:
+    """ GC content of each record, in input order, using a process pool """
+
+    with Pool(workers) as pool:
+        for file in files:
+            # STDIN and pipes can't be split, so they are read serially
+            if not has_path(file):
+                yield from stream_gc(fastx.blocks(fastx.binary(file)))
                 continue
 
-            # Protect against lowercase sequences ## necessary?
-            record.seq = record.seq.upper()
-            record_gc: float = (100 * (record.count("C") + record.count("G"))
-                                / len(record.seq))
-            if record_gc > highest_gc:
-                highest_gc = record_gc
-                highest_gc_id = record.id
+            # Extra chunks per worker even out records of uneven size
+            chunks = [
+                Chunk(file.name, start, end)
+                for start, end in fastx.chunk_ranges(file.name, 4 * workers)
+            ]
+            for results in pool.imap(chunk_gc, chunks):
+                yield from results
+
+
+# --------------------------------------------------
+def chunk_gc(chunk: Chunk) -> List[Tuple[str, float]]:
+    """ GC content of each record in a chunk of a file """
+
+    return list(
+        stream_gc(fastx.read_range(chunk.filename, chunk.start, chunk.end)))
+
+
+# --------------------------------------------------
+def stream_gc(stream: Iterable[bytes]) -> Iterator[Tuple[str, float]]:
+    """ GC content of each record, counted block by block """
+
+    header: Optional[bytes] = None
+    num_gc, length = 0, 0
+
+    for is_header, data in fastx.scan_fasta(stream):
+        if is_header:
+            if header is not None and length:
+                yield fastx.first_word(header.decode()), 100 * num_gc / length
+            header, num_gc, length = data, 0, 0
+        else:
+            seq = data.translate(None, fastx.WHITESPACE)
+            num_gc += count_gc(seq)
+            length += len(seq)
+
+    if header is not None and length:
+        yield fastx.first_word(header.decode()), 100 * num_gc / length
+
+
+# --------------------------------------------------
+def has_path(file: TextIO) -> bool:
+    """ Whether a handle is a regular file that can be reopened by name """
+
+    handle = os.fstat(file.fileno())
+    return (stat.S_ISREG(handle.st_mode) and os.path.isfile(file.name)
+            and os.path.samestat(handle, os.stat(file.name)))
+
+
+# --------------------------------------------------
+def count_gc(seq: bytes) -> int:
+    """ Count G/C in either case without copying the sequence """
+
+    return sum(map(seq.count, GC_BASES))
+
+
+# --------------------------------------------------
+def test_count_gc() -> None:
+    """ Test count_gc """
 
-    print(f'{highest_gc_id} {highest_gc:0.6f}')  # format to 6 decimal points
+    assert count_gc(b'') == 0
+    assert count_gc(b'ATTA') == 0
+    assert count_gc(b'ACGT') == 2
+    assert count_gc(b'acgtGC') == 4
 
 
 # --------------------------------------------------
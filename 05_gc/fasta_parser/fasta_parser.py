@@ -6,12 +6,18 @@ Purpose: Parse FASTA file(s)
 """
 
 import argparse
-from typing import NamedTuple, TextIO
+import mmap
+import os
+from typing import Iterator, NamedTuple, TextIO
+
+BLOCK_SIZE = 1 << 20
+WHITESPACE = b' \t\r\n'
 
 
 class Args(NamedTuple):
     """ Command-line arguments """
     file: list[TextIO]
+    mmap: bool
 
 
 class Seq(NamedTuple):
@@ -34,9 +40,14 @@ def get_args() -> Args:
                         nargs='+',
                         help='FASTA file')
 
+    parser.add_argument('-m',
+                        '--mmap',
+                        help='Extract records from a memory map',
+                        action='store_true')
+
     args = parser.parse_args()
 
-    return Args(args.file)
+    return Args(args.file, args.mmap)
 
 
 # --------------------------------------------------
@@ -49,27 +60,73 @@ def main() -> list[Seq]:
 
     for file in files:
         print(f'file = "{file.name}"')
-
-        with open(file.name, 'r', encoding='utf-8') as f:
-            lines: list[str] = f.readlines()
-            name: str = ''
-            seq: str = ''
-            for line in lines:
-                if line.startswith('>'):
-                    # New header means we're the prev sequence is complete
-                    if name != '':  # protect against adding to seq_list on 1st iteration
-                        seq_list.append(Seq(name, seq))
-                    name = line[1:].strip()
-                    seq = ''
-                else:
-                    seq = seq + line.strip()
-            # Append final sequence (no new header at the end to trigger appending)
-            seq_list.append(Seq(name, seq))
+        seq_list.extend(parse_mmap(file.name) if args.mmap else parse(file))
 
     print(seq_list)
     return seq_list
 
 
+# --------------------------------------------------
+def parse(file: TextIO) -> Iterator[Seq]:
+    """ Parse FASTA line by line """
+
+    name: str = ''
+    seq: list[str] = []
+    for line in file:
+        if line.startswith('>'):
+            # New header means the prev sequence is complete
+            if name != '':  # protect against yielding on 1st iteration
+                yield Seq(name, ''.join(seq))
+            name = line[1:].strip()
+            seq = []
+        else:
+            seq.append(line.strip())
+
+    # Yield final sequence (no new header at the end to trigger yielding),
+    # which is Seq('', ...) for an empty file or one without headers
+    yield Seq(name, ''.join(seq))
+
+
+# --------------------------------------------------
+def parse_mmap(filename: str) -> Iterator[Seq]:
+    """ Parse FASTA by finding record boundaries in a memory map """
+
+    with open(filename, 'rb') as f:
+        # An empty file can't be mapped
+        if os.fstat(f.fileno()).st_size == 0:
+            yield Seq('', '')
+            return
+
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            # nxt is the newline before the next header
+            nxt = -1 if mm[:1] == b'>' else mm.find(b'\n>')
+            if nxt < 0 and mm[:1] != b'>':
+                yield Seq('', read_seq(mm, 0, len(mm)))
+                return
+
+            while True:
+                start = nxt + 1
+                eol = mm.find(b'\n', start)
+                eol = len(mm) if eol < 0 else eol
+                nxt = mm.find(b'\n>', eol)
+                end = len(mm) if nxt < 0 else nxt
+                name = mm[start + 1:eol].decode().strip()
+                yield Seq(name, read_seq(mm, eol + 1, end))
+                if nxt < 0:
+                    break
+
+
+# --------------------------------------------------
+def read_seq(mm: mmap.mmap, start: int, end: int) -> str:
+    """
+    Sequence between two offsets of a map, a block at a time so the raw
+    record with its line endings is never copied whole
+    """
+
+    return ''.join(mm[pos:min(pos + BLOCK_SIZE, end)].translate(
+        None, WHITESPACE).decode() for pos in range(start, end, BLOCK_SIZE))
+
+
 # --------------------------------------------------
 if __name__ == '__main__':
     main()
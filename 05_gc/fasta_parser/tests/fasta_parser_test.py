@@ -60,3 +60,31 @@ def test_good_input1():
 
     assert out == (f'file = "{INPUT1}"\n'
     "[Seq(id='Sequence_A', seq='ATCG'), Seq(id='Sequence_B', seq='CCGGGA'), Seq(id='Sequence_C', seq='TCACTACTACCTGCCCCCCCCCCCCC')]")
+
+
+# --------------------------------------------------
+def test_mmap():
+    """ Memory-mapped mode matches the line parser """
+
+    expected = getstatusoutput(f'{PRG} {INPUT1}')
+    for flag in ['-m', '--mmap']:
+        assert getstatusoutput(f'{PRG} {flag} {INPUT1}') == expected
+
+
+# --------------------------------------------------
+def test_no_headers():
+    """ Empty and headerless files give one Seq without an ID """
+
+    for name, text, seq in [('empty.fa', '', ''),
+                            ('no_headers.fa', 'ACGT\nTT\n', 'ACGTTT')]:
+        try:
+            with open(name, 'wt', encoding='utf-8') as fh:
+                fh.write(text)
+
+            for flag in ['', '-m']:
+                retval, out = getstatusoutput(f'{PRG} {flag} {name}')
+                assert retval == 0
+                assert out.splitlines()[-1] == f"[Seq(id='', seq='{seq}')]"
+        finally:
+            if os.path.isfile(name):
+                os.remove(name)
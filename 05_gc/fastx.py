@@ -0,0 +1,441 @@
+"""
+Author : bcheng <bcheng@localhost>
+Date   : 2026-10-18
+Purpose: Block-scanning FASTA/FASTQ reader
+"""
+
+import io
+import mmap
+import os
+import tempfile
+from itertools import chain
+from typing import (BinaryIO, Iterable, Iterator, List, NamedTuple, TextIO,
+                    Tuple, Union, cast)
+
+BLOCK_SIZE = 1 << 20
+WHITESPACE = b' \t\r\n'
+NEWLINE = ord('\n')
+
+
+class FastxRecord(NamedTuple):
+    """ Sequence record """
+    id: str
+    description: str
+    seq: bytes
+    qual: bytes
+
+
+class TextRecord(NamedTuple):
+    """ Sequence record as text, for code written against SeqIO records """
+    id: str
+    description: str
+    seq: str
+    qual: str
+
+
+# --------------------------------------------------
+def binary(fh: Union[TextIO, BinaryIO]) -> BinaryIO:
+    """ Get the underlying binary handle of a text handle """
+
+    return cast(BinaryIO, getattr(fh, 'buffer', fh))
+
+
+# --------------------------------------------------
+def blocks(fh: BinaryIO, block_size: int = BLOCK_SIZE) -> Iterator[bytes]:
+    """ Read a file in large blocks """
+
+    while block := fh.read(block_size):
+        yield block
+
+
+# --------------------------------------------------
+def read_fastx(fh: Union[TextIO, BinaryIO],
+               block_size: int = BLOCK_SIZE) -> Iterator[FastxRecord]:
+    """ Read FASTA or FASTQ, guessing from the first character """
+
+    stream = blocks(binary(fh), block_size)
+    first = next(stream, b'')
+    stream = chain([first], stream)
+
+    if first.lstrip()[:1] == b'@':
+        return parse_fastq(stream)
+
+    return parse_fasta(stream)
+
+
+# --------------------------------------------------
+def read_fasta(fh: Union[TextIO, BinaryIO],
+               block_size: int = BLOCK_SIZE) -> Iterator[FastxRecord]:
+    """ Read FASTA records """
+
+    return parse_fasta(blocks(binary(fh), block_size))
+
+
+# --------------------------------------------------
+def read_fastq(fh: Union[TextIO, BinaryIO],
+               block_size: int = BLOCK_SIZE) -> Iterator[FastxRecord]:
+    """ Read FASTQ records """
+
+    return parse_fastq(blocks(binary(fh), block_size))
+
+
+# --------------------------------------------------
+def parse(fh: Union[TextIO, BinaryIO],
+          file_format: str,
+          block_size: int = BLOCK_SIZE) -> Iterator[TextRecord]:
+    """ Read "fasta" or "fastq" like SeqIO.parse, with text sequences """
+
+    readers = {'fasta': read_fasta, 'fastq': read_fastq}
+    if file_format not in readers:
+        raise ValueError(f'Unknown format "{file_format}"')
+
+    for rec in readers[file_format](fh, block_size):
+        yield TextRecord(rec.id, rec.description, rec.seq.decode(),
+                         rec.qual.decode())
+
+
+# --------------------------------------------------
+def write(rec: TextRecord, fh: TextIO, file_format: str) -> None:
+    """ Write "fasta", "fasta-2line" or "fastq" as SeqIO.write does """
+
+    if file_format == 'fastq':
+        if len(rec.qual) != len(rec.seq):
+            raise ValueError(f'No quality scores for "{rec.id}"')
+        fh.write(f'@{rec.description}\n{rec.seq}\n+\n{rec.qual}\n')
+    elif file_format == 'fasta-2line':
+        fh.write(f'>{rec.description}\n{rec.seq}\n')
+    elif file_format == 'fasta':
+        # SeqIO wraps FASTA at 60 columns
+        lines = [rec.seq[i:i + 60] for i in range(0, len(rec.seq), 60)]
+        fh.write('\n'.join([f'>{rec.description}'] + lines) + '\n')
+    else:
+        raise ValueError(f'Unknown format "{file_format}"')
+
+
+# --------------------------------------------------
+def map_blocks(filename: str, block_size: int = BLOCK_SIZE) -> Iterator[bytes]:
+    """ Read a file through a memory map, releasing pages already read """
+
+    # madvise needs page-aligned offsets
+    block_size = max(block_size - block_size % mmap.PAGESIZE, mmap.PAGESIZE)
+
+    with open(filename, 'rb') as fh:
+        if os.fstat(fh.fileno()).st_size == 0:
+            return
+
+        with mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            advise(mm, 'MADV_SEQUENTIAL', 0, len(mm))
+            for pos in range(0, len(mm), block_size):
+                yield mm[pos:pos + block_size]
+                advise(mm, 'MADV_DONTNEED', pos,
+                       min(block_size, len(mm) - pos))
+
+
+# --------------------------------------------------
+def read_range(filename: str,
+               start: int,
+               end: int,
+               block_size: int = BLOCK_SIZE) -> Iterator[bytes]:
+    """ Read the bytes of a file from start up to end in blocks """
+
+    with open(filename, 'rb') as fh:
+        fh.seek(start)
+        remaining = end - start
+        while remaining > 0 and (block := fh.read(min(block_size,
+                                                      remaining))):
+            remaining -= len(block)
+            yield block
+
+
+# --------------------------------------------------
+def chunk_ranges(filename: str, num_chunks: int) -> List[Tuple[int, int]]:
+    """ Split a FASTA file into byte ranges starting on record boundaries """
+
+    size = os.path.getsize(filename)
+    starts = [0]
+    with open(filename, 'rb') as fh:
+        for i in range(1, num_chunks):
+            pos = record_start(fh, max(size * i // num_chunks, starts[-1]))
+            if pos >= size:
+                break
+            if pos > starts[-1]:
+                starts.append(pos)
+
+    return list(zip(starts, starts[1:] + [size]))
+
+
+# --------------------------------------------------
+def record_start(fh: BinaryIO, pos: int) -> int:
+    """ Find the offset of the first header at or after a position """
+
+    if pos == 0:
+        return 0
+
+    # Start one byte early to catch a header right at pos
+    fh.seek(pos - 1)
+    offset, tail = pos - 1, b''
+    while block := fh.read(BLOCK_SIZE):
+        data = tail + block
+        if (found := data.find(b'\n>')) >= 0:
+            return offset + found + 1
+        offset, tail = offset + len(data) - 1, data[-1:]
+
+    return offset + len(tail)
+
+
+# --------------------------------------------------
+def advise(mm: mmap.mmap, option: str, start: int, length: int) -> None:
+    """ Give the kernel a paging hint where the platform supports it """
+
+    if hasattr(mm, 'madvise') and hasattr(mmap, option):
+        mm.madvise(getattr(mmap, option), start, length)
+
+
+# --------------------------------------------------
+def scan_fasta(stream: Iterable[bytes]) -> Iterator[Tuple[bool, bytes]]:
+    """
+    Scan FASTA blocks into (True, header) and (False, sequence chunk)
+    events; chunks still contain line endings
+    """
+
+    carry = b''
+    in_header, line_start = False, True
+
+    for block in stream:
+        data = carry + block if carry else block
+        carry = b''
+        if not in_header and line_start and data[:1] == b'>':
+            in_header = True
+
+        pos = 0
+        while pos < len(data):
+            if in_header:
+                # Headers are short, so carry a partial one to the next block
+                end = data.find(b'\n', pos)
+                if end < 0:
+                    carry = data[pos:]
+                    break
+
+                yield True, data[pos + 1:end]
+                pos, in_header = end + 1, False
+            else:
+                # Sequence lines are only sliced, never carried; a
+                # one-byte find is much faster than looking for "\n>"
+                nxt = data.find(b'>', max(pos, 1))
+                while nxt > 0 and data[nxt - 1] != NEWLINE:
+                    nxt = data.find(b'>', nxt + 1)
+
+                if nxt < 0:
+                    yield False, data[pos:]
+                    break
+
+                yield False, data[pos:nxt]
+                pos, in_header = nxt, True
+
+        line_start = data.endswith(b'\n')
+
+    if carry:
+        yield True, carry[1:]
+
+
+# --------------------------------------------------
+def parse_fasta(stream: Iterable[bytes]) -> Iterator[FastxRecord]:
+    """ Parse FASTA from blocks of bytes """
+
+    # Whole records are split out of each block at once, which is much
+    # faster than stepping through scan_fasta events for short reads. Only
+    # the last, unfinished record is kept, as chunks, so a long one costs
+    # no more than one join.
+    pending: List[bytes] = []
+    in_record, line_start = False, True
+
+    for block in stream:
+        # A header may start right at the top of the block
+        pieces = (b'\n' + block if line_start and block[:1] == b'>' else
+                  block).split(b'\n>')
+        line_start = block.endswith(b'\n')
+        pending.append(pieces[0])
+        if len(pieces) == 1:
+            continue
+
+        # Any text before the first header is dropped
+        if in_record:
+            yield make_record(b''.join(pending))
+        for piece in pieces[1:-1]:
+            yield make_record(piece)
+        pending, in_record = [pieces[-1]], True
+
+    if in_record:
+        yield make_record(b''.join(pending))
+
+
+# --------------------------------------------------
+def parse_fastq(stream: Iterable[bytes]) -> Iterator[FastxRecord]:
+    """ Parse four-line FASTQ from blocks of bytes """
+
+    lines = split_lines(stream)
+    for header in lines:
+        if not header.strip():
+            continue
+
+        if header[:1] != b'@':
+            raise ValueError(f'Bad FASTQ header "{header.decode()}"')
+
+        seq = next(lines, b'').rstrip()
+        next(lines, b'')
+        qual = next(lines, b'').rstrip()
+        if len(seq) != len(qual):
+            raise ValueError(f'Bad FASTQ record "{header.decode()}"')
+
+        desc = header[1:].rstrip().decode()
+        yield FastxRecord(first_word(desc), desc, seq, qual)
+
+
+# --------------------------------------------------
+def split_lines(stream: Iterable[bytes]) -> Iterator[bytes]:
+    """ Split blocks of bytes into lines """
+
+    tail = b''
+    for block in stream:
+        lines = (tail + block).split(b'\n')
+        tail = lines.pop()
+        yield from lines
+
+    if tail:
+        yield tail
+
+
+# --------------------------------------------------
+def make_record(text: bytes) -> FastxRecord:
+    """ Make a record from the text of a FASTA record after its ">" """
+
+    header, _, lines = text.partition(b'\n')
+    desc = header.rstrip().decode()
+    seq = lines.replace(b'\n', b'')
+    if b'\r' in seq or b' ' in seq or b'\t' in seq:
+        seq = seq.translate(None, WHITESPACE)
+    return FastxRecord(first_word(desc), desc, seq, b'')
+
+
+# --------------------------------------------------
+def first_word(text: str) -> str:
+    """ Return the first word of a string """
+
+    words = text.split(maxsplit=1)
+    return words[0] if words else ''
+
+
+# --------------------------------------------------
+def test_parse_fasta() -> None:
+    """ Test parse_fasta """
+
+    assert not list(parse_fasta([]))
+    assert not list(parse_fasta([b'no header\n']))
+
+    text = b'>SEQ0 first one\nAC\nGT\n>SEQ1\n\n>SEQ2\r\nTT\r\nAA'
+    expected = [
+        FastxRecord('SEQ0', 'SEQ0 first one', b'ACGT', b''),
+        FastxRecord('SEQ1', 'SEQ1', b'', b''),
+        FastxRecord('SEQ2', 'SEQ2', b'TTAA', b''),
+    ]
+
+    # Every block size must split records identically
+    for size in range(1, len(text) + 1):
+        chunked = [text[i:i + size] for i in range(0, len(text), size)]
+        assert list(parse_fasta(chunked)) == expected
+
+    assert list(parse_fasta([b'>SEQ0'])) == [
+        FastxRecord('SEQ0', 'SEQ0', b'', b'')
+    ]
+
+
+# --------------------------------------------------
+def test_parse_fastq() -> None:
+    """ Test parse_fastq """
+
+    text = b'@R1 x\nACGT\n+\nIIII\n@R2\nAA\n+R2\n#I\n'
+    expected = [
+        FastxRecord('R1', 'R1 x', b'ACGT', b'IIII'),
+        FastxRecord('R2', 'R2', b'AA', b'#I'),
+    ]
+
+    for size in range(1, len(text) + 1):
+        chunked = [text[i:i + size] for i in range(0, len(text), size)]
+        assert list(parse_fastq(chunked)) == expected
+
+
+# --------------------------------------------------
+def test_read_fastx() -> None:
+    """ Test read_fastx """
+
+    fasta = io.BytesIO(b'>A\nCG\n')
+    assert list(read_fastx(fasta)) == [FastxRecord('A', 'A', b'CG', b'')]
+
+    fastq = io.TextIOWrapper(io.BytesIO(b'@A\nCG\n+\nII\n'))
+    assert list(read_fastx(fastq)) == [FastxRecord('A', 'A', b'CG', b'II')]
+
+    assert not list(read_fastx(io.BytesIO(b'')))
+
+
+# --------------------------------------------------
+def test_parse() -> None:
+    """ Test parse """
+
+    fastq = io.TextIOWrapper(io.BytesIO(b'@A x\nCG\n+\nII\n'))
+    assert list(parse(fastq, 'fastq')) == [TextRecord('A', 'A x', 'CG', 'II')]
+    assert list(parse(io.BytesIO(b'>B\nAC\nGT\n'), 'fasta')) == [
+        TextRecord('B', 'B', 'ACGT', '')
+    ]
+
+
+# --------------------------------------------------
+def test_write() -> None:
+    """ Test write """
+
+    def formatted(rec: TextRecord, file_format: str) -> str:
+        out = io.StringIO()
+        write(rec, out, file_format)
+        return out.getvalue()
+
+    rec = TextRecord('A', 'A x', 'AC' * 40, 'I' * 80)
+    assert formatted(rec, 'fasta') == f'>A x\n{"AC" * 30}\n{"AC" * 10}\n'
+    assert formatted(rec, 'fasta-2line') == f'>A x\n{"AC" * 40}\n'
+    assert formatted(rec, 'fastq') == f'@A x\n{"AC" * 40}\n+\n{"I" * 80}\n'
+    assert formatted(TextRecord('B', 'B', '', ''), 'fasta') == '>B\n'
+
+
+# --------------------------------------------------
+def test_map_blocks() -> None:
+    """ Test map_blocks """
+
+    with tempfile.NamedTemporaryFile() as tmp:
+        assert not list(map_blocks(tmp.name))
+
+        data = b'>A\n' + b'ACGT' * mmap.PAGESIZE
+        tmp.write(data)
+        tmp.flush()
+        assert b''.join(map_blocks(tmp.name, 1)) == data
+        assert list(parse_fasta(map_blocks(tmp.name))) == [
+            FastxRecord('A', 'A', b'ACGT' * mmap.PAGESIZE, b'')
+        ]
+
+
+# --------------------------------------------------
+def test_chunk_ranges() -> None:
+    """ Test chunk_ranges """
+
+    with tempfile.NamedTemporaryFile() as tmp:
+        data = b'>A\nAC\n>B\nGT\nTT\n>C x\n\n>D\nA'
+        tmp.write(data)
+        tmp.flush()
+
+        assert chunk_ranges(tmp.name, 1) == [(0, len(data))]
+        for num in range(2, len(data) + 2):
+            ranges = chunk_ranges(tmp.name, num)
+            assert ranges[0][0] == 0 and ranges[-1][1] == len(data)
+            assert all(data[start:start + 1] == b'>' for start, _ in ranges)
+            assert all(end == nxt for (_, end), (nxt, _) in zip(
+                ranges, ranges[1:]))
+        assert len(chunk_ranges(tmp.name, 100)) == 4
+
+        assert b''.join(read_range(tmp.name, 3, 10, 2)) == data[3:10]
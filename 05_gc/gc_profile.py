@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+"""
+Author : bcheng <bcheng@localhost>
+Date   : 2026-10-18
+Purpose: Sliding-window GC content and skew
+"""
+
+import argparse
+import sys
+from itertools import groupby
+from operator import itemgetter
+from typing import Iterable, Iterator, List, NamedTuple, TextIO, Tuple
+import numpy as np
+import fastx
+
+UPPER = bytes.maketrans(b'acgtn', b'ACGTN')
+
+
+class Args(NamedTuple):
+    """ Command-line arguments """
+    files: List[TextIO]
+    window: int
+    step: int
+    outfile: TextIO
+
+
+class Window(NamedTuple):
+    """ GC counts in one window """
+    start: int
+    end: int
+    gc: float
+    skew: float
+
+
+# --------------------------------------------------
+def get_args() -> Args:
+    """ Get command-line arguments """
+
+    parser = argparse.ArgumentParser(
+        description='Sliding-window GC content and skew',
+        formatter_class=argparse.ArgumentDefaultsHelpFormatter)
+
+    parser.add_argument('file',
+                        metavar='FILE',
+                        help='Input FASTA file(s)',
+                        type=argparse.FileType('rt'),
+                        nargs='+')
+
+    parser.add_argument('-w',
+                        '--window',
+                        help='Window size',
+                        metavar='int',
+                        type=int,
+                        default=1000)
+
+    parser.add_argument('-s',
+                        '--step',
+                        help='Step between window starts',
+                        metavar='int',
+                        type=int,
+                        default=1000)
+
+    parser.add_argument('-o',
+                        '--outfile',
+                        help='Output BED file',
+                        metavar='FILE',
+                        type=argparse.FileType('wt'),
+                        default=sys.stdout)
+
+    args = parser.parse_args()
+
+    if args.window < 1:
+        parser.error(f'--window "{args.window}" must be > 0')
+
+    if args.step < 1:
+        parser.error(f'--step "{args.step}" must be > 0')
+
+    return Args(args.file, args.window, args.step, args.outfile)
+
+
+# --------------------------------------------------
+def main() -> None:
+    """ Print chrom/start/end/GC/skew rows for every full window """
+
+    args = get_args()
+
+    for fh in args.files:
+        for name, chunks in records(fh):
+            for win in profile(chunks, args.window, args.step):
+                print(f'{name}\t{win.start}\t{win.end}\t{win.gc:.4f}\t'
+                      f'{win.skew:.4f}',
+                      file=args.outfile)
+
+
+# --------------------------------------------------
+def records(fh: TextIO) -> Iterator[Tuple[str, Iterator[bytes]]]:
+    """ Stream each FASTA record as its name and sequence chunks """
+
+    name = None
+    events = fastx.scan_fasta(fastx.blocks(fastx.binary(fh)))
+    for is_header, group in groupby(events, key=itemgetter(0)):
+        if is_header:
+            # Only the last of consecutive headers can have sequence
+            *_, (_, header) = group
+            name = fastx.first_word(header.decode())
+        elif name is not None:
+            yield name, (data.translate(UPPER, fastx.WHITESPACE)
+                         for _, data in group)
+
+
+# --------------------------------------------------
+def profile(chunks: Iterable[bytes], window: int,
+            step: int) -> Iterator[Window]:
+    """ GC fraction and skew of each full window over streamed sequence """
+
+    # Running G/C totals at each position still needed, starting at offset
+    cum_g = np.zeros(1, dtype=np.int64)
+    cum_c = np.zeros(1, dtype=np.int64)
+    offset, next_start = 0, 0
+
+    for chunk in chunks:
+        seq = np.frombuffer(chunk, dtype=np.uint8)
+        cum_g = np.concatenate([cum_g, cum_g[-1] + np.cumsum(seq == 71)])
+        cum_c = np.concatenate([cum_c, cum_c[-1] + np.cumsum(seq == 67)])
+
+        # Window starts relative to offset with the whole window in hand
+        starts = np.arange(next_start - offset, len(cum_g) - window, step)
+        if len(starts):
+            yield from windows(starts, cum_g, cum_c, offset, window)
+            next_start = offset + int(starts[-1]) + step
+
+        # Keep only the counts from the next window start on
+        drop = min(next_start - offset, len(cum_g) - 1)
+        cum_g, cum_c, offset = cum_g[drop:], cum_c[drop:], offset + drop
+
+
+# --------------------------------------------------
+def windows(starts: np.ndarray, cum_g: np.ndarray, cum_c: np.ndarray,
+            offset: int, window: int) -> Iterator[Window]:
+    """ Windows from differences of running G/C totals """
+
+    num_g = cum_g[starts + window] - cum_g[starts]
+    num_c = cum_c[starts + window] - cum_c[starts]
+    num_gc = num_g + num_c
+    skew = np.divide(num_g - num_c,
+                     num_gc,
+                     out=np.zeros(len(starts)),
+                     where=num_gc > 0)
+
+    for start, gc, sk in zip((starts + offset).tolist(),
+                             (num_gc / window).tolist(), skew.tolist()):
+        yield Window(start, start + window, gc, sk)
+
+
+# --------------------------------------------------
+def test_profile() -> None:
+    """ Test profile """
+
+    assert not list(profile([], 2, 1))
+    assert not list(profile([b'GC'], 3, 1))
+    assert list(profile([b'GGCA'], 2, 2)) == [
+        Window(0, 2, 1.0, 1.0),
+        Window(2, 4, 0.5, -1.0),
+    ]
+
+    # Chunking and overlapping or gapped steps must not change the windows
+    seq = b'GATTACAGGGCCCATGCNNGCGC'
+    for window in range(1, 8):
+        for step in range(1, 10):
+            expected = [
+                Window(i, i + window,
+                       (seq[i:i + window].count(b'G') +
+                        seq[i:i + window].count(b'C')) / window, 0.)
+                for i in range(0, len(seq) - window + 1, step)
+            ]
+            for size in [1, 3, len(seq)]:
+                chunks = [seq[i:i + size] for i in range(0, len(seq), size)]
+                got = list(profile(chunks, window, step))
+                assert [w._replace(skew=0.) for w in got] == expected
+
+
+# --------------------------------------------------
+if __name__ == '__main__':
+    main()
@@ -1,18 +1,42 @@
 #!/usr/bin/env python3
-""" Generate long sequence """
+""" Generate long sequences """
 
 import argparse
-import numpy as np
+import os
 import random
-from typing import NamedTuple, TextIO
+import stat
+from functools import partial
+from multiprocessing import Pool
+from typing import BinaryIO, List, NamedTuple, Optional
+import numpy as np
+
+BATCH_BASES = 1 << 22
 
 
 class Args(NamedTuple):
     """ Command-line arguments """
+    motif_len: int
     seq_len: int
     num_seqs: int
     sigma: float
-    out_file: TextIO
+    dist: str
+    gc: float
+    file_format: str
+    seed: Optional[int]
+    workers: int
+    out_file: BinaryIO
+
+
+class Params(NamedTuple):
+    """ Everything needed to build any one batch of records """
+    seed: int
+    num_seqs: int
+    seq_len: int
+    sigma: float
+    dist: str
+    table: bytes
+    file_format: str
+    motif: bytes
 
 
 # --------------------------------------------------
@@ -20,9 +44,16 @@ def get_args() -> Args:
     """ Get command-line arguments """
 
     parser = argparse.ArgumentParser(
-        description='Generate long sequence',
+        description='Generate long sequences',
         formatter_class=argparse.ArgumentDefaultsHelpFormatter)
 
+    parser.add_argument('-m',
+                        '--motif_len',
+                        help='Common motif length',
+                        metavar='int',
+                        type=int,
+                        default=0)
+
     parser.add_argument('-l',
                         '--len',
                         help='Average sequence length',
@@ -44,16 +75,63 @@ def get_args() -> Args:
                         type=float,
                         default=0.1)
 
+    parser.add_argument('-d',
+                        '--dist',
+                        help='Length distribution (uniform is len +/- sigma)',
+                        metavar='dist',
+                        type=str,
+                        choices=['normal', 'uniform'],
+                        default='normal')
+
+    parser.add_argument('-g',
+                        '--gc',
+                        help='GC content',
+                        metavar='float',
+                        type=float,
+                        default=0.5)
+
+    parser.add_argument('-f',
+                        '--format',
+                        help='Output file format',
+                        metavar='format',
+                        type=str,
+                        choices=['txt', 'fasta', 'fastq'],
+                        default='fasta')
+
+    parser.add_argument('-r',
+                        '--seed',
+                        help='Random seed value',
+                        metavar='seed',
+                        type=int,
+                        default=None)
+
+    parser.add_argument('-w',
+                        '--workers',
+                        help='Number of worker processes',
+                        metavar='int',
+                        type=int,
+                        default=1)
+
     parser.add_argument('-o',
                         '--outfile',
                         help='Output file',
                         metavar='FILE',
-                        type=argparse.FileType('wt'),
+                        type=argparse.FileType('wb'),
                         default='seqs.fa')
 
     args = parser.parse_args()
 
-    return Args(args.len, args.num, args.sigma, args.outfile)
+    if not 0 <= args.gc <= 1:
+        parser.error(f'--gc "{args.gc}" must be between 0 and 1')
+
+    if args.motif_len < 0:
+        parser.error(f'--motif_len "{args.motif_len}" must be >= 0')
+
+    if args.workers < 1:
+        parser.error(f'--workers "{args.workers}" must be > 0')
+
+    return Args(args.motif_len, args.len, args.num, args.sigma, args.dist,
+                args.gc, args.format, args.seed, args.workers, args.outfile)
 
 
 # --------------------------------------------------
@@ -61,15 +139,215 @@ def main() -> None:
     """ Make a jazz noise here """
 
     args = get_args()
-    for i in range(args.num_seqs):
-        seq_len = int(np.random.normal(args.seq_len, args.sigma))
-        seq = ''.join([random.choice('ACGT') for _ in range(seq_len)])
-        args.out_file.write(f'>SEQ{i}\n{seq}\n')
+    seed = random.getrandbits(64) if args.seed is None else args.seed
+    table = gc_table(args.gc)
+    motif = np.random.default_rng(seed).bytes(args.motif_len).translate(table)
+    if motif:
+        print(f'Common motif is "{motif.decode()}".')
+
+    params = Params(seed=seed,
+                    num_seqs=args.num_seqs,
+                    seq_len=args.seq_len,
+                    sigma=args.sigma,
+                    dist=args.dist,
+                    table=table,
+                    file_format=args.file_format,
+                    motif=motif)
+
+    batches = range(num_batches(params))
+    if args.workers == 1:
+        for batch in batches:
+            args.out_file.write(make_batch(params, batch))
+    elif has_path(args.out_file):
+        write_parallel(params, args.out_file, args.workers)
+    else:
+        with Pool(args.workers) as pool:
+            for data in pool.imap(partial(make_batch, params), batches):
+                args.out_file.write(data)
 
     print(f'Wrote {args.num_seqs:,} sequences of avg length {args.seq_len:,} '
           f'to "{args.out_file.name}".')
 
 
+# --------------------------------------------------
+def has_path(fh: BinaryIO) -> bool:
+    """ Whether a handle is a regular file that workers can reopen by name """
+
+    handle = os.fstat(fh.fileno())
+    return (stat.S_ISREG(handle.st_mode) and os.path.isfile(fh.name)
+            and os.path.samestat(handle, os.stat(fh.name)))
+
+
+# --------------------------------------------------
+def write_parallel(params: Params, fh: BinaryIO, workers: int) -> None:
+    """ Workers write their batches straight into place in the file """
+
+    # Lengths are cheap to draw, so every batch's offset is known up front
+    fh.flush()
+    sizes = [batch_size(params, batch) for batch in range(num_batches(params))]
+    offsets = (fh.tell() + np.cumsum([0] + sizes)).tolist()
+    fh.truncate(offsets[-1])
+
+    write = partial(write_batch, params, fh.name)
+    with Pool(workers) as pool:
+        pool.starmap(write, enumerate(offsets[:-1]))
+
+    fh.seek(offsets[-1])
+
+
+# --------------------------------------------------
+def write_batch(params: Params, filename: str, batch: int,
+                offset: int) -> None:
+    """ Write one batch at its offset """
+
+    with open(filename, 'r+b') as fh:
+        fh.seek(offset)
+        fh.write(make_batch(params, batch))
+
+
+# --------------------------------------------------
+def gc_table(gc: float) -> bytes:
+    """ Translation table from random bytes to bases with the GC content """
+
+    # Random bytes are uniform, so GC is quantized to steps of 1/256
+    num_gc = round(gc * 256)
+    return bytes(b'CG'[i % 2] if i < num_gc else b'AT'[i % 2]
+                 for i in range(256))
+
+
+# --------------------------------------------------
+def num_batches(params: Params) -> int:
+    """ Number of batches needed for all the sequences """
+
+    return -(-params.num_seqs // batch_seqs(params))
+
+
+# --------------------------------------------------
+def batch_seqs(params: Params) -> int:
+    """ Sequences per batch, about BATCH_BASES bases whatever the workers """
+
+    return max(1, BATCH_BASES // max(1, params.seq_len))
+
+
+# --------------------------------------------------
+def batch_rng(params: Params, batch: int) -> np.random.Generator:
+    """ Each batch has its own random stream so batches are independent """
+
+    return np.random.default_rng([batch, params.seed])
+
+
+# --------------------------------------------------
+def batch_lengths(params: Params, batch: int,
+                  rng: np.random.Generator) -> List[int]:
+    """ Draw the lengths of the sequences in a batch """
+
+    first = batch * batch_seqs(params)
+    size = min(batch_seqs(params), params.num_seqs - first)
+    if params.dist == 'uniform':
+        lengths = rng.uniform(params.seq_len - params.sigma,
+                              params.seq_len + params.sigma, size)
+    else:
+        lengths = rng.normal(params.seq_len, params.sigma, size)
+
+    # Every sequence is long enough to hold the motif
+    return np.maximum(lengths, len(params.motif)).astype(int).tolist()
+
+
+# --------------------------------------------------
+def make_batch(params: Params, batch: int) -> bytes:
+    """ Format a batch of records, the same for any number of workers """
+
+    rng = batch_rng(params, batch)
+    lengths = batch_lengths(params, batch, rng)
+
+    # One draw and one translate for the whole batch
+    bases = rng.bytes(sum(lengths)).translate(params.table)
+    motif_at = rng.integers(0, np.array(lengths) - len(params.motif) + 1)
+    first, pos, recs = batch * batch_seqs(params), 0, []
+    for i, (seq_len, at) in enumerate(zip(lengths, motif_at.tolist()),
+                                      start=first):
+        seq, pos = bases[pos:pos + seq_len], pos + seq_len
+        seq = seq[:at] + params.motif + seq[at + len(params.motif):]
+        if params.file_format == 'fastq':
+            recs.append(b'@SEQ%d\n%s\n+\n%s\n' % (i, seq, b'I' * seq_len))
+        elif params.file_format == 'fasta':
+            recs.append(b'>SEQ%d\n%s\n' % (i, seq))
+        else:
+            recs.append(seq + b'\n')
+
+    return b''.join(recs)
+
+
+# --------------------------------------------------
+def batch_size(params: Params, batch: int) -> int:
+    """ Number of bytes make_batch will return """
+
+    lengths = batch_lengths(params, batch, batch_rng(params, batch))
+    first = batch * batch_seqs(params)
+    if params.file_format == 'txt':
+        return sum(lengths) + len(lengths)
+
+    names = sum(len(b'SEQ%d' % i) for i in range(first, first + len(lengths)))
+    if params.file_format == 'fastq':
+        return names + 2 * sum(lengths) + 6 * len(lengths)
+    return names + sum(lengths) + 3 * len(lengths)
+
+
+# --------------------------------------------------
+def test_gc_table() -> None:
+    """ Test gc_table """
+
+    assert gc_table(0).count(b'A') == gc_table(0).count(b'T') == 128
+    assert gc_table(1).count(b'C') == gc_table(1).count(b'G') == 128
+    assert sorted(gc_table(.25)) == sorted(b'C' * 32 + b'G' * 32 +
+                                           b'A' * 96 + b'T' * 96)
+
+
+# --------------------------------------------------
+def test_make_batch() -> None:
+    """ Test make_batch """
+
+    params = Params(seed=1, num_seqs=5, seq_len=10, sigma=0., dist='normal',
+                    table=gc_table(.5), file_format='fasta',
+                    motif=b'')
+    assert make_batch(params, 0) == make_batch(params, 0)
+    assert make_batch(params, 0) != make_batch(params._replace(seed=2), 0)
+
+    recs = make_batch(params, 0).split(b'\n')
+    assert recs[0::2] == [b'>SEQ%d' % i for i in range(5)] + [b'']
+    seq = recs[1]
+    assert len(seq) == 10 and set(seq) <= set(b'ACGT')
+
+    fastq = make_batch(params._replace(file_format='fastq'), 0).split(b'\n')
+    assert fastq[:4] == [b'@SEQ0', seq, b'+', b'I' * 10]
+    txt = make_batch(params._replace(file_format='txt'), 0)
+    assert txt.split(b'\n') == recs[1::2] + [b'']
+
+    # A negative drawn length gives an empty sequence
+    assert make_batch(params._replace(seq_len=-5, file_format='txt'),
+                      0) == b'\n' * 5
+
+    # Each sequence holds the motif, even if drawn shorter than it
+    for seq_len in [0, 7, 10]:
+        motifs = params._replace(seq_len=seq_len, file_format='txt',
+                                 motif=b'GATTACA')
+        seqs = make_batch(motifs, 0).split()
+        assert len(seqs) == 5
+        assert all(b'GATTACA' in seq for seq in seqs)
+
+
+# --------------------------------------------------
+def test_batch_size() -> None:
+    """ Test batch_size """
+
+    for file_format in ['txt', 'fasta', 'fastq']:
+        params = Params(seed=3, num_seqs=25, seq_len=BATCH_BASES // 10,
+                        sigma=100., dist='uniform', table=gc_table(.4),
+                        file_format=file_format, motif=b'GATTACA')
+        for batch in range(num_batches(params)):
+            assert batch_size(params, batch) == len(make_batch(params, batch))
+
+
 # --------------------------------------------------
 if __name__ == '__main__':
     main()
@@ -5,11 +5,13 @@ import argparse
 import sys
 from typing import NamedTuple, TextIO, List, Tuple
 from Bio import SeqIO
+import fastx
 
 
 class Args(NamedTuple):
     """ Command-line arguments """
     file: TextIO
+    fast_parser: bool
 
 
 # --------------------------------------------------
@@ -27,9 +29,14 @@ def get_args() -> Args:
                         default=sys.stdin,
                         help='Input sequence file')
 
+    parser.add_argument('-f',
+                        '--fast-parser',
+                        help='Use the block-scanning FASTA reader',
+                        action='store_true')
+
     args = parser.parse_args()
 
-    return Args(args.file)
+    return Args(args.file, args.fast_parser)
 
 
 # --------------------------------------------------
@@ -37,9 +44,10 @@ def main() -> None:
     """ Make a jazz noise here """
 
     args = get_args()
+    parse = fastx.parse if args.fast_parser else SeqIO.parse
     seqs: List[Tuple[float, str]] = []
 
-    for rec in SeqIO.parse(args.file, 'fasta'):
+    for rec in parse(args.file, 'fasta'):
         # Iterate each base and compare to G or C, add 1 to counter
         gc = 0
         for base in rec.seq.upper():
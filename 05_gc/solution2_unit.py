@@ -5,11 +5,13 @@ import argparse
 import sys
 from typing import NamedTuple, TextIO, List
 from Bio import SeqIO
+import fastx
 
 
 class Args(NamedTuple):
     """ Command-line arguments """
     file: TextIO
+    fast_parser: bool
 
 
 class MySeq(NamedTuple):
@@ -33,9 +35,14 @@ def get_args() -> Args:
                         default=sys.stdin,
                         help='Input sequence file')
 
+    parser.add_argument('-f',
+                        '--fast-parser',
+                        help='Use the block-scanning FASTA reader',
+                        action='store_true')
+
     args = parser.parse_args()
 
-    return Args(args.file)
+    return Args(args.file, args.fast_parser)
 
 
 # --------------------------------------------------
@@ -43,9 +50,10 @@ def main() -> None:
     """ Make a jazz noise here """
 
     args = get_args()
+    parse = fastx.parse if args.fast_parser else SeqIO.parse
     seqs: List[MySeq] = []
 
-    for rec in SeqIO.parse(args.file, 'fasta'):
+    for rec in parse(args.file, 'fasta'):
         seqs.append(MySeq(find_gc(rec.seq), rec.id))
 
     high = max(seqs)
@@ -8,11 +8,13 @@ from typing import NamedTuple, TextIO
 from Bio import SeqIO
 from Bio.Seq import Seq
 from Bio.SeqRecord import SeqRecord
+import fastx
 
 
 class Args(NamedTuple):
     """ Command-line arguments """
     file: TextIO
+    fast_parser: bool
 
 
 class MySeq(NamedTuple):
@@ -36,9 +38,14 @@ def get_args() -> Args:
                         default=sys.stdin,
                         help='Input sequence file')
 
+    parser.add_argument('-f',
+                        '--fast-parser',
+                        help='Use the block-scanning FASTA reader',
+                        action='store_true')
+
     args = parser.parse_args()
 
-    return Args(args.file)
+    return Args(args.file, args.fast_parser)
 
 
 # --------------------------------------------------
@@ -46,8 +53,9 @@ def main() -> None:
     """ Make a jazz noise here """
 
     args = get_args()
+    parse = fastx.parse if args.fast_parser else SeqIO.parse
     high = MySeq(0., '')
-    for seq in map(find_gc, SeqIO.parse(args.file, 'fasta')):
+    for seq in map(find_gc, parse(args.file, 'fasta')):
         if seq.gc > high.gc:
             high = seq
 
@@ -5,12 +5,15 @@ import platform
 import random
 import string
 import re
-from subprocess import getstatusoutput
+import sys
+import tempfile
+from subprocess import getoutput, getstatusoutput
 
 PRG = './cgc.py'
 RUN = f'python {PRG}' if platform.system() == 'Windows' else PRG
 SAMPLE1 = './tests/inputs/1.fa'
 SAMPLE2 = './tests/inputs/2.fa'
+SAMPLE3 = './tests/inputs/3.fa'
 
 
 # --------------------------------------------------
@@ -59,6 +62,110 @@ def test_good_input2() -> None:
     assert out == 'Rosalind_5723 52.806415'
 
 
+# --------------------------------------------------
+def test_fast_parser() -> None:
+    """ Fast parser matches Biopython """
+
+    for file in [SAMPLE1, SAMPLE2, SAMPLE3]:
+        expected = getoutput(f'{RUN} {file}')
+        for flag in ['-f', '--fast-parser']:
+            rv, out = getstatusoutput(f'{RUN} {flag} {file}')
+            assert rv == 0
+            assert out == expected
+
+
+# --------------------------------------------------
+def test_mmap() -> None:
+    """ Memory-mapped mode matches Biopython """
+
+    for file in [SAMPLE1, SAMPLE2, SAMPLE3]:
+        expected = getoutput(f'{RUN} {file}')
+        for flag in ['-m', '--mmap']:
+            rv, out = getstatusoutput(f'{RUN} {flag} {file}')
+            assert rv == 0
+            assert out == expected
+
+        # STDIN can't be mapped, so it is read in blocks
+        rv, out = getstatusoutput(f'cat {file} | {RUN} -m -')
+        assert rv == 0
+        assert out == expected
+
+
+# --------------------------------------------------
+def test_mmap_memory() -> None:
+    """ Peak memory of --mmap does not grow with input size """
+
+    if platform.system() == 'Windows':
+        return
+
+    line = b'ACGT' * 20 + b'\n'
+    with tempfile.TemporaryDirectory() as tmp:
+        peaks = []
+        for mb in [1, 64]:
+            file = os.path.join(tmp, f'{mb}.fa')
+            with open(file, 'wb') as fh:
+                fh.write(b'>big\n' + line * (mb * 2**20 // len(line)))
+            peaks.append(peak_rss(file))
+
+        # ru_maxrss is in KB on Linux (bytes on macOS, so this is lenient)
+        assert peaks[1] - peaks[0] < 16 * 1024
+
+
+# --------------------------------------------------
+def peak_rss(file: str) -> int:
+    """ Peak resident memory from running "cgc.py --mmap" in-process """
+
+    code = ('import resource, runpy, sys; '
+            f'sys.argv = ["{PRG}", "--mmap", "{file}"]; '
+            f'runpy.run_path("{PRG}", run_name="__main__"); '
+            'print(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss)')
+    rv, out = getstatusoutput(f"{sys.executable} -c '{code}'")
+    assert rv == 0
+    return int(out.splitlines()[-1])
+
+
+# --------------------------------------------------
+def test_bad_workers() -> None:
+    """ Dies on bad --workers """
+
+    n = random.choice(range(-10, 1))
+    rv, out = getstatusoutput(f'{RUN} -w {n} {SAMPLE1}')
+    assert rv != 0
+    assert out.lower().startswith('usage:')
+    assert re.search(f'--workers "{n}" must be > 0', out)
+
+
+# --------------------------------------------------
+def test_workers() -> None:
+    """ Worker processes match the serial output """
+
+    files = f'{SAMPLE1} {SAMPLE2} {SAMPLE3}'
+    for flag in ['', '-t']:
+        expected = getoutput(f'{RUN} {flag} {files}')
+        for workers in [2, 3, 8]:
+            rv, out = getstatusoutput(f'{RUN} {flag} -w {workers} {files}')
+            assert rv == 0
+            assert out == expected
+
+        # STDIN can't be split, so it is read serially among the others
+        rv, out = getstatusoutput(
+            f'cat {SAMPLE2} | {RUN} {flag} -w 2 {SAMPLE1} - {SAMPLE3}')
+        assert rv == 0
+        assert out == expected
+
+
+# --------------------------------------------------
+def test_table() -> None:
+    """ Prints every record """
+
+    rv, out = getstatusoutput(f'{RUN} --table {SAMPLE1}')
+    assert rv == 0
+    assert out.splitlines() == [
+        'Rosalind_6404 53.750000', 'Rosalind_5959 53.571429',
+        'Rosalind_0808 60.919540'
+    ]
+
+
 # --------------------------------------------------
 def test_stdin() -> None:
     """ Fails on STDIN """
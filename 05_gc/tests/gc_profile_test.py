@@ -0,0 +1,74 @@
+""" Tests for gc_profile.py """
+
+import os
+import platform
+import random
+import re
+from subprocess import getstatusoutput
+
+PRG = './gc_profile.py'
+RUN = f'python {PRG}' if platform.system() == 'Windows' else PRG
+SAMPLE1 = './tests/inputs/1.fa'
+
+
+# --------------------------------------------------
+def test_exists() -> None:
+    """ Program exists """
+
+    assert os.path.isfile(PRG)
+
+
+# --------------------------------------------------
+def test_usage() -> None:
+    """ Usage """
+
+    for flag in ['-h', '--help']:
+        rv, out = getstatusoutput(f'{RUN} {flag}')
+        assert rv == 0
+        assert out.lower().startswith('usage:')
+
+
+# --------------------------------------------------
+def test_bad_window() -> None:
+    """ Dies on bad window or step """
+
+    n = random.choice(range(-10, 1))
+    for flag in ['window', 'step']:
+        rv, out = getstatusoutput(f'{RUN} --{flag} {n} {SAMPLE1}')
+        assert rv != 0
+        assert out.lower().startswith('usage:')
+        assert re.search(f'--{flag} "{n}" must be > 0', out)
+
+
+# --------------------------------------------------
+def test_good_input() -> None:
+    """ Works on good input """
+
+    rv, out = getstatusoutput(f'{RUN} -w 50 -s 50 {SAMPLE1}')
+    assert rv == 0
+    assert out.splitlines() == [
+        'Rosalind_6404\t0\t50\t0.5400\t-0.0370',
+        'Rosalind_5959\t0\t50\t0.5600\t-0.2857',
+        'Rosalind_0808\t0\t50\t0.5800\t-0.0345',
+    ]
+
+
+# --------------------------------------------------
+def test_outfile() -> None:
+    """ Writes to outfile """
+
+    out_file = 'profile.bed'
+    try:
+        if os.path.isfile(out_file):
+            os.remove(out_file)
+
+        rv, out = getstatusoutput(f'{RUN} -w 20 -s 10 -o {out_file} {SAMPLE1}')
+        assert rv == 0
+        assert out == ''
+        assert os.path.isfile(out_file)
+        rows = open(out_file).read().splitlines()
+        assert len(rows) == 21
+        assert rows[0] == 'Rosalind_6404\t0\t20\t0.6000\t0.0000'
+    finally:
+        if os.path.isfile(out_file):
+            os.remove(out_file)
@@ -0,0 +1,101 @@
+""" Tests for genseq.py """
+
+import os
+import platform
+import random
+import re
+from subprocess import getstatusoutput
+
+PRG = './genseq.py'
+RUN = f'python {PRG}' if platform.system() == 'Windows' else PRG
+
+
+# --------------------------------------------------
+def test_exists() -> None:
+    """ Program exists """
+
+    assert os.path.isfile(PRG)
+
+
+# --------------------------------------------------
+def test_usage() -> None:
+    """ Usage """
+
+    for flag in ['-h', '--help']:
+        rv, out = getstatusoutput(f'{RUN} {flag}')
+        assert rv == 0
+        assert out.lower().startswith('usage:')
+
+
+# --------------------------------------------------
+def test_bad_workers() -> None:
+    """ Dies on bad --workers """
+
+    n = random.choice(range(-10, 1))
+    rv, out = getstatusoutput(f'{RUN} -w {n} -o -')
+    assert rv != 0
+    assert out.lower().startswith('usage:')
+    assert re.search(f'--workers "{n}" must be > 0', out)
+
+
+# --------------------------------------------------
+def test_workers_same_output() -> None:
+    """ Any number of workers writes the same file """
+
+    out_files = [f'genseq_{workers}.fa' for workers in [1, 2]]
+    try:
+        for workers, out_file in zip([1, 2], out_files):
+            rv, out = getstatusoutput(
+                f'{RUN} -n 5 -l 20 -r 1 -w {workers} -o {out_file}')
+            assert rv == 0
+            assert out == ('Wrote 5 sequences of avg length 20 '
+                           f'to "{out_file}".')
+
+        seqs = []
+        for out_file in out_files:
+            with open(out_file, 'rb') as fh:
+                seqs.append(fh.read())
+        assert seqs[0] == seqs[1]
+        assert seqs[0].count(b'>') == 5
+    finally:
+        for out_file in out_files:
+            if os.path.isfile(out_file):
+                os.remove(out_file)
+
+
+# --------------------------------------------------
+def test_workers_stdout() -> None:
+    """ Workers stream to a redirected STDOUT """
+
+    out_files = ['genseq_1.fa', 'genseq_2.fa']
+    try:
+        for workers, out_file in zip([1, 2], out_files):
+            rv, _ = getstatusoutput(
+                f'{RUN} -n 5 -l 20 -r 1 -w {workers} -o - > {out_file}')
+            assert rv == 0
+
+        # The summary is written after the records
+        seqs = []
+        for out_file in out_files:
+            with open(out_file, 'rb') as fh:
+                seqs.append(fh.read())
+        assert seqs[0] == seqs[1]
+        assert seqs[0].count(b'\n>') == 4
+        assert seqs[0].endswith(b'to "<stdout>".\n')
+    finally:
+        for out_file in out_files:
+            if os.path.isfile(out_file):
+                os.remove(out_file)
+
+
+# --------------------------------------------------
+def test_motif() -> None:
+    """ Every sequence holds the common motif """
+
+    rv, out = getstatusoutput(f'{RUN} -n 5 -l 20 -m 7 -f txt -o -')
+    assert rv == 0
+    lines = out.splitlines()
+    match = re.match(r'Common motif is "([ACGT]{7})"\.$', lines[0])
+    assert match
+    assert len(lines) == 7
+    assert all(match.group(1) in seq for seq in lines[1:6])
@@ -6,13 +6,30 @@ Purpose: Hamming distance
 """
 
 import argparse
-from typing import NamedTuple, TextIO
+import os
+import tempfile
+from multiprocessing import Pool
+from typing import Iterable, List, NamedTuple, Optional, TextIO
 import numpy as np
 
+BLOCK_CELLS = 1 << 24
+COL_CHUNK = 4096
+
 
 class Args(NamedTuple):
     """ Command-line arguments """
     file: TextIO
+    outfile: Optional[str]
+    file_format: str
+    workers: int
+
+
+class Job(NamedTuple):
+    """ A block of rows of the distance matrix to fill """
+    outfile: str
+    file_format: str
+    start: int
+    end: int
 
 
 # --------------------------------------------------
@@ -28,9 +45,36 @@ def get_args() -> Args:
                         type=argparse.FileType('rt'),
                         help='Input sequence(s) file')
 
+    parser.add_argument('-o',
+                        '--outfile',
+                        help='Write the all-pairs matrix here instead of '
+                        'printing every pair',
+                        metavar='FILE',
+                        type=str,
+                        default=None)
+
+    parser.add_argument('-f',
+                        '--format',
+                        help='Output format: square NPY, condensed upper '
+                        'triangle NPY, or PHYLIP',
+                        metavar='format',
+                        type=str,
+                        choices=['npy', 'condensed', 'phylip'],
+                        default='npy')
+
+    parser.add_argument('-w',
+                        '--workers',
+                        help='Number of worker processes',
+                        metavar='int',
+                        type=int,
+                        default=1)
+
     args = parser.parse_args()
 
-    return Args(args.file)
+    if args.workers < 1:
+        parser.error(f'--workers "{args.workers}" must be > 0')
+
+    return Args(args.file, args.outfile, args.format, args.workers)
 
 
 # --------------------------------------------------
@@ -42,7 +86,7 @@ def hamming(str1: str, str2: str) -> int:
     for index, _ in enumerate(shorter):
         if str1[index] != str2[index]:
             hamming_dist += 1
-    
+
     return hamming_dist
 
 
@@ -72,7 +116,173 @@ def main() -> None:
     """ Main method """
 
     args = get_args()
-    print(multi_hamming(args.file))
+    if args.outfile is None:
+        print(multi_hamming(args.file))
+        return
+
+    seqs = pack([line.strip() for line in args.file])
+    all_pairs(seqs, args.outfile, args.file_format, args.workers)
+    print(f'Wrote {len(seqs)} x {len(seqs)} distances to "{args.outfile}".')
+
+
+# --------------------------------------------------
+def pack(seqs: List[str]) -> np.ndarray:
+    """
+    One row of uint8 codes per sequence, padded with zeros so positions
+    past the end of only one sequence count as a mismatch
+    """
+
+    width = max(map(len, seqs), default=0)
+    packed = np.zeros((len(seqs), width), dtype=np.uint8)
+    for i, seq in enumerate(seqs):
+        packed[i, :len(seq)] = np.frombuffer(seq.encode('ascii'),
+                                             dtype=np.uint8)
+
+    return packed
+
+
+# --------------------------------------------------
+def all_pairs(seqs: np.ndarray,
+              outfile: str,
+              file_format: str,
+              workers: int,
+              block_cells: int = BLOCK_CELLS) -> None:
+    """ Write the distance matrix of packed sequences, in row blocks """
+
+    num = len(seqs)
+    if file_format == 'phylip':
+        with open(outfile, 'wt', encoding='utf-8') as fh:
+            fh.write(f'{num}\n')
+    else:
+        shape = (num * (num - 1) // 2, ) if file_format == 'condensed' else (
+            num, num)
+        np.lib.format.open_memmap(outfile,
+                                  mode='w+',
+                                  dtype=dist_dtype(seqs.shape[1]),
+                                  shape=shape).flush()
+
+    # Blocks depend only on the input, so the output does not vary with
+    # the number of workers
+    step = max(1, block_cells // max(1, num))
+    jobs = [
+        Job(outfile, file_format, start, min(num, start + step))
+        for start in range(0, num, step)
+    ]
+
+    if workers == 1:
+        init_worker(seqs)
+        append(outfile, map(write_block, jobs))
+    else:
+        with Pool(workers, initializer=init_worker,
+                  initargs=(seqs, )) as pool:
+            append(outfile, pool.imap(write_block, jobs))
+
+
+# --------------------------------------------------
+def append(outfile: str, texts: Iterable[str]) -> None:
+    """ Text rows can only be appended in order, so workers hand them back """
+
+    with open(outfile, 'at', encoding='utf-8') as fh:
+        for text in texts:
+            fh.write(text)
+
+
+# --------------------------------------------------
+SEQS = np.zeros((0, 0), dtype=np.uint8)
+
+
+def init_worker(seqs: np.ndarray) -> None:
+    """ Give each worker the packed sequences once """
+
+    global SEQS  # pylint: disable=global-statement
+    SEQS = seqs
+
+
+# --------------------------------------------------
+def write_block(job: Job) -> str:
+    """
+    Fill one block of rows in place for the NPY formats, or return it
+    as PHYLIP text
+    """
+
+    num = len(SEQS)
+    if job.file_format == 'phylip':
+        dists = distances(SEQS, job.start, job.end, 0)
+        return ''.join(f'{f"Seq{i}":<10} ' + ' '.join(map(str, row)) + '\n'
+                       for i, row in enumerate(dists.tolist(), job.start))
+
+    dists = distances(SEQS, job.start, job.end, job.start)
+    out = np.load(job.outfile, mmap_mode='r+')
+    if job.file_format == 'condensed':
+        for i in range(job.start, job.end):
+            # Row i of the upper triangle starts after all earlier rows
+            offset = i * num - i * (i + 1) // 2
+            out[offset:offset + num - i - 1] = dists[i - job.start,
+                                                     i - job.start + 1:]
+    else:
+        # Upper block and its mirror; blocks never overlap
+        out[job.start:job.end, job.start:] = dists
+        out[job.start:, job.start:job.end] = dists.T
+
+    out.flush()
+    return ''
+
+
+# --------------------------------------------------
+def distances(seqs: np.ndarray, start: int, end: int,
+              first_col: int) -> np.ndarray:
+    """
+    Hamming distances of rows start..end against rows first_col on,
+    counting matches of each symbol with one matrix product apiece
+    """
+
+    rows = seqs[start:end]
+    matches = np.zeros((end - start, len(seqs) - first_col), dtype=np.float32)
+    for col in range(first_col, len(seqs), COL_CHUNK):
+        cols = seqs[col:col + COL_CHUNK]
+        for symbol in np.unique(rows):
+            hits = (rows == symbol).astype(np.float32)
+            matches[:, col - first_col:col - first_col + len(cols)] += (
+                hits @ (cols == symbol).astype(np.float32).T)
+
+    # float32 counts are exact up to 2**24 positions
+    width = seqs.shape[1]
+    return (width - matches).astype(dist_dtype(width))
+
+
+# --------------------------------------------------
+def dist_dtype(width: int) -> np.dtype:
+    """ Smallest unsigned type that holds any distance """
+
+    for kind in ['uint8', 'uint16', 'uint32']:
+        if width <= np.iinfo(kind).max:
+            return np.dtype(kind)
+    return np.dtype('uint64')
+
+
+# --------------------------------------------------
+def test_all_pairs() -> None:
+    """ All formats and worker counts match pairwise hamming """
+
+    seqs = ['TACGCTAG', 'TACGCTGG', 'TACGCTAA', 'AA', '', 'T', 'GATTACA']
+    expected = np.array([[hamming(s1, s2) for s2 in seqs] for s1 in seqs])
+    upper = expected[np.triu_indices(len(seqs), 1)]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        outfile = os.path.join(tmp, 'out')
+        for cells in [1, 10, BLOCK_CELLS]:
+            for workers in [1, 2]:
+                all_pairs(pack(seqs), outfile, 'npy', workers, cells)
+                assert (np.load(outfile) == expected).all()
+                all_pairs(pack(seqs), outfile, 'condensed', workers, cells)
+                assert (np.load(outfile) == upper).all()
+                all_pairs(pack(seqs), outfile, 'phylip', workers, cells)
+                with open(outfile, encoding='utf-8') as fh:
+                    lines = fh.read().splitlines()
+                assert lines[0] == '7'
+                assert lines[4] == 'Seq3       7 7 7 0 2 2 6'
+                assert [list(map(int, line.split()[1:]))
+                        for line in lines[1:]] == expected.tolist()
 
 
 # --------------------------------------------------
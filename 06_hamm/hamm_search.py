@@ -0,0 +1,256 @@
+#!/usr/bin/env python3
+"""
+Author : bcheng <bcheng@localhost>
+Date   : 2026-10-18
+Purpose: Find reference sequences within a Hamming distance of queries
+"""
+
+import argparse
+import sys
+import time
+from collections import defaultdict
+from typing import Dict, List, NamedTuple, Optional, TextIO, Tuple, Union
+from Bio import SeqIO
+from hamm_extra import hamming
+
+Hits = List[Tuple[int, int]]
+Index = Union['BruteForce', 'Pigeonhole', 'BKTree']
+
+
+class Args(NamedTuple):
+    """ Command-line arguments """
+    ref: TextIO
+    queries: TextIO
+    distance: int
+    method: str
+    outfile: TextIO
+
+
+# --------------------------------------------------
+def get_args() -> Args:
+    """ Get command-line arguments """
+
+    parser = argparse.ArgumentParser(
+        description='Find reference sequences within a Hamming distance '
+        'of queries',
+        formatter_class=argparse.ArgumentDefaultsHelpFormatter)
+
+    parser.add_argument('ref',
+                        metavar='REF',
+                        type=argparse.FileType('rt'),
+                        help='Reference FASTA file')
+
+    parser.add_argument('queries',
+                        metavar='QUERIES',
+                        type=argparse.FileType('rt'),
+                        help='Query FASTA file')
+
+    parser.add_argument('-d',
+                        '--distance',
+                        help='Maximum Hamming distance',
+                        metavar='int',
+                        type=int,
+                        default=1)
+
+    parser.add_argument('-m',
+                        '--method',
+                        help='Search method',
+                        metavar='method',
+                        type=str,
+                        choices=['pigeonhole', 'bktree', 'brute'],
+                        default='pigeonhole')
+
+    parser.add_argument('-o',
+                        '--outfile',
+                        help='Output file',
+                        metavar='FILE',
+                        type=argparse.FileType('wt'),
+                        default=sys.stdout)
+
+    args = parser.parse_args()
+
+    if args.distance < 0:
+        parser.error(f'--distance "{args.distance}" must be >= 0')
+
+    return Args(args.ref, args.queries, args.distance, args.method,
+                args.outfile)
+
+
+# --------------------------------------------------
+def main() -> None:
+    """ Print query/reference/distance for every hit """
+
+    args = get_args()
+    ref_ids, ref_seqs = [], []
+    for rec in SeqIO.parse(args.ref, 'fasta'):
+        ref_ids.append(rec.id)
+        ref_seqs.append(str(rec.seq))
+
+    start = time.perf_counter()
+    index = make_index(args.method, ref_seqs, args.distance)
+    built = time.perf_counter()
+
+    print('query\treference\tdistance', file=args.outfile)
+    num_queries = 0
+    for rec in SeqIO.parse(args.queries, 'fasta'):
+        num_queries += 1
+        for ref, dist in index.search(str(rec.seq)):
+            print(f'{rec.id}\t{ref_ids[ref]}\t{dist}', file=args.outfile)
+
+    # Timings go to STDERR to keep the table clean
+    done = time.perf_counter()
+    rate = num_queries / (done - built) if done > built else 0
+    print(f'Indexed {len(ref_seqs):,} references by {args.method} in '
+          f'{built - start:.2f}s, searched {num_queries:,} queries in '
+          f'{done - built:.2f}s ({rate:,.0f} queries/s).',
+          file=sys.stderr)
+
+
+# --------------------------------------------------
+def make_index(method: str, refs: List[str], max_dist: int) -> Index:
+    """ Build the index for a search method """
+
+    if method == 'pigeonhole':
+        return Pigeonhole(refs, max_dist)
+    if method == 'bktree':
+        return BKTree(refs, max_dist)
+    return BruteForce(refs, max_dist)
+
+
+# --------------------------------------------------
+class BruteForce:
+    """ Compare a query to every reference """
+
+    def __init__(self, refs: List[str], max_dist: int) -> None:
+        self.refs = refs
+        self.max_dist = max_dist
+
+    def search(self, query: str) -> Hits:
+        """ (reference index, distance) of each hit in reference order """
+
+        return [(i, dist) for i, ref in enumerate(self.refs)
+                if (dist := hamming(query, ref)) <= self.max_dist]
+
+
+# --------------------------------------------------
+class Pigeonhole:
+    """
+    Split each reference into max_dist + 1 segments: any reference within
+    max_dist of a query shares at least one whole segment with it
+    """
+
+    def __init__(self, refs: List[str], max_dist: int) -> None:
+        self.refs = refs
+        self.max_dist = max_dist
+
+        # Length -> segment number -> segment -> reference indexes
+        self.index: Dict[int, List[Dict[str, List[int]]]] = {}
+        for i, ref in enumerate(refs):
+            if len(ref) not in self.index:
+                self.index[len(ref)] = [
+                    defaultdict(list) for _ in range(max_dist + 1)
+                ]
+            for seg, (start, end) in enumerate(self.segments(len(ref))):
+                self.index[len(ref)][seg][ref[start:end]].append(i)
+
+    def segments(self, length: int) -> List[Tuple[int, int]]:
+        """ Bounds of max_dist + 1 near-equal segments """
+
+        parts = self.max_dist + 1
+        bounds = [length * part // parts for part in range(parts + 1)]
+        return list(zip(bounds, bounds[1:]))
+
+    def search(self, query: str) -> Hits:
+        """ (reference index, distance) of each hit in reference order """
+
+        candidates = set()
+
+        # The length difference alone counts toward the distance
+        for length in range(
+                max(0, len(query) - self.max_dist),
+                len(query) + self.max_dist + 1):
+            for seg, (start, end) in enumerate(self.segments(length)):
+                if length in self.index and end <= len(query):
+                    candidates.update(
+                        self.index[length][seg].get(query[start:end], []))
+
+        return [(i, dist) for i in sorted(candidates)
+                if (dist := hamming(query, self.refs[i])) <= self.max_dist]
+
+
+# --------------------------------------------------
+class BKTree:
+    """ Burkhard-Keller tree: children keyed by distance to their parent """
+
+    class Node(NamedTuple):
+        """ References with one sequence, and subtrees by distance """
+        seq: str
+        refs: List[int]
+        children: Dict[int, 'BKTree.Node']
+
+    def __init__(self, refs: List[str], max_dist: int) -> None:
+        self.max_dist = max_dist
+        self.root: Optional[BKTree.Node] = None
+        for i, ref in enumerate(refs):
+            self.add(i, ref)
+
+    def add(self, i: int, seq: str) -> None:
+        """ Add a reference, walking down without recursion """
+
+        if self.root is None:
+            self.root = BKTree.Node(seq, [i], {})
+            return
+
+        node = self.root
+        while (dist := hamming(seq, node.seq)) != 0:
+            if dist not in node.children:
+                node.children[dist] = BKTree.Node(seq, [i], {})
+                return
+            node = node.children[dist]
+        node.refs.append(i)
+
+    def search(self, query: str) -> Hits:
+        """ (reference index, distance) of each hit in reference order """
+
+        hits: Hits = []
+        stack = [self.root] if self.root else []
+        while stack:
+            node = stack.pop()
+            dist = hamming(query, node.seq)
+            if dist <= self.max_dist:
+                hits.extend((i, dist) for i in node.refs)
+
+            # The triangle inequality rules out every other subtree
+            stack.extend(child for key, child in node.children.items()
+                         if abs(key - dist) <= self.max_dist)
+
+        return sorted(hits)
+
+
+# --------------------------------------------------
+def test_search() -> None:
+    """ Every method finds what brute force finds """
+
+    refs = [
+        'ACGTACGT', 'ACGTACGA', 'TTTTACGT', 'ACGTACGT', 'ACGTAC', 'ACGTACGTA',
+        '', 'A', 'GGGGGGGG', 'ACGAACGT'
+    ]
+    queries = ['ACGTACGT', 'ACGTAC', '', 'TTTTTTTT', 'ACGTACGTAA', 'C']
+
+    for max_dist in range(5):
+        brute = BruteForce(refs, max_dist)
+        indexes: List[Index] = [
+            Pigeonhole(refs, max_dist),
+            BKTree(refs, max_dist)
+        ]
+        for index in indexes:
+            for query in queries:
+                assert index.search(query) == brute.search(query)
+
+    assert BruteForce(refs, 1).search('ACGTACGT') == [(0, 0), (1, 1), (3, 0),
+                                                      (5, 1), (9, 1)]
+
+
+# --------------------------------------------------
+if __name__ == '__main__':
+    main()
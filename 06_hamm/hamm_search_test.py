@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+""" Tests for hamm_search.py """
+
+import os
+import platform
+import random
+import re
+from subprocess import getoutput, getstatusoutput
+
+PRG = './hamm_search.py'
+RUN = f'python {PRG}' if platform.system() == 'Windows' else PRG
+REFS = './tests/inputs/refs.fa'
+QUERIES = './tests/inputs/queries.fa'
+
+
+# --------------------------------------------------
+def test_exists() -> None:
+    """ Program exists """
+
+    assert os.path.isfile(PRG)
+
+
+# --------------------------------------------------
+def test_usage() -> None:
+    """ Usage """
+
+    for flag in ['-h', '--help']:
+        rv, out = getstatusoutput(f'{RUN} {flag}')
+        assert rv == 0
+        assert out.lower().startswith('usage')
+
+
+# --------------------------------------------------
+def test_bad_distance() -> None:
+    """ Dies on a negative distance """
+
+    dist = random.randint(-10, -1)
+    rv, out = getstatusoutput(f'{RUN} -d {dist} {REFS} {QUERIES}')
+    assert rv != 0
+    assert re.search(f'--distance "{dist}" must be >= 0', out)
+
+
+# --------------------------------------------------
+def test_search() -> None:
+    """ Every method reports the same hits """
+
+    expected = [
+        'query\treference\tdistance', 'q1\tbc1\t0', 'q1\tbc2\t1',
+        'q3\tbc1\t1', 'q3\tbc2\t1', 'q3\tbc4\t1'
+    ]
+    for method in ['pigeonhole', 'bktree', 'brute']:
+        rv, out = getstatusoutput(
+            f'{RUN} -m {method} {REFS} {QUERIES} 2>/dev/null')
+        assert rv == 0
+        assert out.splitlines() == expected
+
+    out = getoutput(f'{RUN} -d 0 {REFS} {QUERIES} 2>/dev/null')
+    assert out.splitlines() == expected[:2]
+
+
+# --------------------------------------------------
+def test_throughput() -> None:
+    """ Reports throughput on STDERR """
+
+    out = getoutput(f'{RUN} {REFS} {QUERIES} 2>&1 >/dev/null')
+    assert re.match(r'Indexed 5 references by pigeonhole in \S+s, '
+                    r'searched 3 queries in \S+s \(\S+ queries/s\)\.$', out)
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+""" Hamming distance """
+
+import argparse
+import os
+from typing import NamedTuple
+import numpy as np
+
+
+class Args(NamedTuple):
+    """ Command-line arguments """
+    seq1: str
+    seq2: str
+
+
+# --------------------------------------------------
+def get_args() -> Args:
+    """ Get command-line arguments """
+
+    parser = argparse.ArgumentParser(
+        description='Hamming distance',
+        formatter_class=argparse.ArgumentDefaultsHelpFormatter)
+
+    parser.add_argument('seq1', metavar='str', help='Sequence 1 or file')
+
+    parser.add_argument('seq2', metavar='str', help='Sequence 2 or file')
+
+    args = parser.parse_args()
+
+    # Long sequences are too big for the command line
+    for name in ['seq1', 'seq2']:
+        if os.path.isfile(val := getattr(args, name)):
+            with open(val, encoding='utf-8') as fh:
+                setattr(args, name, fh.read().rstrip())
+
+    return Args(args.seq1, args.seq2)
+
+
+# --------------------------------------------------
+def main() -> None:
+    """ Make a jazz noise here """
+
+    args = get_args()
+    print(hamming(args.seq1, args.seq2))
+
+
+# --------------------------------------------------
+def hamming(seq1: str, seq2: str) -> int:
+    """ Calculate Hamming distance """
+
+    # Method 9: Compare whole uint8 arrays at once; as with zip_longest,
+    # every position past the end of the shorter sequence is a mismatch
+    arr1, arr2 = as_array(seq1), as_array(seq2)
+    shared = min(len(arr1), len(arr2))
+    mismatches = np.count_nonzero(arr1[:shared] != arr2[:shared])
+
+    return int(mismatches) + abs(len(arr1) - len(arr2))
+
+
+# --------------------------------------------------
+def as_array(seq: str) -> np.ndarray:
+    """ View a sequence as one uint8 code per character """
+
+    # UTF-32 keeps one code per character even for non-ASCII input
+    if seq.isascii():
+        return np.frombuffer(seq.encode('ascii'), dtype=np.uint8)
+    return np.frombuffer(seq.encode('utf-32-le'), dtype=np.uint32)
+
+
+# --------------------------------------------------
+def test_hamming() -> None:
+    """ Test hamming """
+
+    assert hamming('', '') == 0
+    assert hamming('AC', 'ACGT') == 2
+    assert hamming('ACGT', '') == 4
+    assert hamming('GAGCCTACTAACGGGAT', 'CATCGTAATGACGGCCT') == 7
+    assert hamming('ACGT', 'acgt') == 4
+    assert hamming('AΔC', 'AΔG') == 1
+
+
+# --------------------------------------------------
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,139 @@
+""" Tests for translate.py """
+
+import os
+import platform
+import random
+import re
+import string
+from subprocess import getoutput, getstatusoutput
+
+PRG = './translate.py'
+RUN = f'python {PRG}' if platform.system() == 'Windows' else PRG
+SEQS = './tests/inputs/seqs.fa'
+READS = './tests/inputs/reads.fq'
+
+
+# --------------------------------------------------
+def test_exists() -> None:
+    """ Program exists """
+
+    assert os.path.isfile(PRG)
+
+
+# --------------------------------------------------
+def test_usage() -> None:
+    """ Usage """
+
+    for arg in ['', '-h', '--help']:
+        out = getoutput(f'{RUN} {arg}')
+        assert out.lower().startswith('usage:')
+
+
+# --------------------------------------------------
+def test_bad_table() -> None:
+    """ Dies on a table NCBI does not define """
+
+    rv, out = getstatusoutput(f'{RUN} -t 7 {SEQS}')
+    assert rv != 0
+    assert re.search(r"--table: invalid choice: 7", out)
+
+
+# --------------------------------------------------
+def test_bad_file() -> None:
+    """ Dies on a missing file """
+
+    bad = ''.join(random.choices(string.ascii_letters, k=10))
+    rv, out = getstatusoutput(f'{RUN} {bad}')
+    assert rv != 0
+    assert re.search(f"No such file or directory: '{bad}'", out)
+
+
+# --------------------------------------------------
+def run(args: str) -> str:
+    """ Output of a successful run """
+
+    rv, out = getstatusoutput(f'{RUN} {args} {SEQS} 2>/dev/null')
+    assert rv == 0
+    return out
+
+
+# --------------------------------------------------
+def test_truncate() -> None:
+    """ Proteins end at the first stop by default """
+
+    with open(SEQS + '.out', encoding='utf-8') as fh:
+        assert run('') == fh.read().rstrip('\n')
+    assert run('-s truncate') == run('')
+
+
+# --------------------------------------------------
+def test_stop_modes() -> None:
+    """ Keep or remove stops """
+
+    assert run('-s keep').splitlines()[1::2] == [
+        'MAMAPRTEINSTRING*', 'MP*SX*RF', '', 'MRR**'
+    ]
+    assert run('-s remove').splitlines()[1::2] == [
+        'MAMAPRTEINSTRING', 'MPSXRF', '', 'MRR'
+    ]
+
+
+# --------------------------------------------------
+def test_table() -> None:
+    """ Vertebrate mitochondrial code """
+
+    assert run('-t 2 -s keep').splitlines()[1::2] == [
+        'MAMAP*TEINSTRINGW', 'MP*SXW*F', '', 'M**W*'
+    ]
+
+
+# --------------------------------------------------
+def test_outfile() -> None:
+    """ Writes to an output file """
+
+    outfile = 'out.fa'
+    try:
+        if os.path.isfile(outfile):
+            os.remove(outfile)
+
+        rv, out = getstatusoutput(f'{RUN} -o {outfile} {SEQS} {SEQS}')
+        assert rv == 0
+        assert re.match(r'Translated 184 bases in \S+s \(\S+ MB/s\)\.$', out)
+        with open(outfile, encoding='utf-8') as fh:
+            assert fh.read().count('>') == 8
+    finally:
+        if os.path.isfile(outfile):
+            os.remove(outfile)
+
+
+# --------------------------------------------------
+def test_bad_workers() -> None:
+    """ Dies on a bad number of workers """
+
+    workers = random.randint(-10, 0)
+    rv, out = getstatusoutput(f'{RUN} --workers={workers} {SEQS}')
+    assert rv != 0
+    assert re.search(f'--workers "{workers}" must be > 0', out)
+
+
+# --------------------------------------------------
+def test_six_frame() -> None:
+    """ All six frames of FASTQ reads """
+
+    rv, out = getstatusoutput(f'{RUN} -6 -s keep {READS} 2>/dev/null')
+    assert rv == 0
+    assert out.splitlines()[:12] == [
+        '>read1_frame=1 lane 1', 'MA*', '>read1_frame=2 lane 1', 'WP',
+        '>read1_frame=3 lane 1', 'GL', '>read1_frame=-1 lane 1', 'LGH',
+        '>read1_frame=-2 lane 1', '*A', '>read1_frame=-3 lane 1', 'RP'
+    ]
+    assert out.count('>read2_frame=') == 6
+
+
+# --------------------------------------------------
+def test_workers() -> None:
+    """ Workers give the same output in the same order """
+
+    for flags in ['', '-6']:
+        expected = run(flags)
+        assert run(f'{flags} -w 3') == expected
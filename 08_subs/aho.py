@@ -0,0 +1,203 @@
+#!/usr/bin/env python3
+"""
+Author : bcheng <bcheng@localhost>
+Date   : 2026-10-18
+Purpose: Find many subsequences at once with Aho-Corasick
+"""
+
+import argparse
+import io
+import sys
+import time
+from collections import deque
+from typing import BinaryIO, Dict, Iterator, List, NamedTuple, TextIO, Tuple
+from fastx import read_fastx
+
+Hit = Tuple[int, int]
+
+
+class Args(NamedTuple):
+    """ Command-line arguments """
+    patterns: BinaryIO
+    files: List[BinaryIO]
+    outfile: TextIO
+
+
+# --------------------------------------------------
+def get_args() -> Args:
+    """ Get command-line arguments """
+
+    parser = argparse.ArgumentParser(
+        description='Find many subsequences at once with Aho-Corasick',
+        formatter_class=argparse.ArgumentDefaultsHelpFormatter)
+
+    parser.add_argument('patterns',
+                        metavar='PATTERNS',
+                        type=argparse.FileType('rb'),
+                        help='FASTA file or list of subsequences')
+
+    parser.add_argument('files',
+                        metavar='FILE',
+                        type=argparse.FileType('rb'),
+                        nargs='+',
+                        help='Input FASTA/FASTQ file(s) to search')
+
+    parser.add_argument('-o',
+                        '--outfile',
+                        help='Output file',
+                        metavar='FILE',
+                        type=argparse.FileType('wt'),
+                        default=sys.stdout)
+
+    args = parser.parse_args()
+
+    return Args(args.patterns, args.files, args.outfile)
+
+
+# --------------------------------------------------
+def main() -> None:
+    """ Print pattern/record/position for every hit """
+
+    args = get_args()
+    names, patterns = read_patterns(args.patterns)
+
+    start = time.perf_counter()
+    automaton = AhoCorasick(patterns)
+    built = time.perf_counter()
+
+    print('pattern\trecord\tposition', file=args.outfile)
+    num_bases = num_hits = 0
+    for fh in args.files:
+        for rec in read_fastx(fh):
+            num_bases += len(rec.seq)
+            for pattern, pos in automaton.search(rec.seq):
+                num_hits += 1
+                print(f'{names[pattern]}\t{rec.id}\t{pos + 1}',
+                      file=args.outfile)
+
+    # Timings go to STDERR to keep the table clean
+    done = time.perf_counter()
+    rate = num_bases / (done - built) / 1e6 if done > built else 0
+    print(f'Built {automaton.num_states:,} states for {len(patterns):,} '
+          f'patterns in {built - start:.2f}s, found {num_hits:,} hits in '
+          f'{num_bases:,} bases in {done - built:.2f}s ({rate:,.1f} MB/s).',
+          file=sys.stderr)
+
+
+# --------------------------------------------------
+def read_patterns(fh: BinaryIO) -> Tuple[List[str], List[bytes]]:
+    """
+    Names and sequences from FASTA, or from one subsequence per line
+    where each is its own name
+    """
+
+    data = fh.read()
+    if data.lstrip()[:1] == b'>':
+        recs = [(rec.id, rec.seq) for rec in read_fastx(io.BytesIO(data))]
+    else:
+        recs = [(line.decode(), line)
+                for line in map(bytes.strip, data.splitlines()) if line]
+
+    empty = [name for name, seq in recs if not seq]
+    if empty:
+        sys.exit(f'Empty pattern "{empty[0]}"')
+
+    return [name for name, _ in recs], [seq for _, seq in recs]
+
+
+# --------------------------------------------------
+class AhoCorasick:
+    """
+    Trie of the patterns turned into a complete automaton: every state
+    has a next state for every symbol, so a search is one table lookup
+    per base and never backtracks
+    """
+
+    def __init__(self, patterns: List[bytes]) -> None:
+        self.lengths = [len(pattern) for pattern in patterns]
+
+        # Code 0 is any symbol in no pattern, which always leads to root
+        symbols = sorted(set(b''.join(patterns)))
+        self.width = len(symbols) + 1
+        codes = bytearray(256)
+        for code, symbol in enumerate(symbols, start=1):
+            codes[symbol] = code
+        self.codes = bytes(codes)
+
+        # Trie: children by code and the patterns ending at each state
+        children: List[Dict[int, int]] = [{}]
+        ends: List[List[int]] = [[]]
+        for i, pattern in enumerate(patterns):
+            state = 0
+            for code in pattern.translate(self.codes):
+                if code not in children[state]:
+                    children[state][code] = len(children)
+                    children.append({})
+                    ends.append([])
+                state = children[state][code]
+            ends[state].append(i)
+
+        # Fill the table breadth-first so each failure state is complete
+        # before it is used; states are stored premultiplied by width
+        self.num_states = len(children)
+        self.delta = [0] * (self.num_states * self.width)
+        self.out: List[Tuple[int, ...]] = [()] * len(self.delta)
+        fail = [0] * self.num_states
+        queue = deque(children[0].values())
+        for code, child in children[0].items():
+            self.delta[code] = child * self.width
+
+        while queue:
+            state = queue.popleft()
+            row = state * self.width
+            fail_row = fail[state] * self.width
+            self.out[row] = tuple(ends[state]) + self.out[fail_row]
+            for code in range(self.width):
+                if code in children[state]:
+                    child = children[state][code]
+                    fail[child] = self.delta[fail_row + code] // self.width
+                    self.delta[row + code] = child * self.width
+                    queue.append(child)
+                else:
+                    self.delta[row + code] = self.delta[fail_row + code]
+
+    def search(self, seq: bytes) -> Iterator[Hit]:
+        """
+        (pattern index, 0-based start) of every hit, overlapping ones
+        included, in order of where they end
+        """
+
+        delta, out, lengths = self.delta, self.out, self.lengths
+        state = 0
+        for end, code in enumerate(seq.translate(self.codes), start=1):
+            state = delta[state + code]
+            if out[state]:
+                for pattern in out[state]:
+                    yield pattern, end - lengths[pattern]
+
+
+# --------------------------------------------------
+def test_search() -> None:
+    """ Matches looping str.find over each pattern """
+
+    def find_all(seq: bytes, pattern: bytes) -> Iterator[int]:
+        pos = seq.find(pattern)
+        while pos >= 0:
+            yield pos
+            pos = seq.find(pattern, pos + 1)
+
+    seq = b'GATATATGCATATACTTNATATACGT'
+    patterns = [b'ATAT', b'TAT', b'AT', b'ATAT', b'GCATATAC', b'N', b'CCC']
+    hits = list(AhoCorasick(patterns).search(seq))
+    assert sorted(hits) == sorted((i, pos)
+                                  for i, pattern in enumerate(patterns)
+                                  for pos in find_all(seq, pattern))
+    assert [pos + 1 for i, pos in hits if i == 0] == [2, 4, 10, 19]
+
+    assert not list(AhoCorasick([b'ACGT']).search(b''))
+    assert list(AhoCorasick([b'A']).search(b'xAx')) == [(0, 1)]
+
+
+# --------------------------------------------------
+if __name__ == '__main__':
+    main()
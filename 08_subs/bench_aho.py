@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+Author : bcheng <bcheng@localhost>
+Date   : 2026-10-18
+Purpose: Benchmark Aho-Corasick against looping single-pattern searches
+"""
+
+import argparse
+import random
+import re
+import time
+from typing import Callable, Dict, List, NamedTuple, Set, Tuple
+from aho import AhoCorasick
+
+Search = Callable[[bytes, List[bytes]], Set[Tuple[int, int]]]
+
+
+class Args(NamedTuple):
+    """ Command-line arguments """
+    seq_len: int
+    num_patterns: List[int]
+    pattern_len: int
+    seed: int
+
+
+# --------------------------------------------------
+def get_args() -> Args:
+    """ Get command-line arguments """
+
+    parser = argparse.ArgumentParser(
+        description='Benchmark Aho-Corasick against looping single-pattern '
+        'searches',
+        formatter_class=argparse.ArgumentDefaultsHelpFormatter)
+
+    parser.add_argument('-l',
+                        '--seq-len',
+                        help='Length of the random sequence',
+                        metavar='int',
+                        type=int,
+                        default=1000000)
+
+    parser.add_argument('-n',
+                        '--num-patterns',
+                        help='Numbers of patterns to search for',
+                        metavar='int',
+                        type=int,
+                        nargs='+',
+                        default=[1, 10, 100, 1000])
+
+    parser.add_argument('-k',
+                        '--pattern-len',
+                        help='Length of each pattern',
+                        metavar='int',
+                        type=int,
+                        default=20)
+
+    parser.add_argument('-s',
+                        '--seed',
+                        help='Random seed',
+                        metavar='int',
+                        type=int,
+                        default=1)
+
+    args = parser.parse_args()
+
+    if args.pattern_len < 1:
+        parser.error(f'--pattern-len "{args.pattern_len}" must be > 0')
+
+    return Args(args.seq_len, args.num_patterns, args.pattern_len, args.seed)
+
+
+# --------------------------------------------------
+def main() -> None:
+    """ Print the time of each method for each number of patterns """
+
+    args = get_args()
+    rand = random.Random(args.seed)
+    seq = bytes(rand.choices(b'ACGT', k=args.seq_len))
+
+    # Half the patterns are sampled from the sequence so there are hits
+    patterns = []
+    for i in range(max(args.num_patterns)):
+        start = rand.randrange(max(1, len(seq) - args.pattern_len + 1))
+        sample = seq[start:start + args.pattern_len]
+        if i % 2 == 0 or len(sample) < args.pattern_len:
+            sample = bytes(rand.choices(b'ACGT', k=args.pattern_len))
+        patterns.append(sample)
+
+    methods = candidates()
+    print('\t'.join(['name'] + [str(num) for num in args.num_patterns]))
+    results: Dict[int, Set[Tuple[int, int]]] = {}
+    for name, search in methods.items():
+        times = []
+        for num in args.num_patterns:
+            began = time.perf_counter()
+            hits = search(seq, patterns[:num])
+            times.append(f'{time.perf_counter() - began:.6f}')
+            assert results.setdefault(num, hits) == hits, f'{name} differs'
+        print('\t'.join([name] + times))
+
+
+# --------------------------------------------------
+def candidates() -> Dict[str, Search]:
+    """ Ways to find every (pattern index, position) """
+
+    def str_find(seq: bytes, patterns: List[bytes]) -> Set[Tuple[int, int]]:
+        # Method 1 of subs.py once per pattern
+        hits = set()
+        for i, pattern in enumerate(patterns):
+            pos = seq.find(pattern)
+            while pos >= 0:
+                hits.add((i, pos))
+                pos = seq.find(pattern, pos + 1)
+        return hits
+
+    def regex(seq: bytes, patterns: List[bytes]) -> Set[Tuple[int, int]]:
+        # Method 5 of subs.py once per pattern
+        return {(i, match.start())
+                for i, pattern in enumerate(patterns)
+                for match in re.finditer(b'(?=(' + re.escape(pattern) +
+                                         b'))', seq)}
+
+    def aho(seq: bytes, patterns: List[bytes]) -> Set[Tuple[int, int]]:
+        return set(AhoCorasick(patterns).search(seq))
+
+    return {'str_find': str_find, 're': regex, 'aho_corasick': aho}
+
+
+# --------------------------------------------------
+if __name__ == '__main__':
+    main()
@@ -2,13 +2,17 @@
 """ Find subsequences """
 
 import argparse
-from typing import NamedTuple
+import io
+import os
+from typing import BinaryIO, Iterator, NamedTuple, Optional, Tuple
+from fastx import BLOCK_SIZE, WHITESPACE, blocks, first_word, scan_fasta
 
 
 class Args(NamedTuple):
     """ Command-line arguments """
     seq: str
     subseq: str
+    fasta: bool
 
 
 # --------------------------------------------------
@@ -19,13 +23,25 @@ def get_args() -> Args:
         description='Find subsequences',
         formatter_class=argparse.ArgumentDefaultsHelpFormatter)
 
-    parser.add_argument('seq', metavar='seq', help='Sequence')
+    parser.add_argument('seq', metavar='seq', help='Sequence or FASTA file')
 
     parser.add_argument('subseq', metavar='subseq', help='Sub-sequence')
 
+    parser.add_argument('-f',
+                        '--fasta',
+                        help='Stream each record of a FASTA file',
+                        action='store_true')
+
     args = parser.parse_args()
 
-    return Args(args.seq, args.subseq)
+    # The file is streamed later, never read whole
+    if args.fasta and not os.path.isfile(args.seq):
+        parser.error(f'--fasta needs a file, "{args.seq}" is not one')
+
+    if args.fasta and not args.subseq:
+        parser.error('--fasta needs a non-empty subseq')
+
+    return Args(args.seq, args.subseq, args.fasta)
 
 
 # --------------------------------------------------
@@ -33,6 +49,11 @@ def main() -> None:
     """ Make a jazz noise here """
 
     args = get_args()
+    if args.fasta:
+        with open(args.seq, 'rb') as fh:
+            for rec_id, pos in find_fasta(fh, args.subseq.encode()):
+                print(f'{rec_id}\t{pos}')
+        return
 
     # Method 1: str.find()
     last = 0
@@ -47,6 +68,55 @@ def main() -> None:
     print(*found)
 
 
+# --------------------------------------------------
+def find_fasta(fh: BinaryIO,
+               subseq: bytes,
+               block_size: int = BLOCK_SIZE) -> Iterator[Tuple[str, int]]:
+    """
+    (record ID, 1-based position) of every match, overlapping ones too,
+    searching each block of sequence with bytes.find; the last
+    len(subseq) - 1 bases carry over to catch matches across blocks
+    """
+
+    rec_id: Optional[str] = None
+    carry = b''
+    offset = 0
+
+    for is_header, data in scan_fasta(blocks(fh, block_size)):
+        if is_header:
+            rec_id, carry, offset = first_word(data.decode()), b'', 0
+            continue
+
+        # Any text before the first header is skipped
+        if rec_id is None:
+            continue
+
+        chunk = carry + data.translate(None, WHITESPACE)
+        pos = chunk.find(subseq)
+        while pos != -1:
+            yield rec_id, offset + pos + 1
+            pos = chunk.find(subseq, pos + 1)
+
+        keep = min(len(chunk), len(subseq) - 1)
+        carry = chunk[len(chunk) - keep:]
+        offset += len(chunk) - keep
+
+
+# --------------------------------------------------
+def test_find_fasta() -> None:
+    """ Test find_fasta """
+
+    data = (b'junk ATAT\n>seq1 desc\nGATATA\nTGCATA\r\nTACTT\n'
+            b'>empty\n>seq2\nATATA\n>seq3\nAT')
+    expected = [('seq1', 2), ('seq1', 4), ('seq1', 10), ('seq2', 1)]
+    for block_size in range(1, len(data) + 2):
+        assert list(find_fasta(io.BytesIO(data), b'ATAT',
+                               block_size)) == expected
+
+    assert len(list(find_fasta(io.BytesIO(data), b'A', 3))) == 10
+    assert not list(find_fasta(io.BytesIO(b''), b'A'))
+
+
 # --------------------------------------------------
 if __name__ == '__main__':
     main()
@@ -0,0 +1,360 @@
+#!/usr/bin/env python3
+"""
+Author : bcheng <bcheng@localhost>
+Date   : 2026-10-18
+Purpose: Find subsequences with a saved suffix array index
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+from typing import BinaryIO, List, NamedTuple, Optional, TextIO, Tuple
+import numpy as np
+from fastx import read_fastx
+
+# Records are joined by a byte that sorts before any base and is never
+# in a motif, so no match can span two records
+SEPARATOR = b'\0'
+
+
+class Args(NamedTuple):
+    """ Command-line arguments """
+    index_dir: str
+    motifs: List[str]
+    build: Optional[BinaryIO]
+    outfile: TextIO
+
+
+class Index(NamedTuple):
+    """ Suffix array index of the joined records """
+    text: np.ndarray
+    sa: np.ndarray
+    lcp: np.ndarray
+    starts: np.ndarray
+    ids: List[str]
+
+
+# --------------------------------------------------
+def get_args() -> Args:
+    """ Get command-line arguments """
+
+    parser = argparse.ArgumentParser(
+        description='Find subsequences with a saved suffix array index',
+        formatter_class=argparse.ArgumentDefaultsHelpFormatter)
+
+    parser.add_argument('index',
+                        metavar='INDEX',
+                        help='Index directory')
+
+    parser.add_argument('motifs',
+                        metavar='MOTIF',
+                        nargs='*',
+                        help='Subsequences to find')
+
+    parser.add_argument('-b',
+                        '--build',
+                        help='Build INDEX from this FASTA file first',
+                        metavar='FILE',
+                        type=argparse.FileType('rb'),
+                        default=None)
+
+    parser.add_argument('-f',
+                        '--file',
+                        help='File of subsequences, one per line',
+                        metavar='FILE',
+                        type=argparse.FileType('rt'),
+                        default=None)
+
+    parser.add_argument('-o',
+                        '--outfile',
+                        help='Output file',
+                        metavar='FILE',
+                        type=argparse.FileType('wt'),
+                        default=sys.stdout)
+
+    args = parser.parse_args()
+
+    if args.file:
+        args.motifs.extend(line.strip() for line in args.file if line.strip())
+
+    if not args.build and not os.path.isdir(args.index):
+        parser.error(f'No index "{args.index}"; build one with --build')
+
+    if not args.build and not args.motifs:
+        parser.error('Nothing to do without motifs or --build')
+
+    return Args(args.index, args.motifs, args.build, args.outfile)
+
+
+# --------------------------------------------------
+def main() -> None:
+    """ Print motif/record/position for every occurrence """
+
+    args = get_args()
+    start = time.perf_counter()
+    if args.build:
+        build_index(args.build, args.index_dir)
+        built = time.perf_counter()
+        print(f'Built "{args.index_dir}" in {built - start:.2f}s.',
+              file=sys.stderr)
+        start = built
+
+    if not args.motifs:
+        return
+
+    index = load_index(args.index_dir)
+    loaded = time.perf_counter()
+
+    print('motif\trecord\tposition', file=args.outfile)
+    num_hits = 0
+    for motif in args.motifs:
+        for rec, pos in locate(index, motif.encode()):
+            num_hits += 1
+            print(f'{motif}\t{index.ids[rec]}\t{pos}', file=args.outfile)
+
+    # Timings go to STDERR to keep the table clean
+    done = time.perf_counter()
+    rate = len(args.motifs) / (done - loaded) if done > loaded else 0
+    num_bases = len(index.text) - len(index.ids)
+    print(f'Loaded {num_bases:,} bases in {loaded - start:.2f}s, '
+          f'found {num_hits:,} hits of {len(args.motifs):,} motifs in '
+          f'{done - loaded:.2f}s ({rate:,.0f} motifs/s).',
+          file=sys.stderr)
+
+
+# --------------------------------------------------
+def build_index(fh: BinaryIO, index_dir: str) -> None:
+    """ Join the records and save the text, suffix array and LCP array """
+
+    ids, seqs = [], []
+    for rec in read_fastx(fh):
+        ids.append(rec.id)
+        seqs.append(rec.seq)
+
+    text = np.frombuffer(SEPARATOR.join(seqs) + SEPARATOR, dtype=np.uint8)
+    starts = np.cumsum([0] + [len(seq) + 1 for seq in seqs[:-1]])
+    sa, levels = suffix_array(text)
+    lcp = lcp_array(sa, levels)
+
+    # Positions fit in 32 bits for all but the largest genomes
+    kind = np.uint32 if len(text) < 2**32 else np.int64
+    os.makedirs(index_dir, exist_ok=True)
+    np.save(os.path.join(index_dir, 'text.npy'), text)
+    np.save(os.path.join(index_dir, 'sa.npy'), sa.astype(kind))
+    np.save(os.path.join(index_dir, 'lcp.npy'), lcp.astype(kind))
+    np.save(os.path.join(index_dir, 'starts.npy'), starts.astype(np.int64))
+    with open(os.path.join(index_dir, 'ids.txt'), 'wt',
+              encoding='utf-8') as out:
+        out.write(''.join(f'{rec_id}\n' for rec_id in ids))
+
+
+# --------------------------------------------------
+def load_index(index_dir: str) -> Index:
+    """ Map the arrays so only the pages a search touches are read """
+
+    # Plain array views of the maps are much cheaper to slice
+    def load(name: str) -> np.ndarray:
+        return np.asarray(np.load(os.path.join(index_dir, name),
+                                  mmap_mode='r'))
+
+    with open(os.path.join(index_dir, 'ids.txt'), encoding='utf-8') as fh:
+        ids = fh.read().splitlines()
+
+    return Index(load('text.npy'), load('sa.npy'), load('lcp.npy'),
+                 load('starts.npy'), ids)
+
+
+# --------------------------------------------------
+def suffix_array(text: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Sort the suffixes by prefix doubling: each round sorts only the
+    suffixes still tied with others on their first 2**j bases, by the
+    rank of the suffix 2**j bases on. Also returns the level at which
+    each suffix was split from the one before it: 0 if their first bases
+    differ, else j + 1 for the round with step 2**j, so their LCP is at
+    least 2**j and less than 2**(j + 1).
+    """
+
+    size = len(text)
+    kind = np.int32 if size < 2**31 else np.int64
+    sa: np.ndarray = np.argsort(text, kind='stable').astype(kind)
+    levels = np.zeros(size, dtype=np.uint8)
+
+    # A suffix's rank is where its group starts in the suffix array, so
+    # a group that is sorted never needs its ranks changed again
+    rank = np.empty(size, dtype=kind)
+    rank[sa], tied = group_heads(np.arange(size), text[sa])
+    step = 1
+
+    while tied.any():
+        slots = np.flatnonzero(tied)
+        suffixes = sa[slots]
+        first = rank[suffixes].astype(np.int64)
+        second = np.full(len(suffixes), -1, dtype=np.int64)
+        inside = suffixes < size - step
+        second[inside] = rank[suffixes[inside] + step]
+
+        # Groups keep their slots, so sorting on the rank first puts
+        # each back in its own range
+        if size < 3 * 10**9:
+            order = np.argsort(first * (size + 1) + second + 1, kind='stable')
+        else:
+            order = np.lexsort((second, first))
+        sa[slots] = suffixes[order]
+        first, second = first[order], second[order]
+        rank[sa[slots]], tied[slots] = group_heads(slots, first, second)
+
+        # Neighbors from one group that no longer tie split in this round
+        split = (first[1:] == first[:-1]) & (second[1:] != second[:-1])
+        levels[slots[1:][split]] = step.bit_length()
+        step *= 2
+
+    return sa, levels
+
+
+# --------------------------------------------------
+def group_heads(slots: np.ndarray,
+                *keys: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    For suffixes in sorted slots, the slot where each one's run of equal
+    keys starts, and whether that run holds more than one suffix
+    """
+
+    if not slots.size:
+        return slots, np.zeros(0, dtype=bool)
+
+    same = np.ones(len(slots) - 1, dtype=bool)
+    for key in keys:
+        same &= key[1:] == key[:-1]
+    starts = np.concatenate([[True], ~same])
+    heads = np.maximum.accumulate(np.where(starts, np.arange(len(slots)), 0))
+    group = np.cumsum(starts) - 1
+    return slots[heads], np.bincount(group)[group] > 1
+
+
+# --------------------------------------------------
+def lcp_array(sa: np.ndarray, levels: np.ndarray) -> np.ndarray:
+    """
+    Longest common prefix of each suffix with the one before it. The
+    level a pair split at gives the top bit of its LCP, and the lower
+    bits are found for all pairs at once from the next level down: the
+    first 2**j bases of two suffixes match if no suffix between them
+    split at level j or below.
+    """
+
+    size = len(sa)
+    lcp = np.zeros(size, dtype=sa.dtype)
+    if size < 2:
+        return lcp
+
+    tops = levels.astype(sa.dtype)
+    lcp[tops > 0] = 1 << (tops[tops > 0] - 1)
+    rank = np.empty(size, dtype=sa.dtype)
+    rank[sa] = np.arange(size, dtype=sa.dtype)
+
+    for level in reversed(range(int(levels.max()) - 1)):
+        rows = np.flatnonzero(levels >= level + 2)
+        left, right = sa[rows - 1] + lcp[rows], sa[rows] + lcp[rows]
+        inside = np.maximum(left, right) < size
+        rows, left, right = rows[inside], left[inside], right[inside]
+
+        # Suffixes in the same group share their first 2**level bases
+        groups = np.cumsum(levels <= level, dtype=sa.dtype)
+        same = groups[rank[left]] == groups[rank[right]]
+        lcp[rows[same]] += 1 << level
+
+    return lcp
+
+
+# --------------------------------------------------
+def locate(index: Index, motif: bytes) -> List[Tuple[int, int]]:
+    """
+    (record, 1-based position) of every occurrence: a binary search for
+    the first suffix starting with the motif, then the LCP array says how
+    many more follow
+    """
+
+    size = len(motif)
+    if not size or SEPARATOR in motif:
+        return []
+
+    # Memory views skip the NumPy overhead on single elements
+    text, sa = index.text.data, index.sa.data
+    low, high = 0, len(sa)
+    while low < high:
+        mid = (low + high) // 2
+        if bytes(text[sa[mid]:sa[mid] + size]) < motif:
+            low = mid + 1
+        else:
+            high = mid
+
+    first = low
+    if first == len(sa) or bytes(text[sa[first]:sa[first] + size]) != motif:
+        return []
+
+    # Scan ahead in growing windows for the first LCP below the motif
+    last = first + 1
+    window = 64
+    while last < len(sa):
+        short = np.flatnonzero(index.lcp[last:last + window] < size)
+        if len(short):
+            last += int(short[0])
+            break
+        last += window
+        window *= 2
+    last = min(last, len(sa))
+
+    positions = np.sort(index.sa[first:last].astype(np.int64))
+    recs = np.searchsorted(index.starts, positions, side='right') - 1
+    return list(zip(recs.tolist(), (positions - index.starts[recs] +
+                                    1).tolist()))
+
+
+# --------------------------------------------------
+def test_suffix_array() -> None:
+    """ Suffix and LCP arrays match sorting the suffixes """
+
+    for seq in [b'', b'A', b'banana', b'GATATATGCATATACTT\0ATAT\0',
+                b'AAAAAAAAAAAAAAAAAAAAAAAAA', b'ACGTACGTTGCA' * 7]:
+        text = np.frombuffer(seq, dtype=np.uint8)
+        sa, levels = suffix_array(text)
+        expected = [i for _, i in sorted((seq[i:], i)
+                                         for i in range(len(seq)))]
+        assert sa.tolist() == expected
+
+        lcp = lcp_array(sa, levels).tolist()
+        for i in range(1, len(seq)):
+            a, b = seq[expected[i - 1]:], seq[expected[i]:]
+            assert lcp[i] == next(
+                (j for j, (x, y) in enumerate(zip(a, b)) if x != y),
+                min(len(a), len(b)))
+
+
+# --------------------------------------------------
+def test_locate() -> None:
+    """ Locate across records """
+
+    with tempfile.TemporaryDirectory() as tmp:
+        fasta = os.path.join(tmp, 'seqs.fa')
+        with open(fasta, 'wt', encoding='utf-8') as fh:
+            fh.write('>s1\nGATATATGCATATACTT\n>s2\nATATA\n>s3\n\n>s4\nTAT\n')
+
+        with open(fasta, 'rb') as fh:
+            build_index(fh, os.path.join(tmp, 'index'))
+        index = load_index(os.path.join(tmp, 'index'))
+
+        assert locate(index, b'ATAT') == [(0, 2), (0, 4), (0, 10), (1, 1)]
+        assert locate(index, b'TAT') == [(0, 3), (0, 5), (0, 11), (1, 2),
+                                         (3, 1)]
+        assert not locate(index, b'TTA')
+        assert locate(index, b'TATG') == [(0, 5)]
+        assert not locate(index, b'GATATATGCATATACTTA')
+        assert not locate(index, b'')
+        assert len(locate(index, b'T')) == 11
+
+
+# --------------------------------------------------
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,72 @@
+""" Tests for aho.py """
+
+import os
+import platform
+import random
+import re
+import string
+from subprocess import getoutput, getstatusoutput
+
+PRG = './aho.py'
+RUN = f'python {PRG}' if platform.system() == 'Windows' else PRG
+PRIMERS = './tests/inputs/primers.fa'
+SEQS = './tests/inputs/seqs.fa'
+
+
+# --------------------------------------------------
+def test_exists() -> None:
+    """ Program exists """
+
+    assert os.path.isfile(PRG)
+
+
+# --------------------------------------------------
+def test_usage() -> None:
+    """ Usage """
+
+    for arg in ['', '-h', '--help']:
+        out = getoutput(f'{RUN} {arg}')
+        assert out.lower().startswith('usage:')
+
+
+# --------------------------------------------------
+def test_bad_file() -> None:
+    """ Dies on a missing file """
+
+    bad = ''.join(random.choices(string.ascii_letters, k=10))
+    rv, out = getstatusoutput(f'{RUN} {PRIMERS} {bad}')
+    assert rv != 0
+    assert re.search(f"No such file or directory: '{bad}'", out)
+
+
+# --------------------------------------------------
+def test_fasta_patterns() -> None:
+    """ Finds overlapping hits of every pattern """
+
+    rv, out = getstatusoutput(f'{RUN} {PRIMERS} {SEQS} 2>/dev/null')
+    assert rv == 0
+    assert out.splitlines() == [
+        'pattern\trecord\tposition', 'p1\tseq1\t2', 'p2\tseq1\t3',
+        'p1\tseq1\t4', 'p1\tseq1\t10', 'p2\tseq1\t11', 'adapter\tseq1\t8',
+        'p1\tseq2\t1', 'p2\tseq2\t2'
+    ]
+
+
+# --------------------------------------------------
+def test_list_patterns() -> None:
+    """ Patterns one per line are named by themselves """
+
+    out = getoutput(f'{RUN} ./tests/inputs/primers.txt {SEQS} 2>/dev/null')
+    assert out.splitlines()[1:4] == [
+        'ATAT\tseq1\t2', 'TATA\tseq1\t3', 'ATAT\tseq1\t4'
+    ]
+
+
+# --------------------------------------------------
+def test_stats() -> None:
+    """ Reports the automaton and throughput on STDERR """
+
+    out = getoutput(f'{RUN} {PRIMERS} {SEQS} 2>&1 >/dev/null')
+    assert re.match(
+        r'Built 21 states for 4 patterns in \S+s, found 8 hits in 22 bases '
+        r'in \S+s \(\S+ MB/s\)\.$', out)
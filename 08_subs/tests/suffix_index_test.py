@@ -0,0 +1,66 @@
+""" Tests for suffix_index.py """
+
+import os
+import platform
+import random
+import re
+import string
+import tempfile
+from subprocess import getoutput, getstatusoutput
+
+PRG = './suffix_index.py'
+RUN = f'python {PRG}' if platform.system() == 'Windows' else PRG
+SEQS = './tests/inputs/seqs.fa'
+MOTIFS = './tests/inputs/motifs.txt'
+
+
+# --------------------------------------------------
+def test_exists() -> None:
+    """ Program exists """
+
+    assert os.path.isfile(PRG)
+
+
+# --------------------------------------------------
+def test_usage() -> None:
+    """ Usage """
+
+    for arg in ['', '-h', '--help']:
+        out = getoutput(f'{RUN} {arg}')
+        assert out.lower().startswith('usage:')
+
+
+# --------------------------------------------------
+def test_no_index() -> None:
+    """ Dies on a missing index """
+
+    bad = ''.join(random.choices(string.ascii_letters, k=10))
+    rv, out = getstatusoutput(f'{RUN} {bad} ATAT')
+    assert rv != 0
+    assert re.search(f'No index "{bad}"; build one with --build', out)
+
+
+# --------------------------------------------------
+def test_build_and_query() -> None:
+    """ Builds an index, then queries it again without rebuilding """
+
+    with tempfile.TemporaryDirectory() as tmp:
+        index = os.path.join(tmp, 'index')
+        rv, out = getstatusoutput(f'{RUN} -b {SEQS} {index}')
+        assert rv == 0
+        assert re.match(f'Built "{index}" in \\S+s\\.$', out)
+        assert sorted(os.listdir(index)) == [
+            'ids.txt', 'lcp.npy', 'sa.npy', 'starts.npy', 'text.npy'
+        ]
+
+        rv, out = getstatusoutput(f'{RUN} {index} TATG -f {MOTIFS}')
+        assert rv == 0
+        lines = out.splitlines()
+        assert lines[:-1] == [
+            'motif\trecord\tposition', 'TATG\tseq1\t5', 'ATAT\tseq1\t2',
+            'ATAT\tseq1\t4', 'ATAT\tseq1\t10', 'ATAT\tseq2\t1',
+            'TAT\tseq1\t3', 'TAT\tseq1\t5', 'TAT\tseq1\t11', 'TAT\tseq2\t2'
+        ]
+        assert re.match(
+            r'Loaded 22 bases in \S+s, found 9 hits of 4 motifs in \S+s '
+            r'\(\S+ motifs/s\)\.$', lines[-1])
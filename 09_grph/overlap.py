@@ -0,0 +1,707 @@
+#!/usr/bin/env python3
+"""
+Author : bcheng <bcheng@localhost>
+Date   : 2026-10-18
+Purpose: Overlap graphs for millions of reads
+"""
+
+import argparse
+import gzip
+import io
+import random
+import sys
+import time
+from array import array
+from contextlib import contextmanager
+from typing import (BinaryIO, Callable, Dict, Iterator, NamedTuple, Sequence,
+                    TextIO, Tuple)
+import numpy as np
+from fastx import read_fastx
+
+# Edges are made and written this many at a time
+CHUNK_EDGES = 1 << 20
+
+# ACGT k-mers up to this long are their own 2-bit code in an int64
+MAX_PACKED = 31
+TO_DIGITS = bytes.maketrans(b'ACGT', b'0123')
+
+# Two polynomial hashes modulo primes below 2**31 make a 62-bit key, and
+# no product of two numbers below a prime can overflow an int64
+PRIMES = (2147483647, 2147483629)
+BASES = (1000003, 999983)
+
+# Source and target read indexes
+Edges = Tuple[np.ndarray, np.ndarray]
+
+# Source and target read indexes with overlap lengths
+WeightedEdges = Tuple[np.ndarray, np.ndarray, np.ndarray]
+
+# Graphviz takes minutes to lay out more edges than this
+MAX_RENDER_EDGES = 5000
+
+
+class Args(NamedTuple):
+    """ Command-line arguments """
+    file: BinaryIO
+    k: int
+    maximal: bool
+    fmt: str
+    render: bool
+    outfile: str
+
+
+class Names:
+    """ Read IDs stored end to end, taking far less memory than strings """
+
+    def __init__(self, text: bytes, ends: Sequence[int]) -> None:
+        self.text = text
+        self.ends = ends
+
+    def __len__(self) -> int:
+        return len(self.ends)
+
+    def __getitem__(self, read: int) -> str:
+        start = self.ends[read - 1] if read else 0
+        return self.text[start:self.ends[read]].decode()
+
+
+class Reads(NamedTuple):
+    """ Read IDs and the codes of their first and last k-mers """
+    names: Names
+    prefixes: np.ndarray
+    suffixes: np.ndarray
+
+
+class Seqs(NamedTuple):
+    """ Read IDs and all their bases joined together """
+    names: Names
+    bases: np.ndarray
+    starts: np.ndarray
+    lengths: np.ndarray
+
+
+# --------------------------------------------------
+def get_args() -> Args:
+    """ Get command-line arguments """
+
+    parser = argparse.ArgumentParser(
+        description='Overlap graphs for millions of reads',
+        formatter_class=argparse.ArgumentDefaultsHelpFormatter)
+
+    parser.add_argument('file',
+                        metavar='FILE',
+                        type=argparse.FileType('rb'),
+                        help='FASTA/FASTQ file')
+
+    parser.add_argument('-k',
+                        '--overlap',
+                        help='Size of overlap',
+                        metavar='size',
+                        type=int,
+                        default=3)
+
+    parser.add_argument('-m',
+                        '--maximal',
+                        help='Longest overlap of each pair, of at least k '
+                        'and shorter than both reads',
+                        action='store_true')
+
+    parser.add_argument('-f',
+                        '--format',
+                        help='Output format: edge list, GFA, gzipped edge '
+                        'list, sparse matrix or Graphviz',
+                        metavar='format',
+                        choices=['adj', 'gfa', 'gz', 'npz', 'dot'],
+                        default='adj')
+
+    parser.add_argument('-r',
+                        '--render',
+                        help=f'Render a dot file of up to {MAX_RENDER_EDGES:,}'
+                        ' edges to PDF with graphviz',
+                        action='store_true')
+
+    parser.add_argument('-o',
+                        '--outfile',
+                        help='Output file, - for STDOUT',
+                        metavar='FILE',
+                        type=str,
+                        default='-')
+
+    args = parser.parse_args()
+
+    if args.overlap < 1:
+        parser.error(f'-k "{args.overlap}" must be > 0')
+
+    if args.render and args.format != 'dot':
+        parser.error('--render needs --format dot')
+
+    if args.outfile == '-' and (args.format == 'npz' or args.render):
+        parser.error(f'--format {args.format}'
+                     f'{" --render" if args.render else ""} needs --outfile')
+
+    return Args(args.file, args.overlap, args.maximal, args.format,
+                args.render, args.outfile)
+
+
+# --------------------------------------------------
+def main() -> None:
+    """ Write the edges in chunks as they are found """
+
+    args = get_args()
+    start = time.perf_counter()
+    edges: Iterator[WeightedEdges]
+    if args.maximal:
+        seqs = read_seqs(args.file)
+        names = seqs.names
+        edges = maximal_overlaps(seqs, args.k)
+    else:
+        reads = read_ends(args.file, args.k)
+        names = reads.names
+        edges = ((sources, targets, np.full(len(sources), args.k))
+                 for sources, targets in overlaps(reads.prefixes,
+                                                  reads.suffixes))
+    indexed = time.perf_counter()
+    num_edges = WRITERS[args.fmt](edges, names, args.maximal, args.outfile)
+
+    # Timings go to STDERR to keep the edges clean
+    done = time.perf_counter()
+    print(f'Read {len(names):,} reads in {indexed - start:.2f}s, '
+          f'wrote {num_edges:,} edges in {done - indexed:.2f}s.',
+          file=sys.stderr)
+
+    if args.render:
+        render(args.outfile, num_edges)
+
+
+# --------------------------------------------------
+def read_ends(fh: BinaryIO, k: int) -> Reads:
+    """
+    Keep only the ID and the codes of the first and last k-mers of each
+    read; reads shorter than k get the code -1 on both ends
+    """
+
+    names = bytearray()
+    name_ends = array('q')
+    prefixes, suffixes = array('q'), array('q')
+    others: Dict[bytes, int] = {}
+
+    for rec in read_fastx(fh):
+        names += rec.id.encode()
+        name_ends.append(len(names))
+        if len(rec.seq) < k:
+            prefixes.append(-1)
+            suffixes.append(-1)
+        else:
+            prefixes.append(encode(rec.seq[:k], others))
+            suffixes.append(encode(rec.seq[-k:], others))
+
+    return Reads(Names(bytes(names), name_ends),
+                 np.frombuffer(prefixes, dtype=np.int64),
+                 np.frombuffer(suffixes, dtype=np.int64))
+
+
+# --------------------------------------------------
+def read_seqs(fh: BinaryIO) -> Seqs:
+    """ Keep each read's ID and bases, joined into one array """
+
+    names = bytearray()
+    name_ends = array('q')
+    bases = bytearray()
+    lengths = array('q')
+
+    for rec in read_fastx(fh):
+        names += rec.id.encode()
+        name_ends.append(len(names))
+        bases += rec.seq
+        lengths.append(len(rec.seq))
+
+    sizes = np.frombuffer(lengths, dtype=np.int64)
+    return Seqs(Names(bytes(names), name_ends),
+                np.frombuffer(bytes(bases), dtype=np.uint8),
+                np.cumsum(sizes) - sizes, sizes)
+
+
+# --------------------------------------------------
+def encode(kmer: bytes, others: Dict[bytes, int]) -> int:
+    """
+    Short ACGT k-mers are their 2-bit code; any other is numbered from -2
+    down in the order first seen, so equal k-mers share a code
+    """
+
+    if len(kmer) <= MAX_PACKED:
+        try:
+            return int(kmer.translate(TO_DIGITS), 4)
+        except ValueError:
+            pass
+
+    return others.setdefault(kmer, -2 - len(others))
+
+
+# --------------------------------------------------
+def overlaps(prefixes: np.ndarray,
+             suffixes: np.ndarray,
+             chunk_edges: int = CHUNK_EDGES) -> Iterator[Edges]:
+    """
+    Join reads whose suffix code equals another's prefix code by sorting
+    both, yielding (source, target) read indexes in chunks
+    """
+
+    by_prefix = np.argsort(prefixes)
+    sorted_prefixes = prefixes[by_prefix]
+    by_suffix = np.argsort(suffixes)
+    codes, suffix_starts, suffix_counts = np.unique(suffixes[by_suffix],
+                                                    return_index=True,
+                                                    return_counts=True)
+
+    # Each read ending with a shared k-mer joins a run of sorted prefixes
+    prefix_starts = np.searchsorted(sorted_prefixes, codes, side='left')
+    prefix_counts = np.searchsorted(sorted_prefixes, codes,
+                                    side='right') - prefix_starts
+    shared = (prefix_counts > 0) & (codes != -1)
+    counts = suffix_counts[shared]
+    rows = by_suffix[ranges(suffix_starts[shared], counts)]
+    starts = np.repeat(prefix_starts[shared], counts)
+    widths = np.repeat(prefix_counts[shared], counts)
+
+    # Chunks end between rows, so even a k-mer shared by most reads is
+    # expanded a piece at a time
+    ends = np.cumsum(widths)
+    first = 0
+    while first < len(rows):
+        done = int(ends[first - 1]) if first else 0
+        last = max(first + 1,
+                   int(np.searchsorted(ends, done + chunk_edges, 'right')))
+        sources = np.repeat(rows[first:last], widths[first:last])
+        targets = by_prefix[ranges(starts[first:last], widths[first:last])]
+        keep = sources != targets
+        yield sources[keep], targets[keep]
+        first = last
+
+
+# --------------------------------------------------
+def maximal_overlaps(
+        seqs: Seqs,
+        min_len: int,
+        chunk_edges: int = CHUNK_EDGES) -> Iterator[WeightedEdges]:
+    """
+    Every pair of reads whose longest suffix-prefix overlap is at least
+    min_len and shorter than both reads, found from the longest possible
+    overlap down: each step drops a base from the hashed prefix and suffix
+    of every read still long enough and joins them as fixed-k overlaps do,
+    then checks the bases of each match
+    """
+
+    # Longest reads first, so the reads longer than any length are always
+    # a leading slice and their hashes are updated in place
+    order = np.argsort(-seqs.lengths, kind='stable')
+    starts = seqs.starts[order]
+    ends = starts + seqs.lengths[order]
+    max_len = int(ends[0] - starts[0]) if len(order) else 0
+    num_longer = np.searchsorted(starts - ends, -np.arange(max_len + 1),
+                                 'left')
+
+    # Whole-read hashes built a position at a time; two hashes make a
+    # false match unlikely, and the bases are checked anyway
+    prefix = [np.zeros(len(order), dtype=np.int64) for _ in PRIMES]
+    for pos in range(max_len):
+        num = num_longer[pos]
+        codes = seqs.bases[starts[:num] + pos]
+        for hashes, prime, base in zip(prefix, PRIMES, BASES):
+            hashes[:num] = (hashes[:num] * base + codes) % prime
+    suffix = [hashes.copy() for hashes in prefix]
+    borders = longest_borders(seqs.bases, starts, num_longer)
+
+    inverses = [pow(base, -1, prime) for prime, base in zip(PRIMES, BASES)]
+    for length in range(max_len - 1, max(min_len, 1) - 1, -1):
+        # Drop the last base of each prefix and the first of each suffix
+        num = num_longer[length]
+        last = seqs.bases[starts[:num] + length].astype(np.int64)
+        first = seqs.bases[ends[:num] - length - 1].astype(np.int64)
+        for hashes, prime, inverse in zip(prefix, PRIMES, inverses):
+            hashes[:num] = (hashes[:num] - last) % prime * inverse % prime
+        for hashes, prime, base in zip(suffix, PRIMES, BASES):
+            hashes[:num] = (hashes[:num] -
+                            first * pow(base, length, prime)) % prime
+
+        prefix_keys = prefix[0][:num] * PRIMES[1] + prefix[1][:num]
+        suffix_keys = suffix[0][:num] * PRIMES[1] + suffix[1][:num]
+        for sources, targets in overlaps(prefix_keys, suffix_keys,
+                                         chunk_edges):
+            keep = same_bases(seqs.bases, ends[sources] - length,
+                              starts[targets], length)
+
+            # A pair that matched at a longer length matches again here
+            # only if this prefix of the target is also a suffix of a
+            # longer one, which few reads have
+            for row in np.flatnonzero(keep & (borders[targets] >= length)):
+                keep[row] = not longer_overlap(
+                    seqs.bases[starts[sources[row]]:ends[sources[row]]],
+                    seqs.bases[starts[targets[row]]:ends[targets[row]]],
+                    length)
+
+            if keep.any():
+                yield (order[sources[keep]], order[targets[keep]],
+                       np.full(np.count_nonzero(keep), length))
+
+
+# --------------------------------------------------
+def longest_borders(bases: np.ndarray, starts: np.ndarray,
+                    num_longer: np.ndarray) -> np.ndarray:
+    """
+    Longest border, a prefix that is also a suffix, of any prefix of each
+    read, from the KMP failure function of all the reads at once; reads
+    are longest first, so num_longer[pos] of them have a base at pos
+    """
+
+    longest = np.zeros(len(starts), dtype=np.int64)
+    if not num_longer.size:
+        return longest
+
+    # Each read's failure values sit where its bases do
+    fail = np.zeros(len(bases), dtype=np.min_scalar_type(len(num_longer)))
+    for pos in range(1, len(num_longer) - 1):
+        num = num_longer[pos]
+        base = bases[starts[:num] + pos]
+        border = fail[starts[:num] + pos - 1].astype(np.int64)
+
+        # Fall back to shorter borders until the next base extends one
+        rows = np.flatnonzero(border)
+        rows = rows[bases[starts[rows] + border[rows]] != base[rows]]
+        while rows.size:
+            border[rows] = fail[starts[rows] + border[rows] - 1]
+            rows = rows[border[rows] > 0]
+            rows = rows[bases[starts[rows] + border[rows]] != base[rows]]
+
+        border += bases[starts[:num] + border] == base
+        fail[starts[:num] + pos] = border
+        np.maximum(longest[:num], border, out=longest[:num])
+
+    return longest
+
+
+# --------------------------------------------------
+def same_bases(bases: np.ndarray, first: np.ndarray, second: np.ndarray,
+               length: int) -> np.ndarray:
+    """
+    Which pairs of offsets start the same length bases, compared in blocks
+    of about a million bases
+    """
+
+    keep = np.ones(len(first), dtype=bool)
+    width = max(1, (1 << 20) // max(len(first), 1))
+    for offset in range(0, length, width):
+        rows = np.flatnonzero(keep)
+        cols = np.arange(offset, min(offset + width, length))
+        left = bases[first[rows, None] + cols]
+        right = bases[second[rows, None] + cols]
+        keep[rows] = (left == right).all(axis=1)
+
+    return keep
+
+
+# --------------------------------------------------
+def longer_overlap(source: np.ndarray, target: np.ndarray,
+                   length: int) -> bool:
+    """ Whether two reads overlap by more than length bases """
+
+    first, second = source.tobytes(), target.tobytes()
+    return any(
+        first.endswith(second[:size])
+        for size in range(length + 1, min(len(first), len(second))))
+
+
+# --------------------------------------------------
+def ranges(starts: np.ndarray, counts: np.ndarray) -> np.ndarray:
+    """ Concatenate the ranges of counts[i] numbers from starts[i] """
+
+    return np.repeat(starts - np.cumsum(counts) + counts,
+                     counts) + np.arange(counts.sum())
+
+
+# --------------------------------------------------
+@contextmanager
+def open_text(outfile: str) -> Iterator[TextIO]:
+    """ Open a file for text, or use STDOUT for - """
+
+    if outfile == '-':
+        yield sys.stdout
+    else:
+        with open(outfile, 'wt', encoding='utf-8') as fh:
+            yield fh
+
+
+# --------------------------------------------------
+def write_lines(fh: TextIO, edges: Iterator[WeightedEdges], names: Names,
+                weighted: bool) -> int:
+    """ Source and target IDs, and the overlap length if weighted """
+
+    num_edges = 0
+    for sources, targets, lengths in edges:
+        num_edges += len(sources)
+        if weighted:
+            fh.writelines(f'{names[source]} {names[target]} {length}\n'
+                          for source, target, length in zip(
+                              sources.tolist(), targets.tolist(),
+                              lengths.tolist()))
+        else:
+            fh.writelines(
+                f'{names[source]} {names[target]}\n'
+                for source, target in zip(sources.tolist(), targets.tolist()))
+
+    return num_edges
+
+
+# --------------------------------------------------
+def write_adj(edges: Iterator[WeightedEdges], names: Names, weighted: bool,
+              outfile: str) -> int:
+    """ Rosalind adjacency list, one edge per line """
+
+    with open_text(outfile) as fh:
+        return write_lines(fh, edges, names, weighted)
+
+
+# --------------------------------------------------
+def write_gz(edges: Iterator[WeightedEdges], names: Names, weighted: bool,
+             outfile: str) -> int:
+    """ Adjacency list with gzip """
+
+    # The lowest level is several times faster and the IDs still shrink
+    with gzip.open(sys.stdout.buffer if outfile == '-' else outfile,
+                   'wt',
+                   compresslevel=1,
+                   encoding='utf-8') as fh:
+        return write_lines(fh, edges, names, weighted)
+
+
+# --------------------------------------------------
+def write_gfa(edges: Iterator[WeightedEdges], names: Names, _weighted: bool,
+              outfile: str) -> int:
+    """ GFA 1 with a segment per read and a link per overlap """
+
+    num_edges = 0
+    with open_text(outfile) as fh:
+        fh.write('H\tVN:Z:1.0\n')
+        fh.writelines(f'S\t{names[read]}\t*\n' for read in range(len(names)))
+        for sources, targets, lengths in edges:
+            num_edges += len(sources)
+            fh.writelines(f'L\t{names[source]}\t+\t{names[target]}\t+\t'
+                          f'{length}M\n' for source, target, length in zip(
+                              sources.tolist(), targets.tolist(),
+                              lengths.tolist()))
+
+    return num_edges
+
+
+# --------------------------------------------------
+def write_npz(edges: Iterator[WeightedEdges], names: Names, _weighted: bool,
+              outfile: str) -> int:
+    """
+    Sparse matrix of overlap lengths in the CSR layout that
+    scipy.sparse.load_npz reads, with the IDs joined by newlines
+    """
+
+    # Rows must be in order, so only the compact columns are kept
+    kind = np.int32 if len(names) < 2**31 else np.int64
+    chunks = [(sources.astype(kind), targets.astype(kind),
+               lengths.astype(np.int32))
+              for sources, targets, lengths in edges]
+    parts = list(zip(*chunks)) or [[np.zeros(0, dtype=kind)]] * 3
+    sources, targets, lengths = (np.concatenate(part) for part in parts)
+
+    order = np.lexsort((targets, sources))
+    indptr = np.zeros(len(names) + 1, dtype=np.int64)
+    np.cumsum(np.bincount(sources, minlength=len(names)), out=indptr[1:])
+    ids = np.insert(np.frombuffer(names.text, dtype=np.uint8),
+                    np.asarray(names.ends[:-1]), ord('\n'))
+    with open(outfile, 'wb') as fh:
+        np.savez_compressed(fh,
+                            format=np.array(b'csr'),
+                            shape=np.array([len(names), len(names)]),
+                            data=lengths[order],
+                            indices=targets[order],
+                            indptr=indptr,
+                            ids=ids)
+
+    return len(order)
+
+
+# --------------------------------------------------
+def write_dot(edges: Iterator[WeightedEdges], names: Names, weighted: bool,
+              outfile: str) -> int:
+    """ Graphviz source, with overlap lengths as labels if weighted """
+
+    num_edges = 0
+    with open_text(outfile) as fh:
+        fh.write('digraph {\n')
+        for sources, targets, lengths in edges:
+            num_edges += len(sources)
+            fh.writelines(f'\t{dot_id(names[source])} -> '
+                          f'{dot_id(names[target])}'
+                          f'{f" [label={length}]" if weighted else ""}\n'
+                          for source, target, length in zip(
+                              sources.tolist(), targets.tolist(),
+                              lengths.tolist()))
+        fh.write('}\n')
+
+    return num_edges
+
+
+# --------------------------------------------------
+def dot_id(name: str) -> str:
+    """ Quote an ID for DOT, escaping the quotes and backslashes in it """
+
+    return '"' + name.replace('\\', '\\\\').replace('"', '\\"') + '"'
+
+
+# Each writes the edges in chunks and returns the number written
+Writer = Callable[[Iterator[WeightedEdges], Names, bool, str], int]
+WRITERS: Dict[str, Writer] = {
+    'adj': write_adj,
+    'gfa': write_gfa,
+    'gz': write_gz,
+    'npz': write_npz,
+    'dot': write_dot,
+}
+
+
+# --------------------------------------------------
+def render(dot_file: str, num_edges: int, view: bool = False) -> None:
+    """ Lay out a small dot file to PDF, only importing graphviz if asked """
+
+    if num_edges > MAX_RENDER_EDGES:
+        sys.exit(f'Too many edges ({num_edges:,}) to render, '
+                 f'max {MAX_RENDER_EDGES:,}')
+
+    # pylint: disable=import-outside-toplevel
+    import graphviz
+
+    pdf = graphviz.render('dot', 'pdf', dot_file)
+    if view:
+        graphviz.view(pdf)
+
+
+# --------------------------------------------------
+def test_dot_id() -> None:
+    """ Test dot_id """
+
+    assert dot_id('Rosalind_0498') == '"Rosalind_0498"'
+    assert dot_id('a"b') == '"a\\"b"'
+    assert dot_id('a\\') == '"a\\\\"'
+
+
+# --------------------------------------------------
+def test_encode() -> None:
+    """ Test encode """
+
+    others: Dict[bytes, int] = {}
+    assert encode(b'AAA', others) == 0
+    assert encode(b'ACGT', others) == 27
+    assert encode(b'T' * 31, others) == 4**31 - 1
+    assert encode(b'ANA', others) == -2
+    assert encode(b'T' * 32, others) == -3
+    assert encode(b'ANA', others) == -2
+    assert encode(b'acg', others) == -4
+
+
+# --------------------------------------------------
+def test_ranges() -> None:
+    """ Test ranges """
+
+    assert ranges(np.array([5, 0, 9]), np.array([3, 0, 2])).tolist() == [
+        5, 6, 7, 9, 10
+    ]
+    assert not ranges(np.array([], dtype=int), np.array([], dtype=int)).size
+
+
+# --------------------------------------------------
+def test_overlaps() -> None:
+    """ Matches comparing every pair of reads """
+
+    seqs = [
+        b'AAATAAA', b'AAATTTT', b'TTTTCCC', b'AAATCCC', b'GGGTGGG', b'AA',
+        b'AAANAAA', b'AAAN'
+    ]
+    for k in range(1, 5):
+        fasta = b''.join(b'>r%d\n%s\n' % (i, seq)
+                         for i, seq in enumerate(seqs))
+        reads = read_ends(io.BytesIO(fasta), k)
+        expected = {(i, j)
+                    for i, s1 in enumerate(seqs) for j, s2 in enumerate(seqs)
+                    if i != j and len(s1) >= k and len(s2) >= k
+                    and s1[-k:] == s2[:k]}
+
+        for chunk_edges in [1, 2, 100]:
+            found = [(i, j) for sources, targets in overlaps(
+                reads.prefixes, reads.suffixes, chunk_edges)
+                     for i, j in zip(sources.tolist(), targets.tolist())]
+            assert len(found) == len(set(found))
+            assert set(found) == expected
+
+
+# --------------------------------------------------
+def test_longest_borders() -> None:
+    """ Matches checking every prefix of every read """
+
+    seqs = [b'ACGTACGA', b'AAAA', b'ABAB', b'ACGT', b'', b'ABACABAB', b'A']
+    bases = np.frombuffer(b''.join(seqs), dtype=np.uint8)
+    lengths = np.array([len(seq) for seq in seqs])
+    order = np.argsort(-lengths, kind='stable')
+    num_longer = np.searchsorted(-lengths[order], -np.arange(9), 'left')
+    starts = (np.cumsum(lengths) - lengths)[order]
+
+    expected = [
+        max((size for end in range(len(seq) + 1) for size in range(end)
+             if seq[:size] == seq[end - size:end]),
+            default=0) for seq in seqs
+    ]
+    assert longest_borders(bases, starts,
+                           num_longer).tolist() == [expected[read]
+                                                    for read in order]
+
+
+# --------------------------------------------------
+def test_same_bases() -> None:
+    """ Compares the bases at pairs of offsets """
+
+    bases = np.frombuffer(b'ACGTACGTTT', dtype=np.uint8)
+    first, second = np.array([0, 0, 1, 3]), np.array([4, 1, 5, 7])
+    assert same_bases(bases, first, second, 1).tolist() == [
+        True, False, True, True
+    ]
+    assert same_bases(bases, first, second, 2).tolist() == [
+        True, False, True, False
+    ]
+    assert not same_bases(bases, first[:0], second[:0], 3).size
+
+
+# --------------------------------------------------
+def test_maximal_overlaps() -> None:
+    """ Matches the longest overlap of every pair of reads """
+
+    rand = random.Random(1)
+    seqs = [bytes(rand.choices(b'AC', k=rand.randrange(12)))
+            for _ in range(40)] + [b'AAAA', b'AAAA', b'']
+    fasta = b''.join(b'>r%d\n%s\n' % (i, seq) for i, seq in enumerate(seqs))
+    for min_len in [0, 1, 3]:
+        expected = {}
+        for i, s1 in enumerate(seqs):
+            for j, s2 in enumerate(seqs):
+                length = next((n for n in reversed(
+                    range(max(min_len, 1), min(len(s1), len(s2))))
+                               if s1[-n:] == s2[:n]), 0)
+                if i != j and length:
+                    expected[(i, j)] = length
+
+        for chunk_edges in [1, 100]:
+            found = [(i, j, n) for sources, targets, lengths in
+                     maximal_overlaps(read_seqs(io.BytesIO(fasta)), min_len,
+                                      chunk_edges)
+                     for i, j, n in zip(sources.tolist(), targets.tolist(),
+                                        lengths.tolist())]
+            assert len(found) == len(expected)
+            assert {(i, j): n for i, j, n in found} == expected
+
+
+# --------------------------------------------------
+if __name__ == '__main__':
+    main()
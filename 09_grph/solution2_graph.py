@@ -5,12 +5,13 @@ import argparse
 import logging
 import operator as op
 from collections import defaultdict
-from itertools import product
+from itertools import accumulate, product
 from pprint import pformat
 from typing import List, NamedTuple, TextIO
+import numpy as np
 from Bio import SeqIO
 from iteration_utilities import starfilter
-from graphviz import Digraph
+from overlap import WRITERS, Names, render
 
 
 class Args(NamedTuple):
@@ -18,7 +19,8 @@ class Args(NamedTuple):
     file: TextIO
     k: int
     debug: bool
-    outfile: TextIO
+    fmt: str
+    outfile: str
     view: bool
 
 
@@ -42,16 +44,23 @@ def get_args() -> Args:
                         type=int,
                         default=3)
 
+    parser.add_argument('-f',
+                        '--format',
+                        help='Graph format',
+                        metavar='format',
+                        choices=list(WRITERS),
+                        default='dot')
+
     parser.add_argument('-o',
                         '--outfile',
                         help='Output filename',
                         metavar='FILE',
-                        type=argparse.FileType('wt'),
+                        type=str,
                         default='graph.txt')
 
     parser.add_argument('-v',
                         '--view',
-                        help='View outfile',
+                        help='Render and view a small dot outfile',
                         action='store_true')
 
     parser.add_argument('-d', '--debug', help='Debug', action='store_true')
@@ -61,8 +70,12 @@ def get_args() -> Args:
     if args.overlap < 1:
         parser.error(f'-k "{args.overlap}" must be > 0')
 
+    if args.view and args.format != 'dot':
+        parser.error('--view needs --format dot')
+
     return Args(file=args.file,
                 k=args.overlap,
+                fmt=args.format,
                 outfile=args.outfile,
                 view=args.view,
                 debug=args.debug)
@@ -81,25 +94,34 @@ def main() -> None:
 
     logging.debug('input file = "%s"', args.file.name)
 
+    # Reads are numbered, with their IDs stored as the writers expect
+    ids: List[str] = []
     start, end = defaultdict(list), defaultdict(list)
     for rec in SeqIO.parse(args.file, 'fasta'):
         if kmers := find_kmers(str(rec.seq), args.k):
-            start[kmers[0]].append(rec.id)
-            end[kmers[-1]].append(rec.id)
+            start[kmers[0]].append(len(ids))
+            end[kmers[-1]].append(len(ids))
+        ids.append(rec.id)
 
     logging.debug(f'STARTS\n{pformat(start)}')
     logging.debug(f'ENDS\n{pformat(end)}')
 
-    dot = Digraph()
+    edges = []
     for kmer in set(start).intersection(set(end)):
         for s1, s2 in starfilter(op.ne, product(end[kmer], start[kmer])):
-            print(s1, s2)
-            dot.node(s1)
-            dot.node(s2)
-            dot.edge(s1, s2)
-
-    # args.outfile.close()
-    dot.render(args.outfile.name, view=args.view)
+            print(ids[s1], ids[s2])
+            edges.append((s1, s2))
+
+    # Each writer streams, so one chunk of all the edges is fine here
+    names = Names(''.join(ids).encode(),
+                  list(accumulate(len(rec_id.encode()) for rec_id in ids)))
+    sources, targets = np.array(edges, dtype=np.int64).reshape(-1, 2).T
+    num_edges = WRITERS[args.fmt](iter([
+        (sources, targets, np.full(len(sources), args.k))
+    ]), names, False, args.outfile)
+
+    if args.view:
+        render(args.outfile, num_edges, view=True)
 
 
 # --------------------------------------------------
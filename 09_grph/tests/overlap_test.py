@@ -0,0 +1,159 @@
+""" Tests for overlap.py """
+
+import gzip
+import os
+import platform
+import random
+import re
+import string
+from subprocess import getoutput, getstatusoutput
+import numpy as np
+
+PRG = './overlap.py'
+RUN = f'python {PRG}' if platform.system() == 'Windows' else PRG
+SAMPLE1 = './tests/inputs/1.fa'
+
+
+# --------------------------------------------------
+def test_exists() -> None:
+    """ Program exists """
+
+    assert os.path.isfile(PRG)
+
+
+# --------------------------------------------------
+def test_usage() -> None:
+    """ Usage """
+
+    rv, out = getstatusoutput(RUN)
+    assert rv > 0
+    assert out.lower().startswith('usage:')
+
+
+# --------------------------------------------------
+def test_bad_k() -> None:
+    """ Dies on bad k """
+
+    k = random.choice(range(-10, 1))
+    rv, out = getstatusoutput(f'{RUN} -k {k} {SAMPLE1}')
+    assert rv != 0
+    assert re.search(f'-k "{k}" must be > 0', out)
+
+
+# --------------------------------------------------
+def test_bad_file() -> None:
+    """ Dies on bad file """
+
+    bad = ''.join(random.choices(string.ascii_letters, k=10))
+    rv, out = getstatusoutput(f'{RUN} {bad}')
+    assert rv != 0
+    assert re.search(f"No such file or directory: '{bad}'", out)
+
+
+# --------------------------------------------------
+def test_samples() -> None:
+    """ Same edges as grph.py """
+
+    for sample in ['1', '2', '3']:
+        for k in [3, 4, 5]:
+            in_file = f'./tests/inputs/{sample}.fa'
+            with open(f'{in_file}.{k}.out', encoding='utf-8') as fh:
+                expected = fh.read().rstrip()
+
+            rv, out = getstatusoutput(f'{RUN} -k {k} {in_file} 2>/dev/null '
+                                      '| sort')
+            assert rv == 0
+            assert out.rstrip() == expected
+
+
+# --------------------------------------------------
+def test_outfile() -> None:
+    """ Writes edges to a file and stats to STDERR """
+
+    outfile = 'edges.txt'
+    try:
+        if os.path.isfile(outfile):
+            os.remove(outfile)
+
+        out = getoutput(f'{RUN} -o {outfile} {SAMPLE1}')
+        assert re.match(r'Read 5 reads in \S+s, wrote 3 edges in \S+s\.$',
+                        out)
+        with open(outfile, encoding='utf-8') as fh:
+            assert len(fh.read().splitlines()) == 3
+    finally:
+        if os.path.isfile(outfile):
+            os.remove(outfile)
+
+
+# --------------------------------------------------
+def test_maximal() -> None:
+    """ Longest overlap of each pair, with its length """
+
+    out = getoutput(f'{RUN} -m -k 2 {SAMPLE1} 2>/dev/null | sort')
+    assert out.splitlines() == [
+        'Rosalind_0498 Rosalind_0442 3', 'Rosalind_0498 Rosalind_2391 3',
+        'Rosalind_2391 Rosalind_2323 4'
+    ]
+
+
+# --------------------------------------------------
+def test_formats() -> None:
+    """ Writes each format """
+
+    outfile = 'graph.out'
+    try:
+        rv, _ = getstatusoutput(f'{RUN} -f gfa -o {outfile} {SAMPLE1}')
+        assert rv == 0
+        with open(outfile, encoding='utf-8') as fh:
+            lines = fh.read().splitlines()
+        assert lines[0] == 'H\tVN:Z:1.0'
+        assert len([line for line in lines if line[0] == 'S']) == 5
+        assert 'L\tRosalind_2391\t+\tRosalind_2323\t+\t3M' in lines
+
+        rv, _ = getstatusoutput(f'{RUN} -f gz -o {outfile} {SAMPLE1}')
+        assert rv == 0
+        with gzip.open(outfile, 'rt', encoding='utf-8') as fh:
+            assert len(fh.read().splitlines()) == 3
+
+        rv, _ = getstatusoutput(f'{RUN} -m -f dot -o {outfile} {SAMPLE1}')
+        assert rv == 0
+        with open(outfile, encoding='utf-8') as fh:
+            assert '"Rosalind_2391" -> "Rosalind_2323" [label=4]' in fh.read()
+
+        rv, _ = getstatusoutput(f'{RUN} -f npz -o {outfile} {SAMPLE1}')
+        assert rv == 0
+        with np.load(outfile) as npz:
+            assert bytes(npz['format']) == b'csr'
+            assert list(npz['indptr']) == [0, 2, 3, 3, 3, 3]
+            assert list(npz['indices']) == [1, 3, 2]
+            assert list(npz['data']) == [3, 3, 3]
+            assert bytes(npz['ids']).split(b'\n')[2] == b'Rosalind_2323'
+    finally:
+        if os.path.isfile(outfile):
+            os.remove(outfile)
+
+
+# --------------------------------------------------
+def test_render() -> None:
+    """ Renders only small dot files """
+
+    rv, out = getstatusoutput(f'{RUN} -r {SAMPLE1}')
+    assert rv != 0
+    assert re.search('--render needs --format dot', out)
+
+    rv, out = getstatusoutput(f'{RUN} -f dot -r {SAMPLE1}')
+    assert rv != 0
+    assert re.search('--format dot --render needs --outfile', out)
+
+    in_file, outfile = 'same.fa', 'same.dot'
+    try:
+        with open(in_file, 'wt', encoding='utf-8') as fh:
+            fh.write(''.join(f'>r{i}\nAAA\n' for i in range(100)))
+
+        rv, out = getstatusoutput(f'{RUN} -f dot -r -o {outfile} {in_file}')
+        assert rv != 0
+        assert re.search(r'Too many edges \(9,900\) to render', out)
+    finally:
+        for file in [in_file, outfile]:
+            if os.path.isfile(file):
+                os.remove(file)
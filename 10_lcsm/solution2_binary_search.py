@@ -8,11 +8,13 @@ from functools import partial
 from itertools import chain
 from typing import Callable, List, NamedTuple, TextIO
 from Bio import SeqIO
+import fastx
 
 
 class Args(NamedTuple):
     """ Command-line arguments """
     file: TextIO
+    fast_parser: bool
 
 
 # --------------------------------------------------
@@ -28,9 +30,14 @@ def get_args() -> Args:
                         metavar='FILE',
                         type=argparse.FileType('rt'))
 
+    parser.add_argument('-f',
+                        '--fast-parser',
+                        help='Use the block-scanning FASTA reader',
+                        action='store_true')
+
     args = parser.parse_args()
 
-    return Args(args.file)
+    return Args(args.file, args.fast_parser)
 
 
 # --------------------------------------------------
@@ -38,9 +45,10 @@ def main() -> None:
     """ Make a jazz noise here """
 
     args = get_args()
+    parse = fastx.parse if args.fast_parser else SeqIO.parse
 
     # Get a list of the sequences as strings
-    seqs = [str(rec.seq) for rec in SeqIO.parse(args.file, 'fasta')]
+    seqs = [str(rec.seq) for rec in parse(args.file, 'fasta')]
 
     # Find the length of the shortest sequence
     shortest = min(map(len, seqs))
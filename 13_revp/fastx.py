@@ -0,0 +1 @@
+../05_gc/fastx.py
\ No newline at end of file
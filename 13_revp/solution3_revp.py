@@ -5,12 +5,14 @@ import argparse
 import operator
 from typing import List, NamedTuple, TextIO
 from Bio import SeqIO, Seq
+import fastx
 from common import find_kmers
 
 
 class Args(NamedTuple):
     """ Command-line arguments """
     file: TextIO
+    fast_parser: bool
 
 
 # --------------------------------------------------
@@ -26,9 +28,14 @@ def get_args() -> Args:
                         metavar='FILE',
                         type=argparse.FileType('rt'))
 
+    parser.add_argument('-f',
+                        '--fast-parser',
+                        help='Use the block-scanning FASTA reader',
+                        action='store_true')
+
     args = parser.parse_args()
 
-    return Args(args.file)
+    return Args(args.file, args.fast_parser)
 
 
 # --------------------------------------------------
@@ -36,7 +43,8 @@ def main() -> None:
     """ Make a jazz noise here """
 
     args = get_args()
-    for rec in SeqIO.parse(args.file, 'fasta'):
+    parse = fastx.parse if args.fast_parser else SeqIO.parse
+    for rec in parse(args.file, 'fasta'):
         for k in range(4, 13):
             for pos in revp(str(rec.seq), k):
                 print(pos, k)
@@ -4,11 +4,13 @@
 import argparse
 from typing import List, NamedTuple, TextIO
 from Bio import Seq, SeqIO
+import fastx
 
 
 class Args(NamedTuple):
     """ Command-line arguments """
     file: TextIO
+    fast_parser: bool
 
 
 # --------------------------------------------------
@@ -24,9 +26,14 @@ def get_args() -> Args:
                         metavar='FILE',
                         type=argparse.FileType('rt'))
 
+    parser.add_argument('-f',
+                        '--fast-parser',
+                        help='Use the block-scanning FASTA reader',
+                        action='store_true')
+
     args = parser.parse_args()
 
-    return Args(args.file)
+    return Args(args.file, args.fast_parser)
 
 
 # --------------------------------------------------
@@ -34,7 +41,8 @@ def main() -> None:
     """ Make a jazz noise here """
 
     args = get_args()
-    for rec in SeqIO.parse(args.file, 'fasta'):
+    parse = fastx.parse if args.fast_parser else SeqIO.parse
+    for rec in parse(args.file, 'fasta'):
         rna = str(rec.seq).replace('T', 'U')
         orfs = set()
 
@@ -6,12 +6,14 @@ from typing import List, NamedTuple, TextIO
 import numpy as np
 from tabulate import tabulate
 from Bio import SeqIO
+import fastx
 
 
 class Args(NamedTuple):
     """ Command-line arguments """
     files: List[TextIO]
     tablefmt: str
+    fast_parser: bool
 
 
 class FastaInfo(NamedTuple):
@@ -48,9 +50,14 @@ def get_args() -> Args:
                         default='plain',
                         help='Tabulate table style')
 
+    parser.add_argument('-f',
+                        '--fast-parser',
+                        help='Use the block-scanning FASTA reader',
+                        action='store_true')
+
     args = parser.parse_args()
 
-    return Args(args.file, args.tablefmt)
+    return Args(args.file, args.tablefmt, args.fast_parser)
 
 
 # --------------------------------------------------
@@ -58,16 +65,17 @@ def main() -> None:
     """ Make a jazz noise here """
 
     args = get_args()
-    data = [process(fh) for fh in args.files]
+    data = [process(fh, args.fast_parser) for fh in args.files]
     hdr = ['name', 'min_len', 'max_len', 'avg_len', 'num_seqs']
     print(tabulate(data, tablefmt=args.tablefmt, headers=hdr, floatfmt='.2f'))
 
 
 # --------------------------------------------------
-def process(fh: TextIO) -> FastaInfo:
+def process(fh: TextIO, fast_parser: bool = False) -> FastaInfo:
     """ Process a file """
 
-    if lengths := [len(rec.seq) for rec in SeqIO.parse(fh, 'fasta')]:
+    parse = fastx.parse if fast_parser else SeqIO.parse
+    if lengths := [len(rec.seq) for rec in parse(fh, 'fasta')]:
         return FastaInfo(filename=fh.name,
                          min_len=min(lengths),
                          max_len=max(lengths),
@@ -6,7 +6,8 @@ import os
 import re
 import sys
 from Bio import SeqIO
-from typing import List, NamedTuple, TextIO
+from typing import Any, Callable, List, NamedTuple, TextIO
+import fastx
 
 
 class Args(NamedTuple):
@@ -17,6 +18,7 @@ class Args(NamedTuple):
     output_format: str
     outfile: TextIO
     insensitive: bool
+    fast_parser: bool
 
 
 # --------------------------------------------------
@@ -64,6 +66,10 @@ def get_args() -> Args:
                         help='Case-insensitive search',
                         action='store_true')
 
+    parser.add_argument('--fast-parser',
+                        help='Use the block-scanning FASTA/FASTQ reader',
+                        action='store_true')
+
     args = parser.parse_args()
 
     return Args(pattern=args.pattern,
@@ -71,7 +77,8 @@ def get_args() -> Args:
                 input_format=args.format,
                 output_format=args.outfmt,
                 outfile=args.outfile,
-                insensitive=args.insensitive)
+                insensitive=args.insensitive,
+                fast_parser=args.fast_parser)
 
 
 # --------------------------------------------------
@@ -80,6 +87,9 @@ def main() -> None:
 
     args = get_args()
     regex = re.compile(args.pattern, re.IGNORECASE if args.insensitive else 0)
+    parse = fastx.parse if args.fast_parser else SeqIO.parse
+    write: Callable[..., Any] = fastx.write if args.fast_parser \
+        else SeqIO.write
 
     for fh in args.files:
         input_format = args.input_format or guess_format(fh.name)
@@ -89,9 +99,9 @@ def main() -> None:
 
         output_format = args.output_format or input_format
 
-        for rec in SeqIO.parse(fh, input_format):
+        for rec in parse(fh, input_format):
             if any(map(regex.search, [rec.id, rec.description])):
-                SeqIO.write(rec, args.outfile, output_format)
+                write(rec, args.outfile, output_format)
 
 
 # --------------------------------------------------
@@ -8,6 +8,7 @@ from itertools import count
 from Bio import SeqIO
 from collections import defaultdict, Counter
 from typing import NamedTuple, List, TextIO, Dict, Optional
+import fastx
 
 
 class Args(NamedTuple):
@@ -20,6 +21,7 @@ class Args(NamedTuple):
     max_len: int
     k: int
     seed: Optional[int]
+    fast_parser: bool
 
 
 WeightedChoice = Dict[str, float]
@@ -90,6 +92,10 @@ def get_args() -> Args:
                         type=int,
                         default=None)
 
+    parser.add_argument('--fast-parser',
+                        help='Use the block-scanning FASTA/FASTQ reader',
+                        action='store_true')
+
     args = parser.parse_args()
 
     return Args(files=args.file,
@@ -99,7 +105,8 @@ def get_args() -> Args:
                 min_len=args.min_len,
                 max_len=args.max_len,
                 k=args.kmer,
-                seed=args.seed)
+                seed=args.seed,
+                fast_parser=args.fast_parser)
 
 
 # --------------------------------------------------
@@ -108,7 +115,8 @@ def main() -> None:
 
     args = get_args()
     random.seed(args.seed)
-    if chain := read_training(args.files, args.file_format, args.k):
+    if chain := read_training(args.files, args.file_format, args.k,
+                              args.fast_parser):
         seqs = (gen_seq(chain, args.k, args.min_len, args.max_len)
                 for _ in count())
 
@@ -123,12 +131,16 @@ def main() -> None:
 
 
 # --------------------------------------------------
-def read_training(fhs: List[TextIO], file_format: str, k: int) -> Chain:
+def read_training(fhs: List[TextIO],
+                  file_format: str,
+                  k: int,
+                  fast_parser: bool = False) -> Chain:
     """ Read training files, return dict of chains """
 
+    parse = fastx.parse if fast_parser else SeqIO.parse
     counts: Dict[str, Dict[str, int]] = defaultdict(Counter)
     for fh in fhs:
-        for rec in SeqIO.parse(fh, file_format):
+        for rec in parse(fh, file_format):
             for kmer in find_kmers(str(rec.seq), k):
                 counts[kmer[:k - 1]][kmer[-1]] += 1
 
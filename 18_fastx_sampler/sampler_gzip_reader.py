@@ -6,7 +6,8 @@ import os
 import random
 import gzip
 from Bio import SeqIO
-from typing import List, NamedTuple, Optional
+from typing import Any, Callable, List, NamedTuple, Optional
+import fastx
 
 
 class Args(NamedTuple):
@@ -17,6 +18,7 @@ class Args(NamedTuple):
     max_reads: int
     seed: Optional[int]
     outdir: str
+    fast_parser: bool
 
 
 # --------------------------------------------------
@@ -69,6 +71,10 @@ def get_args() -> Args:
                         type=str,
                         default='out')
 
+    parser.add_argument('--fast-parser',
+                        help='Use the block-scanning FASTA/FASTQ reader',
+                        action='store_true')
+
     args = parser.parse_args()
 
     if not 0 < args.percent < 1:
@@ -85,7 +91,8 @@ def get_args() -> Args:
                 percent=args.percent,
                 max_reads=args.max,
                 seed=args.seed,
-                outdir=args.outdir)
+                outdir=args.outdir,
+                fast_parser=args.fast_parser)
 
 
 # --------------------------------------------------
@@ -94,6 +101,9 @@ def main() -> None:
 
     args = get_args()
     random.seed(args.seed)
+    parse = fastx.parse if args.fast_parser else SeqIO.parse
+    write: Callable[..., Any] = fastx.write if args.fast_parser \
+        else SeqIO.write
 
     total_num = 0
     for i, file in enumerate(args.files, start=1):
@@ -106,10 +116,10 @@ def main() -> None:
         out_fh = open(out_file, 'wt')
         num_taken = 0
 
-        for rec in SeqIO.parse(fh, args.file_format):
+        for rec in parse(fh, args.file_format):
             if random.random() <= args.percent:
                 num_taken += 1
-                SeqIO.write(rec, out_fh, 'fasta')
+                write(rec, out_fh, 'fasta')
 
             if args.max_reads and num_taken == args.max_reads:
                 break